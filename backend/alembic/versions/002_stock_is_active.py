@@ -0,0 +1,30 @@
+"""Add stocks.is_active for exchange universe sync
+
+Revision ID: 002_stock_is_active
+Revises: 001_initial
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_stock_is_active'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stocks no longer on the exchange symbol list are kept (history, trades)
+    # but marked inactive
+    op.add_column('stocks', sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False))
+    op.create_index(op.f('ix_stocks_is_active'), 'stocks', ['is_active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stocks_is_active'), table_name='stocks')
+    op.drop_column('stocks', 'is_active')
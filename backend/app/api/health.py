@@ -4,7 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from datetime import datetime, timezone
 
+from app.core.circuit_breaker import circuit_breaker_snapshot
 from app.core.database import get_db
+from app.core.http_pool import get_http_pool
 
 router = APIRouter()
 
@@ -19,6 +21,9 @@ async def health_check(db: AsyncSession = Depends(get_db)):
             - status: "healthy" if all systems operational
             - timestamp: ISO-8601 formatted current time
             - services: Status of each service (database, cache)
+            - http_pool: Shared HTTP connection pool utilisation
+            - circuit_breakers: Per-provider breaker state (closed, open,
+              half_open) when failover breakers are enabled
 
     Example Response:
         {
@@ -27,6 +32,22 @@ async def health_check(db: AsyncSession = Depends(get_db)):
             "services": {
                 "database": "connected",
                 "cache": "not_configured"
+            },
+            "http_pool": {
+                "requests": 1520,
+                "errors": 2,
+                "in_flight": 3,
+                "peak_in_flight": 10,
+                "open_connections": 8,
+                ...
+            },
+            "circuit_breakers": {
+                "eodhd": {
+                    "state": "open",
+                    "consecutive_failures": 3,
+                    "retry_in_seconds": 241.5,
+                    ...
+                }
             }
         }
     """
@@ -46,5 +67,7 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         "services": {
             "database": db_status,
             "cache": "not_configured"  # Redis will be configured in Epic 6
-        }
+        },
+        "http_pool": get_http_pool().stats(),
+        "circuit_breakers": circuit_breaker_snapshot()
     }
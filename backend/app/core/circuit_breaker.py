@@ -0,0 +1,248 @@
+"""
+Per-provider circuit breakers.
+
+A provider that keeps failing is skipped for a cool-down period instead of
+being retried on every run. After the cool-down a single probe request is
+let through: success closes the breaker, failure re-opens it. Breakers are
+process-wide (one per provider name) so their state can be reported by the
+health endpoint.
+"""
+
+import structlog
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from .import_roots import share_across_import_roots
+
+
+logger = structlog.get_logger(__name__)
+
+# One breaker registry for the API (app.core) and failover (backend.app.core)
+share_across_import_roots(__name__)
+
+
+class BreakerState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"  # Requests flow, failures are counted
+    OPEN = "open"  # Requests are rejected until the cool-down ends
+    HALF_OPEN = "half_open"  # One probe request decides open or closed
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Circuit breaker settings (the failover.circuit_breaker section of
+    data_sources.yaml).
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the breaker
+        cool_down_seconds: Seconds an open breaker rejects requests before
+                           allowing a probe
+    """
+    failure_threshold: int = 3
+    cool_down_seconds: float = 300.0
+
+    @classmethod
+    def from_config(cls, breaker_config: Optional[Dict[str, Any]]) -> "CircuitBreakerConfig":
+        """
+        Build settings from a configuration dictionary (unknown keys ignored).
+
+        Args:
+            breaker_config: circuit_breaker configuration section (may be None)
+
+        Returns:
+            CircuitBreakerConfig with defaults for missing keys
+        """
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in (breaker_config or {}).items() if key in known})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected by an open circuit breaker."""
+
+    def __init__(self, name: str, retry_in_seconds: float):
+        super().__init__(f"Circuit breaker '{name}' is open (retry in {retry_in_seconds:.0f}s)")
+        self.name = name
+        self.retry_in_seconds = retry_in_seconds
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one provider.
+
+    Example:
+        >>> breaker = get_circuit_breaker("eodhd", CircuitBreakerConfig(failure_threshold=3))
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         signals = await provider.fetch()
+        ...     except Exception:
+        ...         breaker.record_failure()
+        ...         raise
+        ...     breaker.record_success()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Provider name (for logging and health reporting)
+            config: Breaker settings (default: CircuitBreakerConfig())
+            clock: Monotonic time source in seconds (injectable for tests)
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._opened_at_wall: Optional[datetime] = None
+        self._probe_in_flight = False
+
+        # Metrics
+        self._successes = 0
+        self._failures = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state (an open breaker past its cool-down is half-open)."""
+        if self._state is BreakerState.OPEN and self._retry_in() <= 0:
+            self._state = BreakerState.HALF_OPEN
+            logger.info("circuit_breaker_half_open", breaker=self.name)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be made, claiming the probe if half-open.
+
+        Returns:
+            True if the request may proceed (the caller must then call
+            record_success, record_failure or release), False if rejected
+        """
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return True
+        if state is BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            logger.info("circuit_breaker_probe", breaker=self.name)
+            return True
+
+        self._rejected += 1
+        return False
+
+    def check(self) -> None:
+        """
+        Like allow_request, but raise when rejected.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the request
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self._retry_in())
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        self._successes += 1
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        if self._state is not BreakerState.CLOSED:
+            logger.info("circuit_breaker_closed", breaker=self.name)
+        self._state = BreakerState.CLOSED
+        self._opened_at = None
+        self._opened_at_wall = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker at the threshold."""
+        self._failures += 1
+        self._consecutive_failures += 1
+        was_probe = self._probe_in_flight
+        self._probe_in_flight = False
+
+        if was_probe or self._consecutive_failures >= self.config.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give up a claimed request without an outcome (e.g., cancelled)."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get breaker state for health reporting.
+
+        Returns:
+            Dictionary with state, failure counts, settings and, when open,
+            when it opened and seconds until the next probe
+        """
+        state = self.state
+        return {
+            "state": state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.config.failure_threshold,
+            "cool_down_seconds": self.config.cool_down_seconds,
+            "opened_at": self._opened_at_wall.isoformat() if self._opened_at_wall else None,
+            "retry_in_seconds": round(self._retry_in(), 1) if state is BreakerState.OPEN else 0.0,
+            "successes": self._successes,
+            "failures": self._failures,
+            "rejected": self._rejected
+        }
+
+    def _open(self) -> None:
+        """Open (or re-open) the breaker for a full cool-down."""
+        self._state = BreakerState.OPEN
+        self._opened_at = self._clock()
+        self._opened_at_wall = datetime.now(timezone.utc)
+        logger.warning(
+            "circuit_breaker_opened",
+            breaker=self.name,
+            consecutive_failures=self._consecutive_failures,
+            cool_down_seconds=self.config.cool_down_seconds
+        )
+
+    def _retry_in(self) -> float:
+        """Seconds until an open breaker allows a probe."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.config.cool_down_seconds - self._clock())
+
+
+# Process-wide breakers, keyed by provider name
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(
+    name: str,
+    config: Optional[CircuitBreakerConfig] = None
+) -> CircuitBreaker:
+    """
+    Get the shared breaker for a provider (singleton per name).
+
+    Args:
+        name: Provider name (e.g., "eodhd")
+        config: Settings used when the breaker is first created
+
+    Returns:
+        CircuitBreaker instance
+    """
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name, config)
+    return _breakers[name]
+
+
+def circuit_breaker_snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the state of every process-wide breaker (for the health endpoint).
+
+    Returns:
+        Dictionary mapping provider name to breaker snapshot
+    """
+    return {name: breaker.snapshot() for name, breaker in sorted(_breakers.items())}
@@ -60,6 +60,10 @@ class Settings(BaseSettings):
         default_factory=lambda: Path(__file__).parent.parent.parent.parent,
         description="Project root directory"
     )
+    data_dir: Path = Field(
+        default_factory=lambda: Path(__file__).parent.parent.parent.parent / "data",
+        description="Local data directory (price history, caches, quota state)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -78,6 +82,7 @@ class DataSourcesConfig:
     - Priority ordering
     - API key substitution from environment variables
     - Failover settings
+    - Shared HTTP connection pool settings
     """
 
     def __init__(self, config_path: Optional[Path] = None):
@@ -97,6 +102,7 @@ class DataSourcesConfig:
         self._raw_config: Dict[str, Any] = {}
         self.providers: Dict[str, Dict[str, Any]] = {}
         self.failover: Dict[str, Any] = {}
+        self.http_pool: Dict[str, Any] = {}
         self.primary_provider: Optional[str] = None
         self.priority_order: list[str] = []
 
@@ -125,6 +131,9 @@ class DataSourcesConfig:
         # Load failover configuration
         self.failover = self._raw_config.get("failover", {})
 
+        # Load shared HTTP pool configuration
+        self.http_pool = self._raw_config.get("http_pool", {})
+
         # Build priority order (sorted by priority field)
         self._build_priority_order()
 
@@ -267,3 +276,21 @@ def get_data_sources_config() -> DataSourcesConfig:
         _data_sources_config = DataSourcesConfig()
 
     return _data_sources_config
+
+
+def resolve_data_path(path: str) -> str:
+    """
+    Resolve a local store path from configuration.
+
+    Relative paths are resolved against the data directory
+    (settings.data_dir). Absolute paths and ":memory:" are returned unchanged.
+
+    Args:
+        path: Path from configuration (e.g., "price_history.sqlite3")
+
+    Returns:
+        Resolved path as a string
+    """
+    if path == ":memory:" or Path(path).is_absolute():
+        return path
+    return str(settings.data_dir / path)
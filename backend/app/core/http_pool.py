@@ -0,0 +1,304 @@
+"""
+Shared HTTP connection pool for data providers.
+
+One pooled httpx.AsyncClient is owned by the application lifespan and
+borrowed by every provider, so concurrent fan-out reuses warm keep-alive
+connections instead of paying connection setup and TLS handshakes per
+provider instance. Per-host in-flight limits and utilisation metrics are
+layered on top of httpx's global connection limits.
+"""
+
+import asyncio
+import structlog
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Set
+
+import httpx
+
+from .import_roots import share_across_import_roots
+
+
+logger = structlog.get_logger(__name__)
+
+# One shared pool for the API (app.core) and the providers (backend.app.core)
+share_across_import_roots(__name__)
+
+
+@dataclass(frozen=True)
+class HTTPPoolConfig:
+    """
+    Connection pool settings (the http_pool section of data_sources.yaml).
+
+    Attributes:
+        max_connections: Total open connections across all hosts
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        max_connections_per_host: In-flight requests allowed per host
+        timeout: Request timeout in seconds
+        http2: Negotiate HTTP/2 where the server supports it
+               (requires the h2 package; falls back to HTTP/1.1)
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    max_connections_per_host: int = 10
+    timeout: float = 30.0
+    http2: bool = False
+
+    @classmethod
+    def from_config(cls, pool_config: Optional[Dict[str, Any]]) -> "HTTPPoolConfig":
+        """
+        Build settings from a configuration dictionary (unknown keys ignored).
+
+        Args:
+            pool_config: http_pool configuration section (may be None)
+
+        Returns:
+            HTTPPoolConfig with defaults for missing keys
+        """
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in (pool_config or {}).items() if key in known})
+
+
+class HTTPPool:
+    """
+    Pooled async HTTP client with per-host limits and metrics.
+
+    The underlying client is created lazily and re-created if used from a
+    different event loop (connections cannot be shared across loops).
+
+    Example:
+        >>> pool = HTTPPool(HTTPPoolConfig(max_connections_per_host=8, http2=True))
+        >>> response = await pool.get(url, params=params)
+        >>> pool.stats()["in_flight"]
+        0
+        >>> await pool.aclose()
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        """
+        Initialize pool (no connections are opened until the first request).
+
+        Args:
+            config: Pool settings (default: HTTPPoolConfig())
+        """
+        self.config = config or HTTPPoolConfig()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+        # Metrics
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._host_in_flight: Dict[str, int] = {}
+        self._host_requests: Dict[str, int] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled client for the running event loop."""
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._client is None or self._client.is_closed or (loop is not None and loop is not self._loop):
+            if self._client is not None and not self._client.is_closed:
+                self._retire_client(self._client, self._loop)
+            self._client = self._create_client()
+            self._loop = loop
+            self._host_semaphores = {}
+        return self._client
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a GET request through the pool.
+
+        Waits for a free per-host slot, so a single slow host cannot use up
+        the whole connection pool.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed to httpx.AsyncClient.get (params, headers, ...)
+
+        Returns:
+            httpx.Response
+        """
+        client = self.client
+        host = httpx.URL(url).host
+
+        async with self._get_host_semaphore(host):
+            self._requests += 1
+            self._host_requests[host] = self._host_requests.get(host, 0) + 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._host_in_flight[host] = self._host_in_flight.get(host, 0) + 1
+            try:
+                return await client.get(url, **kwargs)
+            except Exception:
+                self._errors += 1
+                raise
+            finally:
+                self._in_flight -= 1
+                self._host_in_flight[host] -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilisation metrics.
+
+        Returns:
+            Dictionary with request/error counts, in-flight requests (total,
+            peak and per host), open connections and pool limits
+        """
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "hosts": {
+                host: {"requests": count, "in_flight": self._host_in_flight.get(host, 0)}
+                for host, count in self._host_requests.items()
+            },
+            "open_connections": self._open_connections(),
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "max_connections_per_host": self.config.max_connections_per_host,
+            "http2": self.config.http2 and _http2_available(),
+            "closed": self._client is None or self._client.is_closed
+        }
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("http_pool_closed", requests=self._requests, errors=self._errors)
+        self._client = None
+        self._loop = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled client from config."""
+        http2 = self.config.http2
+        if http2 and not _http2_available():
+            logger.warning("http_pool_http2_unavailable", message="h2 not installed, using HTTP/1.1")
+            http2 = False
+
+        logger.info(
+            "http_pool_opened",
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            http2=http2
+        )
+        return httpx.AsyncClient(
+            timeout=self.config.timeout,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            ),
+            http2=http2,
+            follow_redirects=True
+        )
+
+    def _retire_client(
+        self,
+        client: httpx.AsyncClient,
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Close a client replaced by one for a new event loop.
+
+        The close runs on the client's own loop if that loop is still running
+        (in another thread), otherwise on the current loop. Without a running
+        loop the client is left for garbage collection.
+        """
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_client(client), loop)
+            return
+
+        try:
+            task = asyncio.get_running_loop().create_task(self._close_client(client))
+        except RuntimeError:
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        """Close a retired client, logging (not raising) close errors."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("http_pool_close_failed", error=str(e))
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get (or create) the in-flight request semaphore for a host."""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _open_connections(self) -> int:
+        """Count open connections in the transport pool (0 if unknown)."""
+        if self._client is None or self._client.is_closed:
+            return 0
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        return len(getattr(pool, "connections", []))
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Global pool instance (owned by the application lifespan)
+_http_pool: Optional[HTTPPool] = None
+
+
+def get_http_pool() -> HTTPPool:
+    """
+    Get the shared HTTP pool (singleton pattern).
+
+    Created with default settings if the application has not opened one
+    (e.g., in scripts and tests).
+
+    Returns:
+        HTTPPool instance
+    """
+    global _http_pool
+
+    if _http_pool is None:
+        _http_pool = HTTPPool()
+
+    return _http_pool
+
+
+def open_http_pool(config: Optional[HTTPPoolConfig] = None) -> HTTPPool:
+    """
+    Open the shared HTTP pool with the given settings (application startup).
+
+    Args:
+        config: Pool settings
+
+    Returns:
+        HTTPPool instance
+    """
+    global _http_pool
+
+    _http_pool = HTTPPool(config)
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Close the shared HTTP pool (application shutdown)."""
+    global _http_pool
+
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        _http_pool = None
@@ -0,0 +1,44 @@
+"""
+One module per process for shared infrastructure, whichever import root is used.
+
+The API runs with backend/ on sys.path and imports ``app.core.<module>``,
+while the data providers are imported from the repository root as
+``backend.app.core.<module>``. Python would load such a module once per root,
+each copy with its own globals, so modules holding process-wide state (the
+HTTP pool, circuit breakers) register themselves under both names.
+"""
+
+import importlib
+import os
+import sys
+
+
+def share_across_import_roots(module_name: str) -> None:
+    """
+    Register a module under both the ``app.`` and ``backend.app.`` names.
+
+    Call at import time from the module itself. A root whose package is not
+    importable (e.g., no ``backend`` package in the API container) or points
+    at a different directory is skipped.
+
+    Args:
+        module_name: The module's ``__name__``
+    """
+    module = sys.modules[module_name]
+    module_dir = os.path.dirname(os.path.abspath(module.__file__))
+    base_name = module_name.removeprefix("backend.")
+
+    for alias in (base_name, f"backend.{base_name}"):
+        if alias in sys.modules:
+            continue
+
+        parent_name, _, child_name = alias.rpartition(".")
+        try:
+            parent = importlib.import_module(parent_name)
+        except ImportError:
+            continue
+        if module_dir not in (os.path.abspath(path) for path in getattr(parent, "__path__", [])):
+            continue
+
+        sys.modules[alias] = module
+        setattr(parent, child_name, module)
@@ -2,21 +2,44 @@
 Failover and retry logic for data sources.
 
 This module implements automatic failover between data providers with
-retry logic, exponential backoff, and graceful degradation strategies.
+retry logic, jittered backoff, and graceful degradation strategies.
 """
 
 import asyncio
 import structlog
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Set, Tuple
 from enum import Enum
 
+from backend.app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
 from backend.app.data_sources.base import DataSource, Signal
+from backend.app.data_sources.hedging import HedgePolicy, Hedger
+from backend.app.data_sources.response_cache import ResponseCache
+from backend.app.data_sources.retry import RetryEngine, RetryPolicy
 
 
 logger = structlog.get_logger(__name__)
 
 
+# Data type each provider signal type covers (providers name the same data
+# differently, e.g. EODHD PRICE_DATA vs Yahoo/Alpha Vantage PRICE_UPDATE).
+# Unlisted signal types are their own data type.
+SIGNAL_DATA_TYPES: Dict[str, str] = {
+    "PRICE_DATA": "prices",
+    "PRICE_UPDATE": "prices",
+    "FUNDAMENTAL_DATA": "fundamentals",
+    "COMPANY_PROFILE": "profile",
+    "ANALYST_ESTIMATES": "estimates",
+}
+
+
 class FailoverReason(Enum):
     """Reasons for failover to next provider."""
     RATE_LIMIT = "rate_limit"
@@ -24,6 +47,22 @@ class FailoverReason(Enum):
     TIMEOUT = "timeout"
     NETWORK_ERROR = "network_error"
     MAX_RETRIES_EXCEEDED = "max_retries_exceeded"
+    MISSING_DATA = "missing_data"
+
+
+@dataclass
+class MergedFetchResult:
+    """
+    Outcome of a gap-filling fetch.
+
+    Attributes:
+        signals: Merged signals (each keeps its provider in Signal.source)
+        provenance: ticker -> data type -> provider that supplied it
+        missing: Tickers still missing data after every provider
+    """
+    signals: List[Signal] = field(default_factory=list)
+    provenance: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
 
 
 class DataSourceFailover:
@@ -32,8 +71,15 @@ class DataSourceFailover:
 
     This class implements:
     - Priority-based provider ordering
-    - Automatic retry with exponential backoff
+    - Automatic retry with jittered backoff, Retry-After hints and a
+      process-wide retry budget
     - Failover to backup providers
+    - Optional per-provider circuit breakers: a provider that keeps
+      failing is skipped until a cool-down ends, then probed once
+    - Optional hedging: a primary slower than its observed p95 races the
+      next provider, within a hedge budget
+    - Optional per-ticker gap filling: backups are asked only for the
+      tickers and data types still missing, and results are merged
     - Cached data fallback
     - Staleness tracking
     - Failover event logging
@@ -58,7 +104,15 @@ class DataSourceFailover:
         max_retries: int = 3,
         retry_delays: Optional[List[int]] = None,
         cache_ttl_hours: int = 24,
-        system_logs_table: Optional[Any] = None
+        system_logs_table: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_engine: Optional[RetryEngine] = None,
+        merge_mode: bool = False,
+        required_data_types: Optional[Iterable[str]] = None,
+        provider_data_types: Optional[Dict[str, Iterable[str]]] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        circuit_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        hedging: Optional[HedgePolicy] = None
     ):
         """
         Initialize failover manager.
@@ -67,9 +121,33 @@ class DataSourceFailover:
             providers: Dictionary mapping provider names to DataSource instances
             priority_order: Ordered list of provider names (first = primary)
             max_retries: Maximum retry attempts for rate limit errors (default: 3)
-            retry_delays: Delays in seconds between retries (default: [60, 120, 180])
+            retry_delays: Backoff bounds in seconds: the first value is the
+                          minimum delay and the largest the maximum
+                          (default: [60, 120, 180])
             cache_ttl_hours: Maximum age of cached data in hours (default: 24)
             system_logs_table: Optional SQLAlchemy table for logging failover events
+            cache: Response cache for last-known-good signals. If None, an
+                   in-memory cache expiring after cache_ttl_hours is used
+            retry_engine: Retry engine for the primary provider. If None,
+                          built from max_retries and retry_delays
+            merge_mode: Fill per-ticker gaps from backup providers instead
+                        of accepting the first non-empty result (default:
+                        False). See fetch_with_gap_fill
+            required_data_types: Data types (see SIGNAL_DATA_TYPES) a ticker
+                        needs to be complete in merge mode (default: None,
+                        any signal completes it)
+            provider_data_types: Provider name -> data types it can supply;
+                        a provider is only asked for tickers missing one of
+                        them (default: every provider may supply anything)
+            circuit_breaker: Breaker settings; enables the process-wide
+                        breaker of each provider (see get_circuit_breaker),
+                        whose state the health endpoint reports (default:
+                        None, no breakers)
+            circuit_breakers: Provider name -> breaker to use instead of the
+                        process-wide ones
+            hedging: Hedging settings; enables hedged requests from the
+                        primary to the next provider (default: None, no
+                        hedging). See _fetch_hedged
         """
         self.providers = providers
         self.priority_order = priority_order
@@ -77,15 +155,47 @@ class DataSourceFailover:
         self.retry_delays = retry_delays or [60, 120, 180]
         self.cache_ttl_hours = cache_ttl_hours
         self.system_logs_table = system_logs_table
+        self.merge_mode = merge_mode
+        self.required_data_types: Optional[Set[str]] = (
+            set(required_data_types) if required_data_types is not None else None
+        )
+        self.provider_data_types: Dict[str, Set[str]] = {
+            name: set(data_types) for name, data_types in (provider_data_types or {}).items()
+        }
 
         # Validate priority order
         for provider_name in priority_order:
             if provider_name not in providers:
                 raise ValueError(f"Provider '{provider_name}' in priority_order not found in providers dict")
 
-        # Cache for signals (in-memory for now, can be moved to Redis)
-        self._cache: Dict[str, List[Signal]] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+        # Per-provider circuit breakers (optional)
+        self._breakers: Dict[str, CircuitBreaker] = dict(circuit_breakers or {})
+        if circuit_breaker is not None:
+            for provider_name in priority_order:
+                self._breakers.setdefault(
+                    provider_name,
+                    get_circuit_breaker(provider_name, circuit_breaker)
+                )
+
+        # Hedged requests to the first backup (optional)
+        self._hedger: Optional[Hedger] = Hedger(hedging) if hedging is not None else None
+
+        # Primary provider retries (jittered, budgeted)
+        self._retry = retry_engine or RetryEngine(
+            "failover",
+            RetryPolicy(
+                max_attempts=max_retries,
+                base_delay=self.retry_delays[0],
+                max_delay=max(self.retry_delays),
+                max_retry_after=max(self.retry_delays)
+            )
+        )
+
+        # Last-known-good signals (pass a disk-backed cache to survive restarts)
+        self._cache = cache or ResponseCache(
+            "failover",
+            default_ttl_seconds=cache_ttl_hours * 3600
+        )
 
     async def fetch_with_failover(
         self,
@@ -96,12 +206,15 @@ class DataSourceFailover:
         Fetch data with automatic failover through provider chain.
 
         Strategy:
-        1. Try primary provider with retries (for rate limits)
+        1. Try primary provider with retries (for rate limits); with
+           hedging, race the first backup once the primary is slow
         2. If 5xx error, skip retries and failover immediately
         3. Try each backup provider in order
         4. If all fail and cache enabled, use cached data (flag staleness)
         5. If no cache, return empty list and log critical error
 
+        In merge mode (with tickers), delegates to fetch_with_gap_fill.
+
         Args:
             tickers: List of tickers to fetch (passed to providers)
             use_cache_on_failure: Whether to use cached data if all providers fail
@@ -110,12 +223,18 @@ class DataSourceFailover:
             List of Signal objects from successful provider or cache.
             Empty list if all providers and cache fail.
         """
+        if self.merge_mode and tickers:
+            result = await self.fetch_with_gap_fill(tickers, use_cache_on_failure)
+            return result.signals
+
         cache_key = self._get_cache_key(tickers)
         last_error: Optional[Exception] = None
         attempted_providers: List[str] = []
+        hedge = self._hedger is not None and len(self.priority_order) > 1
 
         for provider_name in self.priority_order:
-            provider = self.providers[provider_name]
+            if provider_name in attempted_providers:
+                continue  # Already raced as the primary's hedge
             attempted_providers.append(provider_name)
 
             logger.info(
@@ -126,23 +245,17 @@ class DataSourceFailover:
             )
 
             try:
-                # Determine retry strategy based on provider position
+                # Primary provider retries rate limits; backups get one attempt
                 is_primary = (provider_name == self.priority_order[0])
-
-                if is_primary:
-                    # Primary provider: use retries for rate limits
-                    signals = await self._fetch_with_retry(
-                        provider,
-                        provider_name,
-                        tickers
+                reason = FailoverReason.SERVER_ERROR
+                if is_primary and hedge:
+                    provider_name, signals, hedged = await self._fetch_hedged(
+                        tickers, attempted_providers
                     )
+                    if hedged:
+                        reason = FailoverReason.TIMEOUT
                 else:
-                    # Backup providers: single attempt
-                    signals = await self._fetch_single_attempt(
-                        provider,
-                        provider_name,
-                        tickers
-                    )
+                    signals = await self._fetch_guarded(provider_name, tickers, is_primary)
 
                 # Success! Cache and return
                 if signals:
@@ -156,11 +269,11 @@ class DataSourceFailover:
                     )
 
                     # Log failover event if not using primary
-                    if not is_primary:
+                    if provider_name != self.priority_order[0]:
                         await self._log_failover_event(
                             from_provider=self.priority_order[0],
                             to_provider=provider_name,
-                            reason=FailoverReason.SERVER_ERROR,
+                            reason=reason,
                             tickers=tickers
                         )
 
@@ -173,6 +286,14 @@ class DataSourceFailover:
                     message="Provider returned no signals"
                 )
 
+            except CircuitOpenError as e:
+                last_error = e
+                logger.info(
+                    "failover_circuit_open",
+                    provider=provider_name,
+                    retry_in_seconds=e.retry_in_seconds
+                )
+
             except Exception as e:
                 last_error = e
                 logger.error(
@@ -183,11 +304,178 @@ class DataSourceFailover:
                 )
                 # Continue to next provider
 
-        # All providers failed - try cache
+        return await self._fall_back_to_cache(
+            cache_key, tickers, attempted_providers, last_error, use_cache_on_failure
+        )
+
+    async def fetch_with_gap_fill(
+        self,
+        tickers: List[str],
+        use_cache_on_failure: bool = True
+    ) -> MergedFetchResult:
+        """
+        Fetch tickers through the provider chain, filling per-ticker gaps.
+
+        Each provider in priority_order is asked only for the tickers still
+        missing a required data type it can supply. Its signals are merged
+        for (ticker, data type) pairs no earlier provider covered, so
+        backups never refetch data already obtained. The primary keeps its
+        retries; backups get a single attempt. A failing provider leaves its
+        tickers for the next one.
+
+        Args:
+            tickers: Tickers to fetch
+            use_cache_on_failure: Whether to use cached data if no provider
+                                  returned anything
+
+        Returns:
+            MergedFetchResult with merged signals, per-ticker provenance
+            and the tickers still missing data
+        """
+        wanted = list(dict.fromkeys(tickers))
+        provenance: Dict[str, Dict[str, str]] = {ticker: {} for ticker in wanted}
+        signals: List[Signal] = []
+        attempted_providers: List[str] = []
+        last_error: Optional[Exception] = None
+        primary = self.priority_order[0]
+
+        for provider_name in self.priority_order:
+            missing = self._missing_data_types(provenance)
+            if not missing:
+                break
+
+            supplies = self.provider_data_types.get(provider_name)
+            request = [
+                ticker for ticker, data_types in missing.items()
+                if supplies is None or data_types is None or data_types & supplies
+            ]
+            if not request:
+                continue
+
+            attempted_providers.append(provider_name)
+            logger.info(
+                "failover_gap_fill_provider",
+                provider=provider_name,
+                requested_tickers=len(request),
+                missing_tickers=len(missing)
+            )
+
+            try:
+                fetched = await self._fetch_guarded(provider_name, request, provider_name == primary)
+            except CircuitOpenError as e:
+                last_error = e
+                logger.info(
+                    "failover_circuit_open",
+                    provider=provider_name,
+                    retry_in_seconds=e.retry_in_seconds
+                )
+                continue
+            except Exception as e:
+                last_error = e
+                logger.error(
+                    "failover_provider_failed",
+                    provider=provider_name,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                continue
+
+            requested = set(request)
+            accepted = 0
+            for signal in fetched or []:
+                if signal.ticker not in requested:
+                    continue
+                data_type = SIGNAL_DATA_TYPES.get(signal.signal_type, signal.signal_type)
+                supplier = provenance[signal.ticker].get(data_type)
+                if supplier is not None and supplier != provider_name:
+                    continue  # Already covered by a higher-priority provider
+                provenance[signal.ticker][data_type] = provider_name
+                signals.append(signal)
+                accepted += 1
+
+            logger.info(
+                "failover_gap_fill_merged",
+                provider=provider_name,
+                signals_accepted=accepted,
+                signals_returned=len(fetched or [])
+            )
+            if accepted and provider_name != primary:
+                await self._log_failover_event(
+                    from_provider=primary,
+                    to_provider=provider_name,
+                    reason=FailoverReason.MISSING_DATA,
+                    tickers=request
+                )
+
+        result = MergedFetchResult(
+            signals=signals,
+            provenance={ticker: types for ticker, types in provenance.items() if types},
+            missing=list(self._missing_data_types(provenance))
+        )
+
+        if not signals:
+            result.signals = await self._fall_back_to_cache(
+                self._get_cache_key(tickers), tickers, attempted_providers,
+                last_error, use_cache_on_failure
+            )
+            return result
+
+        self._update_cache(self._get_cache_key(tickers), signals)
+        logger.info(
+            "failover_gap_fill_completed",
+            signal_count=len(signals),
+            covered_tickers=len(result.provenance),
+            missing_tickers=len(result.missing),
+            attempted_providers=attempted_providers
+        )
+        return result
+
+    def _missing_data_types(
+        self,
+        provenance: Dict[str, Dict[str, str]]
+    ) -> Dict[str, Optional[Set[str]]]:
+        """
+        Work out what each ticker still lacks.
+
+        Args:
+            provenance: ticker -> data type -> supplying provider so far
+
+        Returns:
+            ticker -> missing required data types, for incomplete tickers
+            only (None when no data types are required and the ticker has
+            no data at all)
+        """
+        missing: Dict[str, Optional[Set[str]]] = {}
+        for ticker, covered in provenance.items():
+            if self.required_data_types is None:
+                if not covered:
+                    missing[ticker] = None
+                continue
+            lacking = self.required_data_types - covered.keys()
+            if lacking:
+                missing[ticker] = lacking
+        return missing
+
+    async def _fall_back_to_cache(
+        self,
+        cache_key: str,
+        tickers: Optional[List[str]],
+        attempted_providers: List[str],
+        last_error: Optional[Exception],
+        use_cache_on_failure: bool
+    ) -> List[Signal]:
+        """
+        Serve last-known-good signals after every provider failed.
+
+        Returns:
+            Cached signals flagged with their staleness, or an empty list
+            (logged as a complete failure) if there are none
+        """
         if use_cache_on_failure:
-            cached_signals = self._get_from_cache(cache_key)
-            if cached_signals:
-                age_hours = self._get_cache_age_hours(cache_key)
+            cached = self._cache.get_entry(cache_key)
+            if cached is not None and cached.value:
+                cached_signals = cached.value
+                age_hours = cached.age_seconds / 3600
 
                 logger.warning(
                     "failover_using_cache",
@@ -223,6 +511,194 @@ class DataSourceFailover:
 
         return []
 
+    async def _fetch_guarded(
+        self,
+        provider_name: str,
+        tickers: Optional[List[str]],
+        is_primary: bool
+    ) -> List[Signal]:
+        """
+        Fetch from a provider through its circuit breaker (if any).
+
+        An exception or an empty result counts as a failure (providers
+        typically swallow errors and return no signals); the primary's
+        retries count as one request.
+
+        Args:
+            provider_name: Provider name
+            tickers: Tickers to fetch
+            is_primary: Use the primary's retry strategy
+
+        Returns:
+            List of Signal objects
+
+        Raises:
+            CircuitOpenError: If the provider's breaker rejects the request
+            Exception: Whatever the provider fetch raised
+        """
+        provider = self.providers[provider_name]
+        breaker = self._breakers.get(provider_name)
+        if breaker is not None:
+            breaker.check()
+
+        started = time.monotonic()
+        try:
+            if is_primary:
+                signals = await self._fetch_with_retry(provider, provider_name, tickers)
+            else:
+                signals = await self._fetch_single_attempt(provider, provider_name, tickers)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            if is_primary:
+                # A primary that lost a hedge took at least this long
+                self._record_latency(provider_name, tickers, started)
+            raise
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure()
+            if isinstance(e, asyncio.TimeoutError):
+                self._record_latency(provider_name, tickers, started)
+            raise
+
+        if breaker is not None:
+            if signals:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        if signals:
+            self._record_latency(provider_name, tickers, started)
+        return signals
+
+    def _record_latency(
+        self,
+        provider_name: str,
+        tickers: Optional[List[str]],
+        started: float
+    ) -> None:
+        """Record a provider request's elapsed time for hedging (if enabled)."""
+        if self._hedger is not None:
+            self._hedger.record_latency(
+                provider_name,
+                time.monotonic() - started,
+                request_size=len(tickers) if tickers is not None else None
+            )
+
+    async def _fetch_hedged(
+        self,
+        tickers: Optional[List[str]],
+        attempted_providers: List[str]
+    ) -> Tuple[str, List[Signal], bool]:
+        """
+        Fetch from the primary, racing the first backup if it is slow.
+
+        The backup is fired once the primary has run longer than its hedge
+        delay (its observed latency percentile for requests of this size)
+        and a hedge token is available, or straight away if the primary
+        fails first. The first non-empty answer wins and the other request
+        is cancelled. Without
+        enough latency history, or with the hedge budget spent, this is
+        plain primary-then-backup failover.
+
+        Args:
+            tickers: Tickers to fetch
+            attempted_providers: Updated with the backup if it was tried
+
+        Returns:
+            Tuple of (answering provider, signals, whether a hedge fired);
+            signals are empty if neither provider returned any
+
+        Raises:
+            Exception: The last provider error, if both failed
+        """
+        primary, backup = self.priority_order[0], self.priority_order[1]
+        hedger = self._hedger
+        hedger.record_request()
+        delay = hedger.hedge_delay(
+            primary,
+            request_size=len(tickers) if tickers is not None else None
+        )
+
+        tasks: Dict["asyncio.Task[List[Signal]]", str] = {}
+
+        def start(provider_name: str, is_primary: bool) -> None:
+            task = asyncio.ensure_future(self._fetch_guarded(provider_name, tickers, is_primary))
+            # Retrieve the outcome of a cancelled loser that finished anyway
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            tasks[task] = provider_name
+            if not is_primary:
+                attempted_providers.append(provider_name)
+
+        start(primary, True)
+        hedged = False
+        backup_started = False
+        last_error: Optional[Exception] = None
+
+        try:
+            while tasks:
+                timeout = delay if not backup_started else None
+                done, _ = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Primary slower than its hedge delay
+                    delay = None
+                    if hedger.try_hedge():
+                        logger.info(
+                            "failover_hedge_fired",
+                            primary=primary,
+                            backup=backup,
+                            delay_seconds=timeout
+                        )
+                        hedged = backup_started = True
+                        start(backup, False)
+                    else:
+                        logger.debug("failover_hedge_budget_exhausted", primary=primary)
+                    continue
+
+                for task in done:
+                    provider_name = tasks.pop(task)
+                    try:
+                        signals = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(
+                            "failover_hedged_provider_failed",
+                            provider=provider_name,
+                            error=str(e),
+                            error_type=type(e).__name__
+                        )
+                        continue
+
+                    if signals:
+                        if hedged and provider_name == backup:
+                            hedger.record_hedge_win()
+                        return provider_name, signals, hedged
+
+                if not backup_started:
+                    # Primary failed or came back empty: ordinary failover
+                    backup_started = True
+                    start(backup, False)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if last_error is not None:
+            raise last_error
+        return primary, [], hedged
+
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """Get hedging counters and provider latency (empty if disabled)."""
+        if self._hedger is None:
+            return {}
+        return self._hedger.stats()
+
+    def get_circuit_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of each provider's circuit breaker."""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
+
     async def _fetch_with_retry(
         self,
         provider: DataSource,
@@ -233,9 +709,10 @@ class DataSourceFailover:
         Fetch from provider with retry logic for rate limits.
 
         Retry strategy:
-        - 429 (rate limit): Retry up to max_retries with exponential backoff
+        - 429 (rate limit): Retry up to max_retries with jittered backoff,
+          waiting at least the error's retry_after hint if it has one
         - 5xx (server error): No retry, failover immediately
-        - Network/timeout: Retry once
+        - Retries stop early when the process-wide retry budget is exhausted
 
         Args:
             provider: DataSource instance
@@ -248,12 +725,15 @@ class DataSourceFailover:
         Raises:
             Exception: After max retries exceeded or non-retryable error
         """
-        for attempt in range(self.max_retries):
+        retry = self._retry.sequence()
+
+        while True:
+            attempt = retry.attempt + 1
             try:
                 logger.debug(
                     "retry_attempt",
                     provider=provider_name,
-                    attempt=attempt + 1,
+                    attempt=attempt,
                     max_retries=self.max_retries
                 )
 
@@ -290,33 +770,30 @@ class DataSourceFailover:
                     )
                     raise
 
-                if is_rate_limit and attempt < self.max_retries - 1:
-                    # Rate limit - retry with backoff
-                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                if is_rate_limit:
+                    # Rate limit - retry with backoff (budget permitting)
+                    retry_after = getattr(e, "retry_after", None)
 
                     logger.warning(
                         "retry_rate_limit",
                         provider=provider_name,
-                        attempt=attempt + 1,
+                        attempt=attempt,
                         max_retries=self.max_retries,
-                        retry_delay=delay
+                        retry_after=retry_after
                     )
 
-                    await asyncio.sleep(delay)
-                    continue
+                    if await retry.backoff(retry_after):
+                        continue
 
                 # Max retries exceeded or non-retryable error
                 logger.error(
                     "retry_exhausted",
                     provider=provider_name,
-                    attempts=attempt + 1,
+                    attempts=attempt,
                     error=str(e)
                 )
                 raise
 
-        # Should not reach here, but just in case
-        raise Exception(f"Max retries exceeded for {provider_name}")
-
     async def _fetch_single_attempt(
         self,
         provider: DataSource,
@@ -364,8 +841,7 @@ class DataSourceFailover:
 
     def _update_cache(self, cache_key: str, signals: List[Signal]) -> None:
         """Update cache with fresh signals."""
-        self._cache[cache_key] = signals
-        self._cache_timestamps[cache_key] = datetime.now(timezone.utc)
+        self._cache.set(cache_key, signals, ttl_seconds=self.cache_ttl_hours * 3600)
 
         logger.debug(
             "cache_updated",
@@ -384,30 +860,22 @@ class DataSourceFailover:
             List of cached Signal objects if available and not expired,
             None otherwise
         """
-        if cache_key not in self._cache:
-            return None
-
-        # Check if cache is expired
-        age_hours = self._get_cache_age_hours(cache_key)
-        if age_hours > self.cache_ttl_hours:
-            logger.debug(
-                "cache_expired",
-                cache_key=cache_key,
-                age_hours=age_hours,
-                ttl_hours=self.cache_ttl_hours
-            )
-            return None
-
-        return self._cache[cache_key]
+        return self._cache.get(cache_key)
 
     def _get_cache_age_hours(self, cache_key: str) -> float:
         """Get age of cached data in hours."""
-        if cache_key not in self._cache_timestamps:
+        entry = self._cache.get_entry(cache_key)
+        if entry is None:
             return float('inf')
+        return entry.age_seconds / 3600
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get signal cache hit/miss/eviction counters and tier sizes."""
+        return self._cache.stats()
 
-        cached_time = self._cache_timestamps[cache_key]
-        age = datetime.now(timezone.utc) - cached_time
-        return age.total_seconds() / 3600
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """Get primary provider retry counters."""
+        return self._retry.stats()
 
     async def _log_failover_event(
         self,
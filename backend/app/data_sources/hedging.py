@@ -0,0 +1,242 @@
+"""
+Hedged requests to backup providers.
+
+When the primary provider has not answered within its observed tail latency
+(e.g. p95), the next provider is queried in parallel and the first good
+answer wins. A token budget caps hedges to a fraction of primary requests,
+so hedging cannot double upstream load.
+
+Latency is tracked per provider and request size class (powers of two of
+tickers requested, or the whole universe), so a universe-wide fetch and a
+single-ticker lookup each hedge after their own percentile.
+"""
+
+import math
+import structlog
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from backend.app.data_sources.retry import RetryBudget
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Hedging settings (the failover.hedging section of data_sources.yaml).
+
+    Attributes:
+        percentile: Primary latency percentile after which to hedge
+        min_samples: Observed primary latencies needed before hedging
+        min_delay_seconds: Lower bound on the hedge delay
+        max_delay_seconds: Upper bound on the hedge delay (None = no bound)
+        budget_ratio: Hedges allowed per primary request (token refill)
+        max_budget: Hedge token capacity (bursts of slow requests)
+        window: Latency samples kept per provider
+    """
+    percentile: float = 95.0
+    min_samples: int = 20
+    min_delay_seconds: float = 0.05
+    max_delay_seconds: Optional[float] = None
+    budget_ratio: float = 0.1
+    max_budget: float = 5.0
+    window: int = 200
+
+    @classmethod
+    def from_config(cls, hedging_config: Optional[Dict[str, Any]]) -> "HedgePolicy":
+        """
+        Build settings from a configuration dictionary (unknown keys ignored).
+
+        Args:
+            hedging_config: hedging configuration section (may be None)
+
+        Returns:
+            HedgePolicy with defaults for missing keys
+        """
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in (hedging_config or {}).items() if key in known})
+
+
+def request_size_class(request_size: Optional[int]) -> str:
+    """
+    Get the latency size class of a request.
+
+    Args:
+        request_size: Tickers requested (None: the provider's whole universe)
+
+    Returns:
+        "all" for universe-wide requests, otherwise "<=N" with N the
+        smallest power of two not below request_size
+    """
+    if request_size is None:
+        return "all"
+    return f"<={1 << max(0, request_size - 1).bit_length()}"
+
+
+class LatencyTracker:
+    """Sliding window of request latencies for one provider and size class."""
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize an empty window.
+
+        Args:
+            window: Number of most recent samples kept
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        """Record one request latency."""
+        self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        """Samples currently in the window."""
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a latency percentile (nearest rank).
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if there are no samples
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+class Hedger:
+    """
+    Latency tracking, hedge delay and hedge budget for one failover chain.
+
+    Example:
+        >>> hedger = Hedger(HedgePolicy(percentile=95, budget_ratio=0.1))
+        >>> hedger.record_latency("eodhd", 0.42, request_size=50)
+        >>> delay = hedger.hedge_delay("eodhd", request_size=40)  # None until min_samples
+        >>> if delay is not None and hedger.try_hedge():
+        ...     ...  # fire the backup provider
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        """
+        Initialize with no latency history and a full hedge budget.
+
+        Args:
+            policy: Hedging settings (default: HedgePolicy())
+        """
+        self.policy = policy or HedgePolicy()
+        self._latency: Dict[Tuple[str, str], LatencyTracker] = {}
+        self._budget = RetryBudget(
+            ratio=self.policy.budget_ratio,
+            min_retries_per_second=0.0,
+            max_tokens=self.policy.max_budget
+        )
+
+        # Metrics
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_denied = 0
+
+    def record_latency(
+        self,
+        provider_name: str,
+        seconds: float,
+        request_size: Optional[int] = None
+    ) -> None:
+        """
+        Record a request latency for a provider.
+
+        Record requests that were cancelled or timed out too, at their
+        elapsed time (a lower bound). Dropping them would leave only the
+        fast samples, lowering the percentile and hedging ever more often.
+
+        Args:
+            provider_name: Provider name
+            seconds: Latency, or elapsed time when the request was abandoned
+            request_size: Tickers requested (None: whole universe)
+        """
+        key = (provider_name, request_size_class(request_size))
+        tracker = self._latency.get(key)
+        if tracker is None:
+            tracker = LatencyTracker(self.policy.window)
+            self._latency[key] = tracker
+        tracker.record(seconds)
+
+    def hedge_delay(self, provider_name: str, request_size: Optional[int] = None) -> Optional[float]:
+        """
+        Get how long to wait for a provider before hedging.
+
+        Args:
+            provider_name: Primary provider name
+            request_size: Tickers requested (None: whole universe)
+
+        Returns:
+            Delay in seconds (the policy percentile of observed latency for
+            the request's size class, clamped), or None if there are too few
+            samples to hedge
+        """
+        tracker = self._latency.get((provider_name, request_size_class(request_size)))
+        if tracker is None or tracker.count < self.policy.min_samples:
+            return None
+
+        delay = max(self.policy.min_delay_seconds, tracker.percentile(self.policy.percentile))
+        if self.policy.max_delay_seconds is not None:
+            delay = min(delay, self.policy.max_delay_seconds)
+        return delay
+
+    def record_request(self) -> None:
+        """Count a primary request (earns budget_ratio hedge tokens)."""
+        self._requests += 1
+        self._budget.record_operation()
+
+    def try_hedge(self) -> bool:
+        """
+        Spend one hedge token.
+
+        Returns:
+            True if a hedge may be fired, False if the budget is exhausted
+        """
+        if self._budget.try_spend():
+            self._hedges += 1
+            return True
+        self._budget_denied += 1
+        return False
+
+    def record_hedge_win(self) -> None:
+        """Count a hedge whose backup answered first."""
+        self._hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters and per-provider latency percentiles.
+
+        Returns:
+            Dictionary with requests, hedges fired and won, hedges denied by
+            the budget, tokens available, and latency per provider and
+            request size class
+        """
+        latency: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (name, size_class), tracker in self._latency.items():
+            latency.setdefault(name, {})[size_class] = {
+                "samples": tracker.count,
+                "p50": tracker.percentile(50),
+                "p95": tracker.percentile(95)
+            }
+        return {
+            "requests": self._requests,
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+            "budget_denied": self._budget_denied,
+            "budget_available": round(self._budget.available, 2),
+            "latency": latency
+        }
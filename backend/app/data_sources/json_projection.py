@@ -0,0 +1,188 @@
+"""
+Projection-based JSON decoding.
+
+Decodes only the parts of a JSON document the caller declares, instead of
+materialising the whole tree and then reading a few sections from it. A
+projection is a mapping from object keys to either True (keep the whole
+value) or a nested projection (keep only those keys of the nested object):
+
+    {
+        "General": True,
+        "Financials": {"Balance_Sheet": True, "Income_Statement": True}
+    }
+
+With the optional ijson package installed, the body is parsed as an event
+stream and only declared values are ever built. Without it, the document is
+walked value by value with the standard library decoder, so only one
+undeclared value at a time is materialised before being discarded.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, Mapping, Tuple, Union
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, falls back to the stdlib walker
+    ijson = None
+
+
+Projection = Mapping[str, Any]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+def decode_projected(body: Union[bytes, str], projection: Projection) -> Any:
+    """
+    Decode a JSON document, keeping only the declared keys.
+
+    Args:
+        body: Raw response body
+        projection: Keys to keep (see module docstring)
+
+    Returns:
+        Projected dictionary. Documents that are not JSON objects are
+        returned fully decoded.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    if not body.lstrip().startswith(b"{"):
+        return json.loads(body)
+
+    if ijson is not None:
+        return _decode_streaming(body, projection)
+
+    text = body.decode("utf-8")
+    start = _WHITESPACE.match(text, 0).end()
+    result, end = _project_object(text, start, projection)
+    if _WHITESPACE.match(text, end).end() != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return result
+
+
+def project(value: Any, projection: Projection) -> Any:
+    """
+    Apply a projection to an already decoded value.
+
+    Args:
+        value: Decoded JSON value
+        projection: Keys to keep (see module docstring)
+
+    Returns:
+        Projected dictionary (non-dict values are returned unchanged)
+    """
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, spec in projection.items():
+        if key not in value:
+            continue
+        result[key] = project(value[key], spec) if isinstance(spec, Mapping) else value[key]
+    return result
+
+
+def _project_object(body: str, idx: int, projection: Projection) -> Tuple[Dict[str, Any], int]:
+    """Walk the object starting at body[idx] == "{", keeping declared keys."""
+    result: Dict[str, Any] = {}
+    idx = _WHITESPACE.match(body, idx + 1).end()
+    if body.startswith("}", idx):
+        return result, idx + 1
+
+    while True:
+        if not body.startswith('"', idx):
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", body, idx)
+        key, idx = scanstring(body, idx + 1)
+
+        idx = _WHITESPACE.match(body, idx).end()
+        if not body.startswith(":", idx):
+            raise json.JSONDecodeError("Expecting ':' delimiter", body, idx)
+        idx = _WHITESPACE.match(body, idx + 1).end()
+
+        spec = projection.get(key)
+        if isinstance(spec, Mapping) and body.startswith("{", idx):
+            result[key], idx = _project_object(body, idx, spec)
+        else:
+            value, idx = _decoder.raw_decode(body, idx)
+            if spec is True or isinstance(spec, Mapping):
+                result[key] = value
+
+        idx = _WHITESPACE.match(body, idx).end()
+        if body.startswith("}", idx):
+            return result, idx + 1
+        if not body.startswith(",", idx):
+            raise json.JSONDecodeError("Expecting ',' delimiter", body, idx)
+        idx = _WHITESPACE.match(body, idx + 1).end()
+
+
+def _decode_streaming(body: bytes, projection: Projection) -> Dict[str, Any]:
+    """Build only declared values from an ijson event stream."""
+    result: Dict[str, Any] = {}
+    builder = None
+    depth = 0
+    descend = False
+    target: Dict[str, Any] = result
+    target_key = ""
+
+    try:
+        for prefix, event, value in ijson.parse(body, use_float=True):
+            if descend:
+                # Nested projection: walk into objects, keep other values whole
+                descend = False
+                if event == "start_map":
+                    target[target_key] = {}
+                    continue
+                builder = ijson.ObjectBuilder()
+
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if depth == 0:
+                    target[target_key] = builder.value
+                    builder = None
+                continue
+
+            if event != "map_key":
+                continue
+
+            container, spec = _resolve(result, projection, prefix)
+            if container is None:
+                continue
+
+            key_spec = spec.get(value)
+            if key_spec is True:
+                # Build the whole value from its next event onwards
+                builder = ijson.ObjectBuilder()
+                depth = 0
+                target, target_key = container, value
+            elif isinstance(key_spec, Mapping):
+                descend = True
+                target, target_key = container, value
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), body.decode("utf-8", "replace"), 0) from e
+
+    return result
+
+
+def _resolve(
+    result: Dict[str, Any],
+    projection: Projection,
+    prefix: str
+) -> Tuple[Any, Projection]:
+    """Find the output container and projection for an ijson prefix."""
+    container: Any = result
+    spec: Any = projection
+    for part in prefix.split(".") if prefix else []:
+        spec = spec.get(part) if isinstance(spec, Mapping) else None
+        if not isinstance(spec, Mapping) or not isinstance(container.get(part), dict):
+            return None, {}
+        container = container[part]
+    return container, spec
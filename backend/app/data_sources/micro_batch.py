@@ -0,0 +1,134 @@
+"""
+Micro-batching of concurrent single-key requests.
+
+Requests arriving within a short window are coalesced into one batched
+fetch, and each caller is resolved from the combined result.
+"""
+
+import asyncio
+import structlog
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class MicroBatchStats:
+    """Coalescing counters (since creation)."""
+    requests: int = 0
+    batches: int = 0
+    keys: int = 0
+
+
+class MicroBatcher(Generic[T]):
+    """
+    Coalesce per-key requests into windowed batch fetches.
+
+    The first request opens a window of window_seconds; every request
+    arriving before it closes joins the same batch (duplicate keys are
+    fetched once). A batch reaching max_batch_size is flushed early.
+    Exceptions from the batch fetch are delivered to every waiter, and a
+    cancelled caller does not cancel the batch for the others.
+
+    Example:
+        >>> batcher = MicroBatcher(fetch_quotes, window_seconds=0.02)
+        >>> quote = await batcher.submit("VOD.L")
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[str]], Awaitable[Dict[str, T]]],
+        window_seconds: float = 0.02,
+        max_batch_size: Optional[int] = None
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            fetch_many: Coroutine function fetching a list of keys, returning
+                    results by key (missing keys resolve to None)
+            window_seconds: How long a batch stays open for more requests
+            max_batch_size: Flush as soon as a batch has this many keys
+                    (default: None, unbounded)
+        """
+        self.fetch_many = fetch_many
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, List["asyncio.Future[Optional[T]]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._stats = MicroBatchStats()
+
+    async def submit(self, key: str) -> Optional[T]:
+        """
+        Request key in the current batch.
+
+        Args:
+            key: Request key (e.g., ticker)
+
+        Returns:
+            Result for key from the batch fetch, or None if it had none
+
+        Raises:
+            Exception: Whatever the batch fetch raised
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[T]]" = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        self._stats.requests += 1
+
+        if self.max_batch_size and len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Close the current window and start its batch fetch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        self._stats.batches += 1
+        self._stats.keys += len(batch)
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, List["asyncio.Future[Optional[T]]"]]):
+        """Fetch one batch and resolve its waiters."""
+        logger.debug("micro_batch_flush", keys=len(batch))
+        try:
+            results = await self.fetch_many(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in batch.items():
+            result = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dictionary with requests, batches, distinct keys fetched and
+            requests currently waiting for a window to close
+        """
+        waiting = sum(len(futures) for futures in self._pending.values())
+        return {**asdict(self._stats), "waiting": waiting}
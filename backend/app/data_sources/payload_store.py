@@ -0,0 +1,176 @@
+"""
+Compressed, content-addressed store for raw provider payloads.
+
+Providers keep only the projected fields in cache entries and Signal.data,
+and record a reference (SHA-256 of the payload) to the full raw response
+held here. Identical payloads are stored once. Payloads not stored again
+within the retention window are pruned.
+"""
+
+import hashlib
+import json
+import sqlite3
+import structlog
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+
+logger = structlog.get_logger(__name__)
+
+
+class PayloadStore:
+    """
+    SQLite-backed store of zlib-compressed JSON payloads keyed by hash.
+
+    Storing a payload that is already held refreshes its timestamp, so
+    prune() drops only payloads no provider has re-fetched recently (e.g.
+    superseded versions of a document).
+
+    Example:
+        >>> store = PayloadStore("data/payloads.sqlite3")
+        >>> ref = store.put(response)
+        >>> fundamentals["raw_response_ref"] = ref
+        >>> store.get(ref) == response
+        True
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        compression_level: int = 6,
+        max_age_hours: Optional[float] = None
+    ):
+        """
+        Initialize the store, creating the database schema if needed.
+
+        Args:
+            path: SQLite database file path, or ":memory:" for a
+                  process-local store (default)
+            compression_level: zlib compression level 1-9 (default: 6)
+            max_age_hours: Default retention for prune() (None: keep forever)
+        """
+        self.path = str(path)
+        self.compression_level = compression_level
+        self.max_age_hours = max_age_hours
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS payloads (
+                    hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    compressed_size INTEGER NOT NULL,
+                    created_at REAL NOT NULL  -- last time the payload was stored
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS payloads_created_at ON payloads (created_at)"
+            )
+
+    def put(self, payload: Any) -> str:
+        """
+        Store a JSON-serializable payload (refreshes its timestamp if already stored).
+
+        Args:
+            payload: Raw provider response
+
+        Returns:
+            Content hash referencing the payload
+        """
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        ref = hashlib.sha256(encoded).hexdigest()
+        compressed = zlib.compress(encoded, self.compression_level)
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO payloads (hash, data, size, compressed_size, created_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (hash) DO UPDATE SET created_at = excluded.created_at",
+                (ref, compressed, len(encoded), len(compressed), time.time())
+            )
+        return ref
+
+    def get(self, ref: str) -> Optional[Any]:
+        """
+        Load a payload by reference.
+
+        Args:
+            ref: Content hash returned by put()
+
+        Returns:
+            Decoded payload, or None if not stored
+        """
+        row = self._conn.execute("SELECT data FROM payloads WHERE hash = ?", (ref,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def __contains__(self, ref: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM payloads WHERE hash = ?", (ref,)
+        ).fetchone() is not None
+
+    def prune(
+        self,
+        max_age_hours: Optional[float] = None,
+        referenced: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Delete payloads that are past the retention window or unreferenced.
+
+        Args:
+            max_age_hours: Delete payloads not stored within this many hours
+                           (default: self.max_age_hours; None keeps all ages)
+            referenced: If given, also delete every payload whose hash is not
+                        in it (e.g. the refs still held by cache entries)
+
+        Returns:
+            Number of payloads deleted
+        """
+        max_age_hours = self.max_age_hours if max_age_hours is None else max_age_hours
+        deleted = 0
+
+        with self._conn:
+            if max_age_hours is not None:
+                deleted += self._conn.execute(
+                    "DELETE FROM payloads WHERE created_at < ?",
+                    (time.time() - max_age_hours * 3600,)
+                ).rowcount
+            if referenced is not None:
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS referenced (hash TEXT PRIMARY KEY)")
+                self._conn.execute("DELETE FROM referenced")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO referenced (hash) VALUES (?)",
+                    ((ref,) for ref in referenced)
+                )
+                deleted += self._conn.execute(
+                    "DELETE FROM payloads WHERE hash NOT IN (SELECT hash FROM referenced)"
+                ).rowcount
+                self._conn.execute("DELETE FROM referenced")
+
+        if deleted:
+            logger.info("payload_store_pruned", deleted=deleted)
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get payload count and storage sizes.
+
+        Returns:
+            Dictionary with payloads, size and compressed_size (bytes)
+        """
+        count, size, compressed_size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(compressed_size), 0) FROM payloads"
+        ).fetchone()
+        return {"payloads": count, "size": size, "compressed_size": compressed_size}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
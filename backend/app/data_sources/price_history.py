@@ -0,0 +1,285 @@
+"""
+Persistent, gap-aware OHLCV history store.
+
+Keeps daily bars per ticker in a local SQLite database together with the
+date ranges already fetched, so providers only request the days they are
+missing and serve any window from local storage.
+"""
+
+import sqlite3
+import structlog
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from backend.app.data_sources.price_series import PriceSeries
+
+logger = structlog.get_logger(__name__)
+
+
+DateRange = Tuple[str, str]
+
+BAR_FIELDS = ("date", "open", "high", "low", "close", "adjusted_close", "volume")
+
+
+class PriceHistoryStore:
+    """
+    SQLite-backed per-ticker daily bar store with coverage tracking.
+
+    Coverage is tracked as merged, inclusive date ranges per ticker. A range
+    is recorded when a provider has fetched it, whether or not it contained
+    bars (weekends and bank holidays have none), so it is never requested
+    again. Weekend-only gaps next to fetched history are not reported as
+    missing.
+
+    Example:
+        >>> store = PriceHistoryStore("data/price_history.sqlite3")
+        >>> store.missing_ranges("VOD.LSE", "2025-10-01", "2025-11-01")
+        [('2025-10-01', '2025-11-01')]
+        >>> store.add_bars("VOD.LSE", bars, "2025-10-01", "2025-11-01")
+        >>> store.get_bars("VOD.LSE", "2025-10-15", "2025-11-01")
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Initialize the store, creating the database schema if needed.
+
+        Args:
+            path: SQLite database file path, or ":memory:" for a
+                  process-local store (default)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS price_bars (
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    adjusted_close REAL,
+                    volume REAL,
+                    PRIMARY KEY (ticker, date)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS price_coverage (
+                    ticker TEXT NOT NULL,
+                    from_date TEXT NOT NULL,
+                    to_date TEXT NOT NULL,
+                    PRIMARY KEY (ticker, from_date)
+                )
+                """
+            )
+
+    def get_series(self, ticker: str, from_date: str, to_date: str) -> PriceSeries:
+        """
+        Get stored bars for a ticker within an inclusive date window.
+
+        Args:
+            ticker: Provider ticker (e.g., "VOD.LSE")
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+
+        Returns:
+            PriceSeries sorted by date (empty if no bars stored)
+        """
+        rows = self._conn.execute(
+            "SELECT date, open, high, low, close, adjusted_close, COALESCE(volume, 0) "
+            "FROM price_bars WHERE ticker = ? AND date BETWEEN ? AND ? ORDER BY date",
+            (ticker, from_date, to_date)
+        ).fetchall()
+        if not rows:
+            return PriceSeries.empty()
+        return PriceSeries(*zip(*rows))
+
+    def get_bars(self, ticker: str, from_date: str, to_date: str) -> List[Dict[str, Any]]:
+        """Get stored bars for a window as bar dictionaries (see get_series)."""
+        return self.get_series(ticker, from_date, to_date).to_json()
+
+    def get_coverage(self, ticker: str) -> List[DateRange]:
+        """Get the merged date ranges already fetched for a ticker."""
+        rows = self._conn.execute(
+            "SELECT from_date, to_date FROM price_coverage WHERE ticker = ? ORDER BY from_date",
+            (ticker,)
+        ).fetchall()
+        return [(row["from_date"], row["to_date"]) for row in rows]
+
+    def missing_ranges(self, ticker: str, from_date: str, to_date: str) -> List[DateRange]:
+        """
+        Get the parts of a window not yet covered for a ticker.
+
+        Args:
+            ticker: Provider ticker (e.g., "VOD.LSE")
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+
+        Returns:
+            List of inclusive (from_date, to_date) ranges to fetch, in order.
+            Empty list if the window can be served locally.
+        """
+        coverage = [
+            (_parse_date(covered_from), _parse_date(covered_to))
+            for covered_from, covered_to in self.get_coverage(ticker)
+        ]
+        gaps: List[Tuple[date, date]] = []
+        cursor = _parse_date(from_date)
+        end = _parse_date(to_date)
+
+        for start, stop in coverage:
+            if stop < cursor:
+                continue
+            if start > end:
+                break
+            if start > cursor:
+                gaps.append((cursor, start - timedelta(days=1)))
+            cursor = max(cursor, stop + timedelta(days=1))
+            if cursor > end:
+                break
+
+        if cursor <= end:
+            gaps.append((cursor, end))
+
+        # A weekend next to fetched history has no bars to fetch
+        return [
+            (gap_from.isoformat(), gap_to.isoformat())
+            for gap_from, gap_to in gaps
+            if not (
+                _is_weekend_only(gap_from, gap_to)
+                and _adjoins_coverage(gap_from, gap_to, coverage)
+            )
+        ]
+
+    def add_bars(
+        self,
+        ticker: str,
+        bars: List[Dict[str, Any]],
+        from_date: str,
+        to_date: str
+    ) -> None:
+        """
+        Store bars for a ticker and record the range as covered.
+
+        Args:
+            ticker: Provider ticker (e.g., "VOD.LSE")
+            bars: Bar dictionaries with BAR_FIELDS keys
+            from_date: Start of the fetched range (YYYY-MM-DD)
+            to_date: End of the fetched range (YYYY-MM-DD)
+        """
+        self.add_many([(ticker, bars, from_date, to_date)])
+
+    def add_many(
+        self,
+        entries: Iterable[Tuple[str, List[Dict[str, Any]], str, str]]
+    ) -> None:
+        """
+        Store bars for many tickers in a single transaction.
+
+        Args:
+            entries: Iterable of (ticker, bars, from_date, to_date) tuples
+        """
+        with self._conn:
+            for ticker, bars, from_date, to_date in entries:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO price_bars (ticker, {', '.join(BAR_FIELDS)}) "
+                    f"VALUES (?, {', '.join('?' for _ in BAR_FIELDS)})",
+                    [
+                        (ticker, *(bar.get(field) for field in BAR_FIELDS))
+                        for bar in bars
+                        if bar.get("date")
+                    ]
+                )
+                self._record_coverage(ticker, from_date, to_date)
+
+    def _record_coverage(self, ticker: str, from_date: str, to_date: str) -> None:
+        """Merge a fetched range into the ticker's coverage (within a transaction)."""
+        if _parse_date(to_date) < _parse_date(from_date):
+            return
+
+        ranges = [
+            (_parse_date(f), _parse_date(t))
+            for f, t in self.get_coverage(ticker)
+        ]
+        ranges.append((_parse_date(from_date), _parse_date(to_date)))
+        ranges.sort()
+
+        merged: List[Tuple[date, date]] = []
+        for start, stop in ranges:
+            # Merge overlapping and adjacent ranges
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+
+        self._conn.execute("DELETE FROM price_coverage WHERE ticker = ?", (ticker,))
+        self._conn.executemany(
+            "INSERT INTO price_coverage (ticker, from_date, to_date) VALUES (?, ?, ?)",
+            [(ticker, start.isoformat(), stop.isoformat()) for start, stop in merged]
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def coverage_end(to_date: str, bars: List[Dict[str, Any]]) -> str:
+    """
+    Get the end date that a fetch up to to_date can safely be recorded as covering.
+
+    Bars for today and yesterday may not be published yet, so ranges reaching
+    past the day before yesterday are only recorded up to the later of the
+    last returned bar and the day before yesterday; the unpublished days are
+    requested again on the next fetch.
+
+    Args:
+        to_date: Requested end date (YYYY-MM-DD)
+        bars: Bars returned for the request
+
+    Returns:
+        End date (YYYY-MM-DD) to record as covered (may fall before the
+        requested start date, in which case nothing is covered)
+    """
+    settled = (datetime.now(timezone.utc).date() - timedelta(days=2)).isoformat()
+    if to_date[:10] <= settled:
+        return to_date
+
+    last_bar = max((bar["date"] for bar in bars if bar.get("date")), default=settled)
+    return min(max(last_bar, settled), to_date)
+
+
+def _parse_date(value: Union[str, date]) -> date:
+    """Parse a YYYY-MM-DD string (dates pass through unchanged)."""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+def _is_weekend_only(start: date, stop: date) -> bool:
+    """Check whether every day in an inclusive range is a Saturday or Sunday."""
+    if (stop - start).days >= 2:
+        return False
+    day = start
+    while day <= stop:
+        if day.weekday() < 5:
+            return False
+        day += timedelta(days=1)
+    return True
+
+
+def _adjoins_coverage(start: date, stop: date, coverage: List[Tuple[date, date]]) -> bool:
+    """Check whether the day before or after a range is already covered."""
+    before, after = start - timedelta(days=1), stop + timedelta(days=1)
+    return any(
+        covered_from <= day <= covered_to
+        for covered_from, covered_to in coverage
+        for day in (before, after)
+    )
@@ -0,0 +1,194 @@
+"""
+Columnar OHLCV price series.
+
+PriceSeries holds daily bars as NumPy arrays (one array per field) instead of
+a list of per-bar dictionaries. Derived metrics are computed vectorised, and
+bars are only converted back to JSON records at the persistence boundary
+(see to_json()).
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Union, overload
+
+import numpy as np
+
+
+PRICE_FIELDS = ("open", "high", "low", "close", "adjusted_close")
+
+
+class PriceSeries:
+    """
+    Compact array-backed daily OHLCV series, sorted by date.
+
+    Indexing with an int returns that bar as a dictionary (same keys as the
+    JSON records), and slicing returns a new PriceSeries sharing the
+    underlying arrays.
+
+    Example:
+        >>> series = PriceSeries.from_bars([
+        ...     {"date": "2025-11-03", "open": 1.0, "high": 1.1, "low": 0.9,
+        ...      "close": 1.0, "adjusted_close": 1.0, "volume": 1000},
+        ...     {"date": "2025-11-04", "open": 1.0, "high": 1.2, "low": 1.0,
+        ...      "close": 1.1, "adjusted_close": 1.1, "volume": 3000},
+        ... ])
+        >>> series.latest_price
+        1.1
+        >>> round(series.price_change_pct(), 1)
+        10.0
+        >>> series.to_json()[0]["date"]
+        '2025-11-03'
+    """
+
+    __slots__ = ("dates", "open", "high", "low", "close", "adjusted_close", "volume")
+
+    def __init__(
+        self,
+        dates: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        adjusted_close: Any,
+        volume: Any
+    ):
+        """
+        Initialize from column sequences (converted to NumPy arrays).
+
+        Args:
+            dates: Bar dates (YYYY-MM-DD strings or datetime64 values)
+            open, high, low, close, adjusted_close: Prices (missing -> NaN)
+            volume: Traded volume (missing -> 0)
+
+        Raises:
+            ValueError: If columns have different lengths
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.adjusted_close = np.asarray(adjusted_close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.int64)
+
+        length = len(self.dates)
+        for field in (*PRICE_FIELDS, "volume"):
+            if len(getattr(self, field)) != length:
+                raise ValueError(f"Column '{field}' length does not match dates ({length})")
+
+    @classmethod
+    def from_bars(cls, bars: Iterable[Dict[str, Any]]) -> "PriceSeries":
+        """
+        Build a series from bar dictionaries (e.g., parsed API items).
+
+        Args:
+            bars: Dictionaries with date, open, high, low, close,
+                  adjusted_close and volume keys, sorted by date
+
+        Returns:
+            PriceSeries with one row per bar
+        """
+        bars = list(bars)
+        return cls(
+            dates=[bar["date"] for bar in bars],
+            **{field: [_float_or_nan(bar.get(field)) for bar in bars] for field in PRICE_FIELDS},
+            volume=[int(bar.get("volume") or 0) for bar in bars]
+        )
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        """Return a series with no bars."""
+        return cls.from_bars([])
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PriceSeries": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "PriceSeries"]:
+        if isinstance(index, slice):
+            return PriceSeries(
+                self.dates[index],
+                *(getattr(self, field)[index] for field in PRICE_FIELDS),
+                self.volume[index]
+            )
+        bar: Dict[str, Any] = {"date": str(self.dates[index])}
+        for field in PRICE_FIELDS:
+            bar[field] = _nan_to_none(float(getattr(self, field)[index]))
+        bar["volume"] = int(self.volume[index])
+        return bar
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_json())
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "PriceSeries(empty)"
+        return f"PriceSeries({len(self)} bars, {self.dates[0]}..{self.dates[-1]})"
+
+    def window(self, from_date: str, to_date: str) -> "PriceSeries":
+        """
+        Get the bars within an inclusive date window.
+
+        Args:
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+
+        Returns:
+            PriceSeries view of the window (binary search, no copy)
+        """
+        start = np.searchsorted(self.dates, np.datetime64(from_date, "D"), side="left")
+        stop = np.searchsorted(self.dates, np.datetime64(to_date, "D"), side="right")
+        return self[start:stop]
+
+    @property
+    def latest_price(self) -> float:
+        """Latest close (NaN if the series is empty)."""
+        return float(self.close[-1]) if len(self) else float("nan")
+
+    def price_change_pct(self) -> float:
+        """
+        Percentage change from first to last close over the series.
+
+        Returns:
+            Change in percent, or 0 if the series is empty or the first
+            close is not positive
+        """
+        if not len(self) or not self.close[0] > 0:
+            return 0
+        return float((self.close[-1] - self.close[0]) / self.close[0] * 100)
+
+    def average_volume(self) -> float:
+        """Mean daily volume over the series (0 if empty)."""
+        return float(self.volume.mean()) if len(self) else 0
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """
+        Convert to JSON-compatible bar records (persistence boundary).
+
+        Returns:
+            List of bar dictionaries with date, open, high, low, close,
+            adjusted_close and volume keys
+        """
+        columns = {
+            "date": np.datetime_as_string(self.dates, unit="D").tolist(),
+            **{
+                field: [_nan_to_none(value) for value in getattr(self, field).tolist()]
+                for field in PRICE_FIELDS
+            },
+            "volume": self.volume.tolist()
+        }
+        keys = list(columns)
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def _float_or_nan(value: Any) -> float:
+    """Convert a price to float, mapping missing values to NaN."""
+    return float("nan") if value is None else float(value)
+
+
+def _nan_to_none(value: float) -> Any:
+    """Map NaN back to None for JSON output."""
+    return None if value != value else value
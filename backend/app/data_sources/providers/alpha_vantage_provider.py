@@ -5,13 +5,15 @@ Emergency fallback provider with free tier (25 calls/day).
 Used when both EODHD and Yahoo Finance are unavailable.
 """
 
-import asyncio
 import structlog
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict
-from alpha_vantage.timeseries import TimeSeries
+from typing import Any, List, Optional, Dict
 
+from backend.app.core.config import resolve_data_path
+from backend.app.core.http_pool import HTTPPool, get_http_pool
 from backend.app.data_sources.base import DataSource, Signal
+from backend.app.data_sources.quota import TickerPriorities, allocate_quota
+from backend.app.data_sources.rate_limiter import RateLimiter, RateLimitPolicy, get_rate_limiter
 
 
 logger = structlog.get_logger(__name__)
@@ -28,8 +30,12 @@ class AlphaVantageProvider(DataSource):
 
     This provider:
     - Has strict rate limits (25 calls/day on free tier)
-    - Fetches basic price data for stocks
-    - Tracks daily call count to prevent exceeding quota
+    - Fetches basic price data for stocks with native async requests
+      (compact output, latest bar parsed into plain values, no pandas)
+    - Tracks daily call count to prevent exceeding quota, reserving each
+      call before it is made
+    - Spends short quota on held positions, then watchlist, then the
+      stalest tickers
     - Validates API key before use
     - Should only be used when EODHD and Yahoo Finance both fail
 
@@ -53,11 +59,17 @@ class AlphaVantageProvider(DataSource):
     # Free tier limit (can be overridden in config)
     DEFAULT_DAILY_LIMIT = 25
 
+    BASE_URL = "https://www.alphavantage.co/query"
+    SERIES_KEY = "Time Series (Daily)"
+
     def __init__(
         self,
         api_key: str,
         daily_limit: Optional[int] = None,
-        config: Optional[dict] = None
+        rate_limiter: Optional[RateLimiter] = None,
+        config: Optional[dict] = None,
+        priorities: Optional[TickerPriorities] = None,
+        http_pool: Optional[HTTPPool] = None
     ):
         """
         Initialize Alpha Vantage provider.
@@ -65,7 +77,17 @@ class AlphaVantageProvider(DataSource):
         Args:
             api_key: Alpha Vantage API key (required)
             daily_limit: Maximum API calls per day (default: 25 for free tier)
+            rate_limiter: Shared, persisted rate limiter for the Alpha Vantage
+                         quota. If None and config["rate_limit_store"] is set,
+                         the process-wide limiter in that store is used;
+                         otherwise calls are tracked in-process
             config: Optional configuration dictionary
+            priorities: Held/watchlist/staleness priorities used to choose
+                       tickers when quota is short (default: request order).
+                       See set_priorities()
+            http_pool: HTTP connection pool to borrow (default: the shared
+                        application pool, resolved per request so a pool
+                        opened later by the lifespan is picked up)
 
         Raises:
             ValueError: If api_key is empty or None
@@ -76,7 +98,17 @@ class AlphaVantageProvider(DataSource):
         self.api_key = api_key
         self.daily_limit = daily_limit if daily_limit is not None else self.DEFAULT_DAILY_LIMIT
         self.config = config or {}
-        self.ts = TimeSeries(key=api_key, output_format='pandas')
+        self.priorities = priorities
+        self._http_pool = http_pool
+
+        # Shared quota across processes (optional)
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is None and self.config.get("rate_limit_store"):
+            self.rate_limiter = get_rate_limiter(
+                "alpha_vantage",
+                RateLimitPolicy.from_config({**self.config, "rate_limit": self.daily_limit}),
+                resolve_data_path(self.config["rate_limit_store"])
+            )
 
         # Initialize daily call tracking
         if self.api_key not in self._daily_calls:
@@ -87,6 +119,11 @@ class AlphaVantageProvider(DataSource):
         """Return unique identifier for this provider."""
         return "alpha_vantage"
 
+    @property
+    def _http(self) -> HTTPPool:
+        """HTTP pool for the next request (the shared pool unless injected)."""
+        return self._http_pool or get_http_pool()
+
     def _check_and_reset_daily_limit(self) -> None:
         """Check if we need to reset daily call counter (at midnight UTC)."""
         now = datetime.now(timezone.utc)
@@ -110,23 +147,66 @@ class AlphaVantageProvider(DataSource):
         Returns:
             Number of calls remaining (0 if limit exceeded)
         """
+        if self.rate_limiter is not None:
+            return self.rate_limiter.daily_remaining()
+
         self._check_and_reset_daily_limit()
         used = self._daily_calls.get(self.api_key, 0)
         return max(0, self.daily_limit - used)
 
     def _increment_call_count(self) -> None:
         """Increment daily call counter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.record()
+            return
         self._daily_calls[self.api_key] = self._daily_calls.get(self.api_key, 0) + 1
 
+    async def _reserve_call(self) -> bool:
+        """
+        Reserve one call against today's quota before making it.
+
+        With a shared rate limiter the check and the spend are one SQLite
+        transaction, so processes sharing the store cannot both take the
+        last call. An empty token bucket (a short burst) is waited out; only
+        an exhausted daily quota refuses the call. A reserved call counts
+        even if the request then fails, as it does against Alpha Vantage's
+        own quota.
+
+        Returns:
+            True if the call may be made, False if the quota is exhausted
+        """
+        if self.rate_limiter is not None:
+            return await self.rate_limiter.acquire()
+
+        if self.get_remaining_calls() <= 0:
+            return False
+        self._increment_call_count()
+        return True
+
+    def set_priorities(self, priorities: Optional[TickerPriorities]) -> None:
+        """
+        Set the priorities used to allocate short quota.
+
+        Args:
+            priorities: Held/watchlist/staleness priorities, e.g. from
+                       StockService.get_quota_priorities (None: request order)
+        """
+        self.priorities = priorities
+
     async def fetch(
         self,
-        tickers: Optional[List[str]] = None
+        tickers: Optional[List[str]] = None,
+        priorities: Optional[TickerPriorities] = None
     ) -> List[Signal]:
         """
         Fetch price data from Alpha Vantage.
 
+        When the remaining quota cannot cover every ticker, calls go to held
+        positions first, then watchlist tickers, then the stalest data.
+
         Args:
             tickers: List of stock tickers to fetch. If None, returns empty list.
+            priorities: Priorities for this fetch (default: self.priorities)
 
         Returns:
             List of Signal objects with price data.
@@ -145,16 +225,18 @@ class AlphaVantageProvider(DataSource):
 
         # Check rate limit before fetching
         remaining = self.get_remaining_calls()
-        if remaining < len(tickers):
+        priorities = priorities if priorities is not None else self.priorities
+        tickers, skipped = allocate_quota(tickers, remaining, priorities)
+        if skipped:
             logger.warning(
                 "alpha_vantage_rate_limit",
-                requested_calls=len(tickers),
+                requested_calls=len(tickers) + len(skipped),
                 remaining_calls=remaining,
                 daily_limit=self.daily_limit,
+                skipped=skipped[:5],
+                prioritized=priorities is not None,
                 message="Insufficient API calls remaining for request"
             )
-            # Fetch as many as we can within limit
-            tickers = tickers[:remaining]
             if not tickers:
                 return []
 
@@ -165,9 +247,7 @@ class AlphaVantageProvider(DataSource):
         )
 
         try:
-            # Run synchronous Alpha Vantage calls in thread pool
-            signals = await asyncio.to_thread(self._fetch_sync, tickers)
-            return signals
+            return await self._fetch_tickers(tickers)
 
         except RateLimitExceeded:
             logger.error(
@@ -184,9 +264,9 @@ class AlphaVantageProvider(DataSource):
             )
             return []
 
-    def _fetch_sync(self, tickers: List[str]) -> List[Signal]:
+    async def _fetch_tickers(self, tickers: List[str]) -> List[Signal]:
         """
-        Synchronous fetch from Alpha Vantage (runs in thread pool).
+        Fetch tickers one call at a time against the reserved quota.
 
         Args:
             tickers: List of stock tickers to fetch
@@ -201,8 +281,8 @@ class AlphaVantageProvider(DataSource):
         timestamp = datetime.now(timezone.utc)
 
         for ticker in tickers:
-            # Check if we've hit rate limit
-            if self.get_remaining_calls() <= 0:
+            # Reserve the call (another process may have spent the quota)
+            if not await self._reserve_call():
                 logger.warning(
                     "alpha_vantage_mid_fetch_limit",
                     processed=len(signals),
@@ -210,90 +290,16 @@ class AlphaVantageProvider(DataSource):
                 )
                 break
 
-            try:
-                # Alpha Vantage expects tickers without exchange suffix
-                # Convert "VOD.L" -> "VOD" for API call
-                av_ticker = ticker.replace(".L", "")
-
-                # Fetch daily data (most efficient for our use case)
-                data, meta_data = self.ts.get_daily(symbol=av_ticker)
-
-                # Increment call counter
-                self._increment_call_count()
-
-                # Get most recent day's data
-                if data.empty:
-                    logger.warning(
-                        "alpha_vantage_no_data",
-                        ticker=ticker,
-                        av_ticker=av_ticker
-                    )
-                    continue
-
-                latest_date = data.index[0]
-                latest_data = data.iloc[0]
-
-                current_price = float(latest_data['4. close'])
-                open_price = float(latest_data['1. open'])
-                high_price = float(latest_data['2. high'])
-                low_price = float(latest_data['3. low'])
-                volume = int(latest_data['5. volume'])
-
-                # Calculate intraday price change
-                price_change_pct = 0
-                if open_price > 0:
-                    price_change_pct = ((current_price - open_price) / open_price) * 100
-
-                # Generate signal score (basic price movement indicator)
-                score = 50
-                if abs(price_change_pct) > 3:
-                    score += min(abs(price_change_pct) * 3, 25)
-
-                score = max(0, min(100, int(score)))
-
-                # Alpha Vantage confidence (lower than EODHD, higher than Yahoo for LSE)
-                confidence = 0.75
-
-                signal = Signal(
-                    ticker=ticker,
-                    signal_type="PRICE_UPDATE",
-                    score=score,
-                    confidence=confidence,
-                    data={
-                        "current_price": current_price,
-                        "open_price": open_price,
-                        "high_price": high_price,
-                        "low_price": low_price,
-                        "volume": volume,
-                        "price_change_pct": float(price_change_pct),
-                        "latest_date": str(latest_date),
-                        "provider": "alpha_vantage",
-                        "calls_remaining": self.get_remaining_calls()
-                    },
-                    timestamp=timestamp,
-                    source=self.get_source_name()
-                )
-
-                signals.append(signal)
-
-                logger.debug(
-                    "alpha_vantage_ticker_fetched",
-                    ticker=ticker,
-                    price=current_price,
-                    calls_remaining=self.get_remaining_calls()
-                )
+            # Alpha Vantage expects tickers without exchange suffix
+            # Convert "VOD.L" -> "VOD" for API call
+            av_ticker = ticker.replace(".L", "")
 
+            try:
+                bars = await self._fetch_daily_bars(av_ticker)
+            except RateLimitExceeded:
+                logger.error("alpha_vantage_rate_limit_error", ticker=ticker)
+                raise
             except Exception as e:
-                # Check if error is rate limit related
-                error_str = str(e).lower()
-                if "api call frequency" in error_str or "rate limit" in error_str:
-                    logger.error(
-                        "alpha_vantage_rate_limit_error",
-                        ticker=ticker,
-                        error=str(e)
-                    )
-                    raise RateLimitExceeded(f"Rate limit exceeded for {ticker}")
-
                 logger.warning(
                     "alpha_vantage_ticker_error",
                     ticker=ticker,
@@ -302,16 +308,142 @@ class AlphaVantageProvider(DataSource):
                 )
                 continue
 
+            if not bars["date"]:
+                logger.warning(
+                    "alpha_vantage_no_data",
+                    ticker=ticker,
+                    av_ticker=av_ticker
+                )
+                continue
+
+            signal = self._build_signal(ticker, bars, timestamp)
+            signals.append(signal)
+
+            logger.debug(
+                "alpha_vantage_ticker_fetched",
+                ticker=ticker,
+                price=signal.data["current_price"],
+                calls_remaining=signal.data["calls_remaining"]
+            )
+
         logger.info(
             "alpha_vantage_fetch_completed",
             signals_generated=len(signals),
-            calls_used=self._daily_calls.get(self.api_key, 0),
+            calls_used=self.daily_limit - self.get_remaining_calls(),
             calls_remaining=self.get_remaining_calls()
         )
 
         return signals
 
-    def validate_api_key(self) -> bool:
+    async def _fetch_daily_bars(self, symbol: str, count: int = 1) -> Dict[str, List[Any]]:
+        """
+        Request compact daily bars and parse the latest into plain lists.
+
+        Args:
+            symbol: Alpha Vantage symbol (e.g., "VOD")
+            count: Number of most recent bars to parse (default: 1)
+
+        Returns:
+            Dictionary of date, open, high, low, close and volume lists,
+            newest first (empty lists if the symbol has no bars)
+
+        Raises:
+            RateLimitExceeded: If Alpha Vantage reports its rate limit
+            ValueError: If Alpha Vantage rejects the request
+        """
+        response = await self._http.get(
+            self.BASE_URL,
+            params={
+                "function": "TIME_SERIES_DAILY",
+                "symbol": symbol,
+                "outputsize": "compact",
+                "apikey": self.api_key
+            }
+        )
+        if response.status_code == 429:
+            raise RateLimitExceeded(f"Rate limit exceeded for {symbol}")
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code} for {symbol}")
+
+        payload = response.json()
+
+        # Throttling and errors come back as 200 with a message instead of data
+        notice = payload.get("Note") or payload.get("Information")
+        if notice and self.SERIES_KEY not in payload:
+            notice_lower = notice.lower()
+            if "api call frequency" in notice_lower or "rate limit" in notice_lower:
+                raise RateLimitExceeded(f"Rate limit exceeded for {symbol}")
+            raise ValueError(notice)
+        if "Error Message" in payload:
+            raise ValueError(payload["Error Message"])
+
+        series = payload.get(self.SERIES_KEY) or {}
+        dates = sorted(series, reverse=True)[:count]  # ISO dates sort chronologically
+        return {
+            "date": dates,
+            "open": [float(series[day]["1. open"]) for day in dates],
+            "high": [float(series[day]["2. high"]) for day in dates],
+            "low": [float(series[day]["3. low"]) for day in dates],
+            "close": [float(series[day]["4. close"]) for day in dates],
+            "volume": [int(float(series[day]["5. volume"])) for day in dates]
+        }
+
+    def _build_signal(
+        self,
+        ticker: str,
+        bars: Dict[str, List[Any]],
+        timestamp: datetime
+    ) -> Signal:
+        """
+        Convert the latest daily bar to a PRICE_UPDATE signal.
+
+        Args:
+            ticker: LSE ticker (e.g., "VOD.L")
+            bars: Bars from _fetch_daily_bars (newest first, non-empty)
+            timestamp: Signal timestamp
+
+        Returns:
+            Signal object
+        """
+        current_price = bars["close"][0]
+        open_price = bars["open"][0]
+
+        # Calculate intraday price change
+        price_change_pct = 0
+        if open_price > 0:
+            price_change_pct = ((current_price - open_price) / open_price) * 100
+
+        # Generate signal score (basic price movement indicator)
+        score = 50
+        if abs(price_change_pct) > 3:
+            score += min(abs(price_change_pct) * 3, 25)
+
+        score = max(0, min(100, int(score)))
+
+        # Alpha Vantage confidence (lower than EODHD, higher than Yahoo for LSE)
+        confidence = 0.75
+
+        return Signal(
+            ticker=ticker,
+            signal_type="PRICE_UPDATE",
+            score=score,
+            confidence=confidence,
+            data={
+                "current_price": current_price,
+                "open_price": open_price,
+                "high_price": bars["high"][0],
+                "low_price": bars["low"][0],
+                "volume": bars["volume"][0],
+                "price_change_pct": float(price_change_pct),
+                "latest_date": bars["date"][0],
+                "provider": "alpha_vantage",
+                "calls_remaining": self.get_remaining_calls()
+            },
+            timestamp=timestamp,
+            source=self.get_source_name()
+        )
+
+    async def validate_api_key(self) -> bool:
         """
         Validate that the API key works.
 
@@ -321,14 +453,13 @@ class AlphaVantageProvider(DataSource):
         Note:
             This makes an API call and counts against daily limit.
         """
-        if self.get_remaining_calls() <= 0:
+        if not await self._reserve_call():
             logger.warning("alpha_vantage_no_calls_for_validation")
             return False
 
         try:
             # Test with a known ticker (Microsoft)
-            _, _ = self.ts.get_daily(symbol='MSFT')
-            self._increment_call_count()
+            await self._fetch_daily_bars("MSFT")
             return True
         except Exception as e:
             logger.error(
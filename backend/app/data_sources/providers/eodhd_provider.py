@@ -7,19 +7,76 @@ and analyst estimates. Implements caching, rate limiting, and retry logic.
 
 import asyncio
 import structlog
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
 import httpx
 
+from backend.app.core.config import resolve_data_path
+from backend.app.core.http_pool import HTTPPool, get_http_pool
 from backend.app.data_sources.base import DataSource, Signal
+from backend.app.data_sources.json_projection import Projection, decode_projected, project
+from backend.app.data_sources.payload_store import PayloadStore
+from backend.app.data_sources.price_history import PriceHistoryStore, coverage_end
+from backend.app.data_sources.price_series import PriceSeries
+from backend.app.data_sources.rate_limiter import RateLimiter, RateLimitPolicy, get_rate_limiter
+from backend.app.data_sources.response_cache import ResponseCache
+from backend.app.data_sources.retry import RetryEngine, RetryPolicy, parse_retry_after
+from backend.app.data_sources.scoring import (
+    ScoringThresholds,
+    UniverseMetrics,
+    score_signals,
+    score_universe,
+)
+from backend.app.data_sources.single_flight import SingleFlight
 
 
 logger = structlog.get_logger(__name__)
 
+# Data types fetched per ticker (each has its own cache TTL)
+DATA_TYPES = ("fundamentals", "profile", "estimates", "prices")
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """
+    Which data types to fetch per ticker, and how old cached data may be.
+
+    Attributes:
+        data_types: Data types to fetch (subset of DATA_TYPES)
+        max_age_hours: Per-type override of the configured cache TTL, e.g.
+                       {"fundamentals": 24} refetches fundamentals older
+                       than a day
+
+    Example:
+        >>> await provider.fetch(FetchPlan.prices_only())
+        >>> await provider.fetch(FetchPlan(("prices", "fundamentals"), {"fundamentals": 24}))
+    """
+    data_types: Tuple[str, ...] = DATA_TYPES
+    max_age_hours: Mapping[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        unknown = (set(self.data_types) | set(self.max_age_hours)) - set(DATA_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown data types in fetch plan: {sorted(unknown)}")
+
+    @classmethod
+    def prices_only(cls) -> "FetchPlan":
+        """Plan for intraday price refreshes (one call per ticker at most)."""
+        return cls(data_types=("prices",))
+
+    def includes(self, data_type: str) -> bool:
+        """Check whether the plan fetches a data type."""
+        return data_type in self.data_types
+
 
 class EODHDRateLimitExceeded(Exception):
     """Raised when EODHD API rate limit is exceeded."""
-    pass
+
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Server Retry-After hint in seconds, if any (used by retry engines)
+        self.retry_after = retry_after
 
 
 class EODHDProvider(DataSource):
@@ -34,10 +91,26 @@ class EODHDProvider(DataSource):
     - Analyst estimates (EPS, revenue consensus)
 
     Features:
-    - Caching with configurable TTL (default: 24 hours)
-    - Rate limiting (100k calls/day, configurable)
-    - Retry with exponential backoff (1s, 3s, 9s)
+    - Two-tier response cache (bounded in-memory LRU + optional SQLite disk
+      tier that survives restarts) with configurable TTL (default: 24 hours)
+    - One shared /fundamentals download per ticker for fundamentals,
+      profile and analyst estimates
+    - Rate limiting (100k calls/day, configurable), optionally through a
+      shared, persisted token bucket (per-second smoothing + daily quota)
+    - Bounded concurrent ticker fan-out (global and per-host in-flight limits)
+    - Raw API payloads offloaded to a compressed, content-addressed store
+      (cache entries and signals keep projected fields plus a hash reference)
+    - Persistent, gap-aware price history (only missing days are requested)
+    - Optional exchange-wide bulk end-of-day price refresh (one call per night)
+    - Resumable, paginated bulk fundamentals ingestion for whole-exchange scans
+    - Requests borrow the application's shared HTTP connection pool
+    - Optional projected decoding of fundamentals documents (only the
+      sections the views read are parsed)
+    - Retry with decorrelated jitter (1-9s), Retry-After support and a
+      process-wide retry budget
     - UK market-specific handling (pence/pounds conversion)
+    - Stale-while-revalidate caching (stale entries are served while a
+      deduplicated background refresh runs, until the hard TTL)
     - Graceful error handling and fallback to cached data
 
     Example:
@@ -53,14 +126,49 @@ class EODHDProvider(DataSource):
 
     BASE_URL = "https://eodhistoricaldata.com/api"
     EXCHANGE_CODE = "LSE"  # London Stock Exchange
+    BULK_FUNDAMENTALS_CALL_COST = 100  # API calls charged per bulk fundamentals page
+
+    # Parts of /fundamentals/{ticker} kept when projected_decode is enabled.
+    # The statements' quarterly history and Earnings.History (per-quarter
+    # results back to listing) are most of the document and nothing reads
+    # them; the views keep the yearly statements and the earnings trend.
+    FUNDAMENTALS_PROJECTION: Projection = {
+        "General": True,
+        "Highlights": True,
+        "Valuation": True,
+        "Financials": {
+            statement: {"currency_symbol": True, "yearly": True}
+            for statement in ("Balance_Sheet", "Income_Statement", "Cash_Flow")
+        },
+        "Earnings": {"Trend": True, "Annual": True},
+        "Technicals": True,
+        "AnalystRatings": True,
+        "Holders": True,
+        "ESGScores": True,
+        "outstandingShares": True
+    }
 
     def __init__(
         self,
         api_key: str,
         tickers: Optional[List[str]] = None,
         cache_ttl_hours: int = 24,
+        cache_hard_ttl_hours: Optional[float] = None,
+        cache_ttl_hours_by_type: Optional[Dict[str, float]] = None,
         rate_limit_per_day: int = 100000,
         max_retries: int = 3,
+        max_concurrency: Optional[int] = None,
+        max_concurrency_per_host: Optional[int] = None,
+        bulk_prices: Optional[bool] = None,
+        projected_decode: Optional[bool] = None,
+        price_store: Optional[PriceHistoryStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        payload_store: Optional[PayloadStore] = None,
+        http_pool: Optional[HTTPPool] = None,
+        retry_engine: Optional[RetryEngine] = None,
+        scoring_thresholds: Optional[ScoringThresholds] = None,
+        fetch_plan: Optional[FetchPlan] = None,
         config: Optional[dict] = None
     ):
         """
@@ -69,42 +177,174 @@ class EODHDProvider(DataSource):
         Args:
             api_key: EODHD API key (required)
             tickers: List of LSE tickers to fetch (e.g., ["VOD.L", "BP.L"])
-            cache_ttl_hours: Cache time-to-live in hours (default: 24)
+            cache_ttl_hours: Cache time-to-live in hours (default: 24). Past
+                        this soft TTL cached data is still served, and
+                        refreshed in the background
+            cache_hard_ttl_hours: Age in hours after which cached data is no
+                        longer served and callers wait for a fresh fetch
+                        (default: config["cache_hard_ttl_hours"], or
+                        cache_ttl_hours, i.e. no stale serving)
+            cache_ttl_hours_by_type: Per-data-type cache TTLs in hours for
+                        "fundamentals", "profile", "estimates" and "prices"
+                        (default: config["cache_ttl_hours_by_type"]; types
+                        not listed use cache_ttl_hours). The stale window
+                        (hard minus soft TTL) is the same for every type
             rate_limit_per_day: Maximum API calls per day (default: 100000)
             max_retries: Maximum retry attempts for failed requests (default: 3)
+            max_concurrency: Maximum tickers fetched concurrently (default:
+                            config["max_concurrency"] or 10). Use 1 for
+                            strictly serial fetching.
+            max_concurrency_per_host: Maximum in-flight HTTP requests per host
+                            (default: config["max_concurrency_per_host"], or
+                            the same as max_concurrency)
+            bulk_prices: Refresh prices with one exchange-wide bulk last-day
+                        request per fetch, using per-ticker /eod requests only
+                        to backfill history (default: config["bulk_prices"]
+                        or False)
+            projected_decode: Decode fundamentals documents incrementally
+                        into FUNDAMENTALS_PROJECTION only, instead of
+                        materialising the whole document; the projected
+                        document is what views and the payload store get
+                        (default: config["projected_decode"] or False)
+            price_store: OHLCV history store. If None, opened from
+                        config["price_history_path"] (in-memory if unset)
+            rate_limiter: Shared rate limiter for the EODHD budget. If None
+                        and config["rate_limit_store"] is set, the process-wide
+                        limiter persisted in that store is used; otherwise
+                        only the per-instance daily counter applies
+            cache: Response cache. If None, created with the longest hard
+                        TTL, config["cache_max_entries"] as the memory
+                        bound and config["cache_path"] as the disk tier
+                        (memory only if unset)
+            payload_store: Raw payload store. If None, opened from
+                        config["payload_store_path"] (in-memory if unset),
+                        pruning payloads not re-stored within
+                        config["payload_max_age_hours"] (default: the
+                        longest hard TTL)
+            http_pool: HTTP connection pool to borrow (default: the shared
+                        application pool, resolved per request so a pool
+                        opened later by the lifespan is picked up)
+            retry_engine: Retry engine for HTTP requests (default: jittered
+                        1-9s backoff over max_retries attempts, spending
+                        from the process-wide retry budget)
+            scoring_thresholds: Signal score thresholds. If None, built
+                        from config["scoring"] (defaults if unset)
+            fetch_plan: Default plan for fetch() (default: all data types)
             config: Optional configuration dictionary
         """
         if not api_key:
             raise ValueError("EODHD API key is required")
 
         self.api_key = api_key
-        self.tickers = tickers or (config.get("tickers", []) if config else [])
+        self.config = config or {}
+        self.tickers = tickers or self.config.get("tickers", [])
         self.cache_ttl_hours = cache_ttl_hours
         self.rate_limit_per_day = rate_limit_per_day
         self.max_retries = max_retries
-        self.config = config or {}
+        self.max_concurrency = (
+            max_concurrency if max_concurrency is not None
+            else self.config.get("max_concurrency", 10)
+        )
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency_per_host = (
+            max_concurrency_per_host or self.config.get("max_concurrency_per_host") or self.max_concurrency
+        )
+        self.bulk_prices = (
+            bulk_prices if bulk_prices is not None else self.config.get("bulk_prices", False)
+        )
+        self.projected_decode = (
+            projected_decode if projected_decode is not None
+            else self.config.get("projected_decode", False)
+        )
+        self.cache_hard_ttl_hours = max(
+            cache_ttl_hours,
+            cache_hard_ttl_hours or self.config.get("cache_hard_ttl_hours", cache_ttl_hours)
+        )
+        ttl_overrides = cache_ttl_hours_by_type or self.config.get("cache_ttl_hours_by_type") or {}
+        self.cache_ttl_hours_by_type = {
+            data_type: ttl_overrides.get(data_type, cache_ttl_hours) for data_type in DATA_TYPES
+        }
+        self.fetch_plan = fetch_plan or FetchPlan()
+
+        # Concurrency limits (per-host semaphores are created lazily)
+        self._ticker_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
 
         # Rate limiting tracking
         self._api_call_count = 0
         self._rate_limit_reset_time = datetime.now(timezone.utc) + timedelta(days=1)
 
-        # Cache storage
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+        # Shared budget across providers and processes (optional)
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is None and self.config.get("rate_limit_store"):
+            self.rate_limiter = get_rate_limiter(
+                "eodhd",
+                RateLimitPolicy.from_config({**self.config, "rate_limit": rate_limit_per_day}),
+                resolve_data_path(self.config["rate_limit_store"])
+            )
+
+        # Response cache (memory LRU + optional disk tier); entries are kept
+        # until the longest hard TTL, each read applies its data type's TTLs
+        self._cache = cache or ResponseCache(
+            "eodhd",
+            default_ttl_seconds=self._hard_ttl_hours(max(self.cache_ttl_hours_by_type.values())) * 3600,
+            max_entries=self.config.get("cache_max_entries", 1024),
+            path=resolve_data_path(self.config["cache_path"]) if self.config.get("cache_path") else None
+        )
+
+        # Per-ticker OHLCV history (serves any window, fetches only gaps)
+        self.price_store = price_store or PriceHistoryStore(
+            resolve_data_path(self.config.get("price_history_path", ":memory:"))
+        )
+
+        # Raw responses, referenced by hash from fundamentals/estimates
+        self.payload_store = payload_store or PayloadStore(
+            resolve_data_path(self.config.get("payload_store_path", ":memory:")),
+            max_age_hours=self.config.get(
+                "payload_max_age_hours",
+                self._hard_ttl_hours(max(self.cache_ttl_hours_by_type.values()))
+            )
+        )
+
+        # Retries (decorrelated jitter, Retry-After, shared budget)
+        self._retry = retry_engine or RetryEngine(
+            "eodhd",
+            RetryPolicy(max_attempts=max_retries, base_delay=1.0, max_delay=9.0)
+        )
+
+        # Borrowed HTTP pool (owned and closed by the application lifespan);
+        # None resolves the shared pool per request, see _http
+        self._http_pool = http_pool
+
+        # Concurrent identical fetches share one request
+        self._single_flight = SingleFlight()
 
-        # HTTP client
-        self._client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True
+        # Universe-wide scoring step run after fetching (see score_signals)
+        self.scoring_thresholds = scoring_thresholds or ScoringThresholds(
+            **self.config.get("scoring", {})
         )
 
+        # Background revalidations of stale cache entries
+        self._refresh_tasks: Set["asyncio.Task[Any]"] = set()
+
     def get_source_name(self) -> str:
         """Return unique identifier for this provider."""
         return "eodhd_fundamental"
 
-    async def fetch(self) -> List[Signal]:
+    async def fetch(
+        self,
+        plan: Optional[FetchPlan] = None,
+        tickers: Optional[List[str]] = None
+    ) -> List[Signal]:
         """
-        Fetch data from EODHD for all configured tickers.
+        Fetch data from EODHD for the configured tickers or a subset.
+
+        Args:
+            plan: Data types to fetch and their maximum cached age
+                  (default: the provider's fetch_plan, all data types)
+            tickers: Tickers to fetch, e.g. the gaps a failover chain asks
+                     this provider to fill (default: self.tickers)
 
         Returns:
             List of Signal objects with fundamental data, prices, and estimates.
@@ -113,26 +353,89 @@ class EODHDProvider(DataSource):
         Note:
             Does not raise exceptions. Logs errors and returns empty list.
         """
-        if not self.tickers:
+        tickers = self.tickers if tickers is None else tickers
+        if not tickers:
             logger.warning(
                 "eodhd_no_tickers",
                 message="No tickers configured for EODHD provider"
             )
             return []
 
+        plan = plan or self.fetch_plan
+
         logger.info(
             "eodhd_fetch_started",
-            ticker_count=len(self.tickers),
-            tickers=self.tickers[:5]  # Log first 5 for brevity
+            ticker_count=len(tickers),
+            tickers=tickers[:5],  # Log first 5 for brevity
+            max_concurrency=self.max_concurrency,
+            bulk_prices=self.bulk_prices,
+            data_types=list(plan.data_types)
+        )
+
+        # One exchange-wide request refreshes the latest bar for every ticker
+        latest_bars: Dict[str, Dict[str, Any]] = {}
+        if self.bulk_prices and plan.includes("prices"):
+            try:
+                latest_bars = await self.fetch_bulk_last_day(
+                    max_age_hours=plan.max_age_hours.get("prices")
+                )
+            except EODHDRateLimitExceeded:
+                logger.warning(
+                    "eodhd_bulk_prices_rate_limited",
+                    message="Rate limit exceeded, skipping bulk price refresh"
+                )
+
+        # Fan out across tickers, bounded by max_concurrency. gather() keeps
+        # results in ticker order; errors are isolated per ticker.
+        results = await asyncio.gather(*[
+            self._fetch_ticker_with_fallback(
+                ticker, plan,
+                latest_bars.get(self._format_ticker_for_api(ticker), {}).get("date")
+            )
+            for ticker in tickers
+        ])
+
+        all_signals = [signal for signals in results for signal in signals]
+
+        # Score the whole universe in one vectorised pass
+        score_signals(all_signals, self.scoring_thresholds)
+
+        # Drop raw payloads superseded or unused for longer than the retention
+        self.payload_store.prune()
+
+        logger.info(
+            "eodhd_fetch_completed",
+            signals_generated=len(all_signals),
+            tickers_attempted=len(tickers),
+            api_calls_made=self._api_call_count
         )
 
-        all_signals = []
+        return all_signals
+
+    async def _fetch_ticker_with_fallback(
+        self,
+        ticker: str,
+        plan: FetchPlan,
+        prices_to: Optional[str] = None
+    ) -> List[Signal]:
+        """
+        Fetch a single ticker within the concurrency limit, isolating errors.
+
+        Falls back to cached signals if the rate limit is exceeded or the
+        fetch fails.
+
+        Args:
+            ticker: Stock ticker (e.g., "VOD.L")
+            plan: Data types to fetch
+            prices_to: End of the price window (see _fetch_ticker_data)
 
-        for ticker in self.tickers:
+        Returns:
+            List of Signal objects for this ticker (may be empty)
+        """
+        async with self._ticker_semaphore:
             try:
-                # Fetch all data types for this ticker
-                signals = await self._fetch_ticker_data(ticker)
-                all_signals.extend(signals)
+                # Fetch the planned data types for this ticker
+                return await self._fetch_ticker_data(ticker, plan, prices_to)
 
             except EODHDRateLimitExceeded:
                 logger.warning(
@@ -141,9 +444,7 @@ class EODHDProvider(DataSource):
                     message="Rate limit exceeded, using cached data for remaining tickers"
                 )
                 # Try to get cached data for remaining tickers
-                cached_signals = self._get_cached_signals(ticker)
-                if cached_signals:
-                    all_signals.extend(cached_signals)
+                return self._get_cached_signals(ticker)
 
             except Exception as e:
                 logger.error(
@@ -153,43 +454,43 @@ class EODHDProvider(DataSource):
                     error_type=type(e).__name__
                 )
                 # Try to get cached data
-                cached_signals = self._get_cached_signals(ticker)
-                if cached_signals:
-                    all_signals.extend(cached_signals)
-                continue
-
-        logger.info(
-            "eodhd_fetch_completed",
-            signals_generated=len(all_signals),
-            tickers_attempted=len(self.tickers),
-            api_calls_made=self._api_call_count
-        )
+                return self._get_cached_signals(ticker)
 
-        return all_signals
-
-    async def _fetch_ticker_data(self, ticker: str) -> List[Signal]:
+    async def _fetch_ticker_data(
+        self,
+        ticker: str,
+        plan: Optional[FetchPlan] = None,
+        prices_to: Optional[str] = None
+    ) -> List[Signal]:
         """
-        Fetch all data types for a single ticker.
+        Fetch the planned data types for a single ticker.
 
         Args:
             ticker: Stock ticker (e.g., "VOD.L")
+            plan: Data types to fetch (default: the provider's fetch_plan)
+            prices_to: End of the price window (YYYY-MM-DD), e.g. the date of
+                       the bulk last-day bar (default: today, UTC)
 
         Returns:
             List of Signal objects for this ticker
         """
         signals = []
         timestamp = datetime.now(timezone.utc)
+        plan = plan or self.fetch_plan
+        max_age = plan.max_age_hours
 
         # Format ticker for EODHD API (remove .L, add .LSE)
         eodhd_ticker = self._format_ticker_for_api(ticker)
 
         # Fetch fundamental data (includes financials, ratios, profile)
-        fundamentals = await self.fetch_fundamentals(eodhd_ticker)
+        fundamentals = {}
+        if plan.includes("fundamentals"):
+            fundamentals = await self.fetch_fundamentals(eodhd_ticker, max_age.get("fundamentals"))
         if fundamentals:
             signal = Signal(
                 ticker=ticker,
                 signal_type="FUNDAMENTAL_DATA",
-                score=self._calculate_fundamental_score(fundamentals),
+                score=50,  # Scored for the whole universe in fetch()
                 confidence=0.9,  # EODHD is high quality
                 data=fundamentals,
                 timestamp=timestamp,
@@ -198,7 +499,9 @@ class EODHDProvider(DataSource):
             signals.append(signal)
 
         # Fetch company profile
-        profile = await self.fetch_company_profile(eodhd_ticker)
+        profile = {}
+        if plan.includes("profile"):
+            profile = await self.fetch_company_profile(eodhd_ticker, max_age.get("profile"))
         if profile:
             signal = Signal(
                 ticker=ticker,
@@ -212,12 +515,14 @@ class EODHDProvider(DataSource):
             signals.append(signal)
 
         # Fetch analyst estimates
-        estimates = await self.fetch_analyst_estimates(eodhd_ticker)
+        estimates = {}
+        if plan.includes("estimates"):
+            estimates = await self.fetch_analyst_estimates(eodhd_ticker, max_age.get("estimates"))
         if estimates:
             signal = Signal(
                 ticker=ticker,
                 signal_type="ANALYST_ESTIMATES",
-                score=self._calculate_analyst_score(estimates),
+                score=50,  # Scored for the whole universe in fetch()
                 confidence=0.85,
                 data=estimates,
                 timestamp=timestamp,
@@ -226,14 +531,19 @@ class EODHDProvider(DataSource):
             signals.append(signal)
 
         # Fetch recent historical prices (last 30 days)
-        to_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        from_date = (datetime.now(timezone.utc) - timedelta(days=30)).strftime("%Y-%m-%d")
-        prices = await self.fetch_historical_prices(eodhd_ticker, from_date, to_date)
+        prices = {}
+        if plan.includes("prices"):
+            # A bulk last-day bar already covers the latest trading day, so
+            # the window ends there instead of asking /eod for today
+            to_date = prices_to or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            from_date = (datetime.now(timezone.utc) - timedelta(days=30)).strftime("%Y-%m-%d")
+            # (served from the local history; only missing days are requested)
+            prices = await self.fetch_historical_prices(eodhd_ticker, from_date, to_date)
         if prices:
             signal = Signal(
                 ticker=ticker,
                 signal_type="PRICE_DATA",
-                score=self._calculate_price_score(prices),
+                score=50,  # Scored for the whole universe in fetch()
                 confidence=0.95,
                 data=prices,
                 timestamp=timestamp,
@@ -252,6 +562,11 @@ class EODHDProvider(DataSource):
         """
         Fetch historical OHLCV data for a ticker.
 
+        Bars are served from the local price history store. Only the date
+        ranges the store does not yet cover are requested from EODHD and
+        appended, so rolling windows and long lookbacks cost no extra calls
+        once the history is backfilled.
+
         Args:
             ticker: EODHD ticker (e.g., "VOD.LSE")
             from_date: Start date (YYYY-MM-DD)
@@ -260,103 +575,198 @@ class EODHDProvider(DataSource):
         Returns:
             Dictionary with price data or empty dict if fetch fails
         """
-        cache_key = f"{ticker}:prices:{from_date}:{to_date}"
+        missing_ranges = self.price_store.missing_ranges(ticker, from_date, to_date)
+        if not missing_ranges:
+            logger.debug("eodhd_price_history_hit", ticker=ticker, from_date=from_date, to_date=to_date)
+
+        for gap_from, gap_to in missing_ranges:
+            # Concurrent callers missing the same range share one request
+            fetched = await self._single_flight.do(
+                f"{ticker}:eod:{gap_from}:{gap_to}",
+                lambda gap_from=gap_from, gap_to=gap_to: self._fetch_price_gap(ticker, gap_from, gap_to)
+            )
+            if not fetched:
+                return {}
+
+        series = self.price_store.get_series(ticker, from_date, to_date)
+        if not len(series):
+            return {}
+
+        return self._build_price_data(from_date, to_date, series)
+
+    async def _fetch_price_gap(self, ticker: str, gap_from: str, gap_to: str) -> bool:
+        """
+        Download one missing date range and append it to the price history.
+
+        Args:
+            ticker: EODHD ticker (e.g., "VOD.LSE")
+            gap_from: Start date of the missing range (YYYY-MM-DD)
+            gap_to: End date of the missing range (YYYY-MM-DD)
+
+        Returns:
+            True if the range is now covered, False if fetch fails
+
+        Raises:
+            EODHDRateLimitExceeded: If the daily rate limit is exhausted
+        """
+        # Another request may have filled the range while this one waited
+        if not self.price_store.missing_ranges(ticker, gap_from, gap_to):
+            return True
+
+        # Check rate limit
+        if not self._check_rate_limit():
+            raise EODHDRateLimitExceeded("Daily rate limit exceeded")
+
+        url = f"{self.BASE_URL}/eod/{ticker}"
+        params = {
+            "api_token": self.api_key,
+            "from": gap_from,
+            "to": gap_to,
+            "fmt": "json"
+        }
+
+        try:
+            response = await self._make_request_with_retry(url, params)
+            if response is None:
+                return False
+
+            # Parse OHLCV data and append to history
+            bars = [self._parse_price_bar(item) for item in response]
+            self.price_store.add_bars(ticker, bars, gap_from, coverage_end(gap_to, bars))
+
+        except Exception as e:
+            logger.error(
+                "eodhd_fetch_prices_error",
+                ticker=ticker,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return False
+
+        logger.info(
+            "eodhd_prices_fetched",
+            ticker=ticker,
+            data_points=len(bars),
+            from_date=gap_from,
+            to_date=gap_to
+        )
+        return True
+
+    async def fetch_bulk_last_day(
+        self,
+        exchange: Optional[str] = None,
+        max_age_hours: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the latest end-of-day bar for every symbol on an exchange.
+
+        Uses EODHD's exchange-level /eod-bulk-last-day endpoint, so one API
+        call refreshes prices for the whole universe. Bars are merged into
+        the price history store; per-ticker /eod requests are then only
+        needed to backfill gaps.
+
+        Args:
+            exchange: Exchange code (default: EXCHANGE_CODE, "LSE")
+            max_age_hours: Maximum age of cached bars (default: the
+                           "prices" cache TTL)
+
+        Returns:
+            Dictionary mapping EODHD ticker (e.g., "VOD.LSE") to its latest
+            bar, or empty dict if fetch fails
+        """
+        exchange = exchange or self.EXCHANGE_CODE
+        cache_key = f"{exchange}:bulk_last_day"
 
         # Check cache first
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = self._get_from_cache(
+            cache_key,
+            refresh=lambda: self._download_bulk_last_day(exchange, cache_key),
+            ttl_hours=(
+                self.cache_ttl_hours_by_type["prices"] if max_age_hours is None else max_age_hours
+            )
+        )
         if cached_data is not None:
-            logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="prices")
+            logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="bulk_last_day")
             return cached_data
 
+        return await self._single_flight.do(
+            cache_key, lambda: self._download_bulk_last_day(exchange, cache_key)
+        )
+
+    async def _download_bulk_last_day(self, exchange: str, cache_key: str) -> Dict[str, Dict[str, Any]]:
+        """Download, store and cache the exchange's latest bars (cache miss path)."""
         # Check rate limit
         if not self._check_rate_limit():
             raise EODHDRateLimitExceeded("Daily rate limit exceeded")
 
-        url = f"{self.BASE_URL}/eod/{ticker}"
+        url = f"{self.BASE_URL}/eod-bulk-last-day/{exchange}"
         params = {
             "api_token": self.api_key,
-            "from": from_date,
-            "to": to_date,
             "fmt": "json"
         }
 
         try:
             response = await self._make_request_with_retry(url, params)
-            if not response:
+            if not response or not isinstance(response, list):
                 return {}
 
-            # Parse OHLCV data
-            price_data = {
-                "from_date": from_date,
-                "to_date": to_date,
-                "data_points": len(response),
-                "prices": []
-            }
-
+            latest_bars = {}
             for item in response:
-                # Handle pence/pounds conversion for UK stocks
-                price_data["prices"].append({
-                    "date": item.get("date"),
-                    "open": self._convert_pence_to_pounds(item.get("open", 0)),
-                    "high": self._convert_pence_to_pounds(item.get("high", 0)),
-                    "low": self._convert_pence_to_pounds(item.get("low", 0)),
-                    "close": self._convert_pence_to_pounds(item.get("close", 0)),
-                    "adjusted_close": self._convert_pence_to_pounds(item.get("adjusted_close", 0)),
-                    "volume": item.get("volume", 0)
-                })
-
-            # Calculate summary statistics
-            if price_data["prices"]:
-                closes = [p["close"] for p in price_data["prices"]]
-                price_data["latest_price"] = closes[-1]
-                price_data["price_change_30d"] = ((closes[-1] - closes[0]) / closes[0] * 100) if closes[0] > 0 else 0
-                price_data["avg_volume_30d"] = sum(p["volume"] for p in price_data["prices"]) / len(price_data["prices"])
+                code = item.get("code")
+                if not code or not item.get("date"):
+                    continue
+                latest_bars[f"{code}.{exchange}"] = self._parse_price_bar(item)
+
+            # Merge into history in one transaction
+            self.price_store.add_many(
+                (ticker, [bar], bar["date"], bar["date"])
+                for ticker, bar in latest_bars.items()
+            )
 
             # Cache the result
-            self._add_to_cache(cache_key, price_data)
+            self._add_to_cache(cache_key, latest_bars)
 
             logger.info(
-                "eodhd_prices_fetched",
-                ticker=ticker,
-                data_points=len(response),
-                from_date=from_date,
-                to_date=to_date
+                "eodhd_bulk_last_day_fetched",
+                exchange=exchange,
+                symbols=len(latest_bars)
             )
 
-            return price_data
+            return latest_bars
 
         except Exception as e:
             logger.error(
-                "eodhd_fetch_prices_error",
-                ticker=ticker,
+                "eodhd_fetch_bulk_last_day_error",
+                exchange=exchange,
                 error=str(e),
                 error_type=type(e).__name__
             )
             return {}
 
-    async def fetch_fundamentals(self, ticker: str) -> Dict[str, Any]:
+    async def fetch_exchange_symbols(self, exchange: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Fetch fundamental data (income statement, balance sheet, cash flow, ratios).
+        Fetch the list of symbols traded on an exchange.
+
+        One /exchange-symbol-list/{exchange} request returns the whole
+        universe (used by the weekly stocks table sync).
 
         Args:
-            ticker: EODHD ticker (e.g., "VOD.LSE")
+            exchange: Exchange code (default: EXCHANGE_CODE, "LSE")
 
         Returns:
-            Dictionary with fundamental data or empty dict if fetch fails
-        """
-        cache_key = f"{ticker}:fundamentals"
+            Symbol records (Code, Name, Country, Exchange, Currency, Type,
+            Isin), or empty list if fetch fails
 
-        # Check cache first
-        cached_data = self._get_from_cache(cache_key)
-        if cached_data is not None:
-            logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="fundamentals")
-            return cached_data
+        Raises:
+            EODHDRateLimitExceeded: If the daily rate limit is exhausted
+        """
+        exchange = exchange or self.EXCHANGE_CODE
 
         # Check rate limit
         if not self._check_rate_limit():
             raise EODHDRateLimitExceeded("Daily rate limit exceeded")
 
-        url = f"{self.BASE_URL}/fundamentals/{ticker}"
+        url = f"{self.BASE_URL}/exchange-symbol-list/{exchange}"
         params = {
             "api_token": self.api_key,
             "fmt": "json"
@@ -364,9 +774,104 @@ class EODHDProvider(DataSource):
 
         try:
             response = await self._make_request_with_retry(url, params)
-            if not response:
-                return {}
+        except EODHDRateLimitExceeded:
+            raise
+        except Exception as e:
+            logger.error(
+                "eodhd_fetch_exchange_symbols_error",
+                exchange=exchange,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return []
+
+        if not isinstance(response, list):
+            return []
+
+        logger.info("eodhd_exchange_symbols_fetched", exchange=exchange, symbols=len(response))
+        return response
+
+    def _parse_price_bar(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse one EODHD OHLCV item, handling pence/pounds conversion."""
+        return {
+            "date": item.get("date"),
+            "open": self._convert_pence_to_pounds(item.get("open", 0)),
+            "high": self._convert_pence_to_pounds(item.get("high", 0)),
+            "low": self._convert_pence_to_pounds(item.get("low", 0)),
+            "close": self._convert_pence_to_pounds(item.get("close", 0)),
+            "adjusted_close": self._convert_pence_to_pounds(item.get("adjusted_close", 0)),
+            "volume": item.get("volume", 0)
+        }
+
+    def _build_price_data(
+        self,
+        from_date: str,
+        to_date: str,
+        series: PriceSeries
+    ) -> Dict[str, Any]:
+        """
+        Build the PRICE_DATA payload (bars plus summary statistics).
 
+        "prices" holds the columnar PriceSeries; it is converted to JSON
+        records only at the serialization boundary (the database engine's
+        json_serializer).
+        """
+        price_data = {
+            "from_date": from_date,
+            "to_date": to_date,
+            "data_points": len(series),
+            "prices": series
+        }
+
+        # Calculate summary statistics (vectorised)
+        if len(series):
+            price_data["latest_price"] = series.latest_price
+            price_data["price_change_30d"] = series.price_change_pct()
+            price_data["avg_volume_30d"] = series.average_volume()
+
+        return price_data
+
+    async def fetch_fundamentals(
+        self,
+        ticker: str,
+        max_age_hours: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch fundamental data (income statement, balance sheet, cash flow, ratios).
+
+        Derived from the shared fundamentals payload (see
+        _fetch_fundamentals_payload), so it costs no extra API call when the
+        profile or analyst estimates for the same ticker are also requested.
+
+        Args:
+            ticker: EODHD ticker (e.g., "VOD.LSE")
+            max_age_hours: Maximum age of cached data (default: the
+                           "fundamentals" cache TTL)
+
+        Returns:
+            Dictionary with fundamental data or empty dict if fetch fails
+        """
+        cache_key = f"{ticker}:fundamentals"
+        ttl_hours = (
+            self.cache_ttl_hours_by_type["fundamentals"] if max_age_hours is None else max_age_hours
+        )
+
+        # Check cache first
+        cached_data = self._get_from_cache(
+            cache_key,
+            refresh=lambda: self._revalidate_fundamentals(ticker),
+            refresh_key=f"{ticker}:fundamentals_payload",
+            ttl_hours=ttl_hours
+        )
+        if cached_data is not None:
+            logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="fundamentals")
+            return cached_data
+
+        response = await self._fetch_fundamentals_payload(ticker, ttl_hours)
+        if not response:
+            return {}
+
+        try:
             # Extract all available fundamental data
             # Store ALL metrics as per AC #1 - don't filter
             fundamentals = {
@@ -384,7 +889,12 @@ class EODHDProvider(DataSource):
                 "holders": response.get("Holders", {}),
                 "esg_scores": response.get("ESGScores", {}),
                 "outstanding_shares": response.get("outstandingShares", {}),
-                "raw_response": response  # Store complete raw response for future use
+                # Fundamentals document as decoded (projected when
+                # projected_decode is on), stored once outside cache and
+                # signals; reuses the ref recorded at download
+                "raw_response_ref": (
+                    self._fundamentals_payload_ref(ticker) or self.payload_store.put(response)
+                )
             }
 
             # Extract key financial ratios for easy access
@@ -427,39 +937,45 @@ class EODHDProvider(DataSource):
             )
             return {}
 
-    async def fetch_company_profile(self, ticker: str) -> Dict[str, Any]:
+    async def fetch_company_profile(
+        self,
+        ticker: str,
+        max_age_hours: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Fetch company profile (sector, industry, market cap, description).
 
+        Derived from the shared fundamentals payload's General section.
+
         Args:
             ticker: EODHD ticker (e.g., "VOD.LSE")
+            max_age_hours: Maximum age of cached data (default: the
+                           "profile" cache TTL)
 
         Returns:
             Dictionary with company profile or empty dict if fetch fails
         """
         cache_key = f"{ticker}:profile"
+        ttl_hours = (
+            self.cache_ttl_hours_by_type["profile"] if max_age_hours is None else max_age_hours
+        )
 
         # Check cache first
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = self._get_from_cache(
+            cache_key,
+            refresh=lambda: self._revalidate_fundamentals(ticker),
+            refresh_key=f"{ticker}:fundamentals_payload",
+            ttl_hours=ttl_hours
+        )
         if cached_data is not None:
             logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="profile")
             return cached_data
 
-        # Check rate limit
-        if not self._check_rate_limit():
-            raise EODHDRateLimitExceeded("Daily rate limit exceeded")
-
-        url = f"{self.BASE_URL}/fundamentals/{ticker}"
-        params = {
-            "api_token": self.api_key,
-            "fmt": "json"
-        }
+        response = await self._fetch_fundamentals_payload(ticker, ttl_hours)
+        if not response:
+            return {}
 
         try:
-            response = await self._make_request_with_retry(url, params)
-            if not response:
-                return {}
-
             # Extract General section
             general = response.get("General", {})
             if not general:
@@ -514,65 +1030,65 @@ class EODHDProvider(DataSource):
             )
             return {}
 
-    async def fetch_analyst_estimates(self, ticker: str) -> Dict[str, Any]:
+    async def fetch_analyst_estimates(
+        self,
+        ticker: str,
+        max_age_hours: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Fetch analyst estimates (EPS, revenue consensus, number of analysts).
 
+        Derived from the shared fundamentals payload's AnalystRatings section.
+
         Args:
             ticker: EODHD ticker (e.g., "VOD.LSE")
+            max_age_hours: Maximum age of cached data (default: the
+                           "estimates" cache TTL)
 
         Returns:
             Dictionary with analyst estimates or empty dict if fetch fails
         """
         cache_key = f"{ticker}:estimates"
+        ttl_hours = (
+            self.cache_ttl_hours_by_type["estimates"] if max_age_hours is None else max_age_hours
+        )
 
         # Check cache first
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = self._get_from_cache(
+            cache_key,
+            refresh=lambda: self._revalidate_fundamentals(ticker),
+            refresh_key=f"{ticker}:fundamentals_payload",
+            ttl_hours=ttl_hours
+        )
         if cached_data is not None:
             logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="estimates")
             return cached_data
 
-        # Check rate limit
-        if not self._check_rate_limit():
-            raise EODHDRateLimitExceeded("Daily rate limit exceeded")
-
-        # Try to get analyst ratings from fundamentals endpoint
-        url = f"{self.BASE_URL}/fundamentals/{ticker}"
-        params = {
-            "api_token": self.api_key,
-            "filter": "AnalystRatings::Rating",
-            "fmt": "json"
-        }
+        response = await self._fetch_fundamentals_payload(ticker, ttl_hours)
+        if not response:
+            logger.info(
+                "eodhd_no_analyst_coverage",
+                ticker=ticker,
+                message="No analyst coverage available"
+            )
+            return {}
 
         try:
-            response = await self._make_request_with_retry(url, params)
-            if not response:
-                logger.info(
-                    "eodhd_no_analyst_coverage",
-                    ticker=ticker,
-                    message="No analyst coverage available"
-                )
-                return {}
+            analyst_data = response.get("AnalystRatings", {})
 
-            # Handle different response formats
-            # Sometimes EODHD returns just a value when using filter, not a dict
-            if not isinstance(response, dict):
+            # Sometimes EODHD returns just the rating value, not a detailed object
+            if isinstance(analyst_data, (int, float)):
                 logger.info(
                     "eodhd_simple_rating_response",
                     ticker=ticker,
-                    response_type=type(response).__name__,
+                    response_type=type(analyst_data).__name__,
                     message="Analyst data returned as simple value, not detailed object"
                 )
-                # If it's just a number, create minimal estimates
-                if isinstance(response, (int, float)):
-                    return {
-                        "rating": response,
-                        "total_analysts": 0,
-                        "consensus": "UNKNOWN"
-                    }
-                return {}
-
-            analyst_data = response.get("AnalystRatings", {})
+                return {
+                    "rating": analyst_data,
+                    "total_analysts": 0,
+                    "consensus": "UNKNOWN"
+                }
 
             # Handle case where AnalystRatings might be a simple value or empty
             if not analyst_data or not isinstance(analyst_data, dict):
@@ -593,7 +1109,7 @@ class EODHDProvider(DataSource):
                 "hold": analyst_data.get("Hold", 0),
                 "sell": analyst_data.get("Sell", 0),
                 "strong_sell": analyst_data.get("StrongSell", 0),
-                "raw_response": analyst_data
+                "raw_response_ref": self.payload_store.put(analyst_data)
             }
 
             # Calculate total number of analysts
@@ -639,54 +1155,327 @@ class EODHDProvider(DataSource):
             )
             return {}
 
+    async def _fetch_fundamentals_payload(
+        self,
+        ticker: str,
+        max_age_hours: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the full fundamentals document for a ticker.
+
+        Fundamentals, company profile and analyst estimates are all views of
+        the same /fundamentals/{ticker} document. The payload is downloaded
+        once per ticker per cache TTL and shared by every view, so a full
+        ticker refresh costs one fundamentals call instead of three. Views
+        requested concurrently on a cache miss wait for the same download.
+        The document itself lives only in the payload store; the cache
+        holds its content hash.
+
+        Args:
+            ticker: EODHD ticker (e.g., "VOD.LSE")
+            max_age_hours: Maximum age of the cached payload, i.e. the TTL
+                           of the view being built (default: cache_ttl_hours)
+
+        Returns:
+            Parsed fundamentals document, or None if fetch fails
+
+        Raises:
+            EODHDRateLimitExceeded: If the daily rate limit is exhausted
+        """
+        cache_key = f"{ticker}:fundamentals_payload"
+
+        # Check cache first
+        cached_ref = self._get_from_cache(
+            cache_key,
+            refresh=lambda: self._revalidate_fundamentals(ticker),
+            ttl_hours=max_age_hours
+        )
+        if cached_ref is not None:
+            payload = self.payload_store.get(cached_ref.get("raw_response_ref", ""))
+            if payload is not None:
+                logger.debug("eodhd_cache_hit", cache_key=cache_key, data_type="fundamentals_payload")
+                return payload
+
+        # Concurrent views of the same ticker share one download
+        return await self._single_flight.do(
+            cache_key, lambda: self._download_fundamentals_payload(ticker, cache_key)
+        )
+
+    async def _revalidate_fundamentals(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-download a ticker's fundamentals payload (background refresh).
+
+        Views derived from the old payload are dropped, so the next read
+        rebuilds them from the fresh payload without another request.
+        """
+        payload = await self._download_fundamentals_payload(ticker, f"{ticker}:fundamentals_payload")
+        if payload is not None:
+            self._invalidate_fundamentals_views(ticker)
+        return payload
+
+    def _fundamentals_payload_ref(self, ticker: str) -> Optional[str]:
+        """Payload store ref of a ticker's cached fundamentals payload, if any."""
+        cached_ref = self._cache.get(f"{ticker}:fundamentals_payload")
+        return cached_ref.get("raw_response_ref") if cached_ref else None
+
+    def _invalidate_fundamentals_views(self, ticker: str) -> None:
+        """Drop cached views derived from a ticker's replaced fundamentals payload."""
+        for view in ("fundamentals", "profile", "estimates"):
+            self._cache.delete(f"{ticker}:{view}")
+
+    async def _download_fundamentals_payload(self, ticker: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Download the fundamentals document, storing it once (cache miss path)."""
+        # Check rate limit
+        if not self._check_rate_limit():
+            raise EODHDRateLimitExceeded("Daily rate limit exceeded")
+
+        url = f"{self.BASE_URL}/fundamentals/{ticker}"
+        params = {
+            "api_token": self.api_key,
+            "fmt": "json"
+        }
+
+        projection = self.FUNDAMENTALS_PROJECTION if self.projected_decode else None
+
+        try:
+            response = await self._make_request_with_retry(url, params, projection=projection)
+        except Exception as e:
+            logger.error(
+                "eodhd_fetch_fundamentals_payload_error",
+                ticker=ticker,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return None
+
+        if not isinstance(response, dict):
+            return None
+
+        # Cache a reference to the stored payload (empty documents too, so
+        # views don't refetch them)
+        self._add_to_cache(cache_key, {"raw_response_ref": self.payload_store.put(response)})
+
+        return response
+
+    async def ingest_bulk_fundamentals(
+        self,
+        exchange: Optional[str] = None,
+        page_size: Optional[int] = None,
+        resume: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Ingest fundamentals for a whole exchange, one page at a time.
+
+        Pages through EODHD's /bulk-fundamentals/{exchange} endpoint with
+        offset/limit. Each page is written to the payload store and each
+        ticker's document referenced from the fundamentals cache (so later fetch_fundamentals,
+        fetch_company_profile and fetch_analyst_estimates calls are served
+        without a request) and then released, keeping memory flat for
+        whole-universe scans. Cached views built from a ticker's previous
+        payload are dropped. A page is only requested while the daily quota
+        covers its full cost (BULK_FUNDAMENTALS_CALL_COST).
+
+        After every page the next offset is checkpointed in the response
+        cache, so an interrupted scan resumes from the last completed page
+        (within the cache TTL; older pages are considered stale).
+
+        Args:
+            exchange: Exchange code (default: EXCHANGE_CODE, "LSE")
+            page_size: Tickers per page (default:
+                       config["bulk_fundamentals_page_size"] or 500)
+            resume: Continue from the checkpoint of an interrupted scan
+                    (default: True). False restarts from offset 0.
+
+        Returns:
+            Summary with exchange, start_offset, next_offset, pages, tickers
+            and complete (False if a page failed; rerun to resume)
+
+        Raises:
+            EODHDRateLimitExceeded: If the daily rate limit is exhausted
+                                    (the checkpoint is kept)
+        """
+        exchange = exchange or self.EXCHANGE_CODE
+        page_size = page_size or self.config.get("bulk_fundamentals_page_size", 500)
+        checkpoint_key = f"{exchange}:bulk_fundamentals_checkpoint"
+
+        checkpoint = self._get_from_cache(checkpoint_key) if resume else None
+        offset = checkpoint["next_offset"] if checkpoint else 0
+        summary = {
+            "exchange": exchange,
+            "start_offset": offset,
+            "next_offset": offset,
+            "pages": 0,
+            "tickers": 0,
+            "complete": False
+        }
+
+        if checkpoint:
+            logger.info("eodhd_bulk_fundamentals_resumed", exchange=exchange, offset=offset)
+
+        url = f"{self.BASE_URL}/bulk-fundamentals/{exchange}"
+
+        while True:
+            if not self._check_rate_limit(self.BULK_FUNDAMENTALS_CALL_COST):
+                raise EODHDRateLimitExceeded("Daily rate limit exceeded")
+
+            params = {
+                "api_token": self.api_key,
+                "offset": offset,
+                "limit": page_size,
+                "fmt": "json"
+            }
+
+            try:
+                page = await self._make_request_with_retry(
+                    url, params, cost=self.BULK_FUNDAMENTALS_CALL_COST
+                )
+            except EODHDRateLimitExceeded:
+                raise
+            except Exception as e:
+                logger.error(
+                    "eodhd_bulk_fundamentals_error",
+                    exchange=exchange,
+                    offset=offset,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                return summary
+
+            if page is None:
+                logger.warning("eodhd_bulk_fundamentals_page_failed", exchange=exchange, offset=offset)
+                return summary
+
+            records = page.values() if isinstance(page, dict) else page
+            count = 0
+            for record in records:
+                count += 1
+                code = (record.get("General") or {}).get("Code") if isinstance(record, dict) else None
+                if not code:
+                    continue
+                if self.projected_decode:
+                    record = project(record, self.FUNDAMENTALS_PROJECTION)
+                ticker = f"{code}.{exchange}"
+                self._add_to_cache(
+                    f"{ticker}:fundamentals_payload",
+                    {"raw_response_ref": self.payload_store.put(record)}
+                )
+                self._invalidate_fundamentals_views(ticker)
+                summary["tickers"] += 1
+            del page, records
+
+            offset += count
+            summary["pages"] += 1
+            summary["next_offset"] = offset
+
+            logger.info(
+                "eodhd_bulk_fundamentals_page",
+                exchange=exchange,
+                offset=offset - count,
+                records=count
+            )
+
+            if count < page_size:
+                break
+
+            self._cache.set(
+                checkpoint_key,
+                {"next_offset": offset},
+                ttl_seconds=self.cache_ttl_hours * 3600
+            )
+
+        self._cache.delete(checkpoint_key)
+        summary["complete"] = True
+
+        logger.info(
+            "eodhd_bulk_fundamentals_complete",
+            exchange=exchange,
+            pages=summary["pages"],
+            tickers=summary["tickers"]
+        )
+
+        return summary
+
     async def _make_request_with_retry(
         self,
         url: str,
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        projection: Optional[Projection] = None,
+        cost: int = 1
     ) -> Optional[Any]:
         """
-        Make HTTP request with exponential backoff retry logic.
+        Make HTTP request with jittered backoff retry logic (see RetryEngine).
 
         Retries on:
-        - 429 (rate limit)
+        - 429 (rate limit), waiting at least the Retry-After hint
         - 5xx (server errors)
+        - Timeouts and network errors
 
         Does NOT retry on:
         - 4xx (except 429) - client errors
 
+        Retries stop early when the process-wide retry budget is exhausted.
+
         Args:
             url: Request URL
             params: Query parameters
+            projection: Keys to decode from a JSON object response
+                        (default: decode the whole document)
+            cost: API calls the request counts against the daily quota
+                  (default: 1; bulk endpoints cost more)
 
         Returns:
             JSON response or None if all retries fail
+
+        Raises:
+            EODHDRateLimitExceeded: If the daily limit is exhausted or 429s
+                                    persist after retries
         """
-        retry_delays = [1, 3, 9]  # Exponential backoff: 1s, 3s, 9s
+        retry = self._retry.sequence()
 
-        for attempt in range(self.max_retries):
+        while True:
+            attempt = retry.attempt + 1
             try:
-                response = await self._client.get(url, params=params)
+                async with self._get_host_semaphore(url):
+                    # Re-check inside the slot: concurrent tickers must not
+                    # overshoot the daily quota between check and call
+                    if not self._check_rate_limit(cost):
+                        raise EODHDRateLimitExceeded("Daily rate limit exceeded")
 
-                # Track API call
-                self._api_call_count += 1
+                    # Shared token bucket: waits for per-second smoothing,
+                    # fails only when the shared daily quota cannot cover
+                    # the request's full cost
+                    if self.rate_limiter is not None:
+                        if not await self.rate_limiter.acquire(cost=cost):
+                            raise EODHDRateLimitExceeded("Shared daily rate limit exceeded")
+
+                    # Track API call
+                    self._api_call_count += cost
+
+                    response = await self._http.get(url, params=params)
 
                 # Success
                 if response.status_code == 200:
+                    if projection is not None:
+                        return decode_projected(response.content, projection)
                     return response.json()
 
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
                 # Rate limit - retry
                 if response.status_code == 429:
                     logger.warning(
                         "eodhd_rate_limit",
                         url=url,
-                        attempt=attempt + 1,
-                        max_retries=self.max_retries
+                        attempt=attempt,
+                        max_retries=self.max_retries,
+                        retry_after=retry_after
                     )
-                    if attempt < self.max_retries - 1:
-                        delay = retry_delays[attempt]
-                        await asyncio.sleep(delay)
+                    if await retry.backoff(retry_after):
                         continue
-                    raise EODHDRateLimitExceeded("Rate limit exceeded after retries")
+                    raise EODHDRateLimitExceeded(
+                        "Rate limit exceeded after retries",
+                        retry_after=retry_after
+                    )
 
                 # Server error - retry
                 if response.status_code >= 500:
@@ -694,12 +1483,10 @@ class EODHDProvider(DataSource):
                         "eodhd_server_error",
                         status_code=response.status_code,
                         url=url,
-                        attempt=attempt + 1,
+                        attempt=attempt,
                         max_retries=self.max_retries
                     )
-                    if attempt < self.max_retries - 1:
-                        delay = retry_delays[attempt]
-                        await asyncio.sleep(delay)
+                    if await retry.backoff(retry_after):
                         continue
                     return None
 
@@ -716,12 +1503,10 @@ class EODHDProvider(DataSource):
                 logger.warning(
                     "eodhd_timeout",
                     url=url,
-                    attempt=attempt + 1,
+                    attempt=attempt,
                     max_retries=self.max_retries
                 )
-                if attempt < self.max_retries - 1:
-                    delay = retry_delays[attempt]
-                    await asyncio.sleep(delay)
+                if await retry.backoff():
                     continue
                 return None
 
@@ -735,20 +1520,33 @@ class EODHDProvider(DataSource):
                     error=str(e),
                     error_type=type(e).__name__,
                     url=url,
-                    attempt=attempt + 1
+                    attempt=attempt
                 )
-                if attempt < self.max_retries - 1:
-                    delay = retry_delays[attempt]
-                    await asyncio.sleep(delay)
+                if await retry.backoff():
                     continue
                 return None
 
-        return None
-
-    def _check_rate_limit(self) -> bool:
+    @property
+    def _http(self) -> HTTPPool:
+        """HTTP pool for the next request (the shared pool unless injected)."""
+        return self._http_pool or get_http_pool()
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get (or create) the in-flight request semaphore for a URL's host."""
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _check_rate_limit(self, cost: int = 1) -> bool:
         """
         Check if rate limit allows more API calls.
 
+        Args:
+            cost: API calls the next request is billed (default: 1)
+
         Returns:
             True if call is allowed, False if rate limit exceeded
         """
@@ -771,7 +1569,7 @@ class EODHDProvider(DataSource):
             )
 
         # Check if limit exceeded
-        if self._api_call_count >= self.rate_limit_per_day:
+        if self._api_call_count + cost > self.rate_limit_per_day:
             logger.error(
                 "eodhd_rate_limit_exceeded",
                 current_calls=self._api_call_count,
@@ -779,42 +1577,102 @@ class EODHDProvider(DataSource):
             )
             return False
 
+        # Check the budget shared with other providers and processes
+        remaining = self.rate_limiter.daily_remaining() if self.rate_limiter is not None else None
+        if remaining is not None and remaining < cost:
+            logger.error(
+                "eodhd_shared_rate_limit_exceeded",
+                limiter=self.rate_limiter.name,
+                limit=self.rate_limiter.policy.daily_quota
+            )
+            return False
+
         return True
 
-    def _get_from_cache(self, key: str) -> Optional[Any]:
-        """Get data from cache if not expired."""
-        if key not in self._cache:
-            return None
+    def _get_from_cache(
+        self,
+        key: str,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+        refresh_key: Optional[str] = None,
+        ttl_hours: Optional[float] = None
+    ) -> Optional[Any]:
+        """
+        Get data from cache (stale-while-revalidate).
+
+        Entries past the hard TTL are not returned. Entries past the soft
+        TTL are still returned, and refresh, if given, is scheduled in the
+        background so the caller does not wait.
+
+        Args:
+            key: Cache key
+            refresh: Coroutine function re-fetching the entry
+            refresh_key: Request key of the refresh (default: key); a
+                         refresh is not started while one is in flight
+            ttl_hours: Soft TTL of the entry's data type (default:
+                       cache_ttl_hours); the hard TTL adds the stale window
 
-        # Check if cache entry is still valid
-        cached_time = self._cache_timestamps.get(key)
-        if cached_time is None:
+        Returns:
+            Cached data, or None if missing or past the hard TTL
+        """
+        entry = self._cache.get_entry(key)
+        if entry is None:
             return None
 
-        age = datetime.now(timezone.utc) - cached_time
-        if age.total_seconds() > self.cache_ttl_hours * 3600:
-            # Cache expired
-            logger.debug(
-                "eodhd_cache_expired",
-                cache_key=key,
-                age_hours=age.total_seconds() / 3600
-            )
-            del self._cache[key]
-            del self._cache_timestamps[key]
+        ttl_hours = self.cache_ttl_hours if ttl_hours is None else ttl_hours
+        if entry.age_seconds >= self._hard_ttl_hours(ttl_hours) * 3600:
             return None
 
-        return self._cache[key]
+        if refresh is not None and entry.age_seconds >= ttl_hours * 3600:
+            self._schedule_refresh(refresh_key or key, refresh, entry.age_seconds)
 
-    def _add_to_cache(self, key: str, data: Any) -> None:
-        """Add data to cache with timestamp."""
-        self._cache[key] = data
-        self._cache_timestamps[key] = datetime.now(timezone.utc)
-        logger.debug(
-            "eodhd_cache_add",
+        return entry.value
+
+    def _hard_ttl_hours(self, ttl_hours: float) -> float:
+        """Hard TTL for a soft TTL (the stale window is the same for all types)."""
+        return ttl_hours + self.cache_hard_ttl_hours - self.cache_ttl_hours
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        age_seconds: float
+    ) -> None:
+        """Start a deduplicated background refresh of a stale cache entry."""
+        if self._single_flight.in_flight(key):
+            return
+
+        if not self._check_rate_limit():
+            logger.warning("eodhd_cache_refresh_skipped", cache_key=key, reason="rate_limit")
+            return
+
+        logger.info(
+            "eodhd_cache_stale",
             cache_key=key,
-            ttl_hours=self.cache_ttl_hours
+            age_hours=round(age_seconds / 3600, 2)
         )
 
+        task = asyncio.ensure_future(self._single_flight.do(key, refresh))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished background refresh, logging its failure."""
+        self._refresh_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(
+                "eodhd_cache_refresh_failed",
+                error=str(error),
+                error_type=type(error).__name__
+            )
+
+    def _add_to_cache(self, key: str, data: Any) -> None:
+        """Add data to cache (freshness is checked per data type on read)."""
+        self._cache.set(key, data)
+        logger.debug("eodhd_cache_add", cache_key=key)
+
     def _get_cached_signals(self, ticker: str) -> List[Signal]:
         """Get all cached signals for a ticker."""
         cached_signals = []
@@ -823,12 +1681,15 @@ class EODHDProvider(DataSource):
         # Try to get cached data for each data type
         eodhd_ticker = self._format_ticker_for_api(ticker)
 
-        fundamentals = self._get_from_cache(f"{eodhd_ticker}:fundamentals")
+        fundamentals = self._get_from_cache(
+            f"{eodhd_ticker}:fundamentals",
+            ttl_hours=self.cache_ttl_hours_by_type["fundamentals"]
+        )
         if fundamentals:
             signal = Signal(
                 ticker=ticker,
                 signal_type="FUNDAMENTAL_DATA",
-                score=self._calculate_fundamental_score(fundamentals),
+                score=50,  # Scored for the whole universe in fetch()
                 confidence=0.7,  # Lower confidence for cached data
                 data={**fundamentals, "cached": True},
                 timestamp=timestamp,
@@ -887,7 +1748,8 @@ class EODHDProvider(DataSource):
         """
         Calculate signal score based on fundamental data.
 
-        Uses key metrics like P/E ratio, ROE, debt levels, earnings growth.
+        Single-ticker form of the universe scoring step (see
+        ScoringThresholds for the P/E, ROE, debt and earnings growth rules).
 
         Args:
             fundamentals: Fundamental data dictionary
@@ -895,49 +1757,12 @@ class EODHDProvider(DataSource):
         Returns:
             Score from 0-100
         """
-        score = 50  # Start neutral
-
-        key_metrics = fundamentals.get("key_metrics", {})
-
-        # P/E ratio scoring (lower is better for value)
-        pe_ratio = key_metrics.get("pe_ratio")
-        if pe_ratio:
-            if 0 < pe_ratio < 15:
-                score += 15  # Undervalued
-            elif 15 <= pe_ratio < 25:
-                score += 5  # Fair value
-
-        # ROE scoring (higher is better)
-        roe = key_metrics.get("roe")
-        if roe:
-            if roe > 15:
-                score += 10
-            elif roe > 10:
-                score += 5
-
-        # Debt to equity (lower is better)
-        debt_to_equity = key_metrics.get("debt_to_equity")
-        if debt_to_equity is not None:
-            if debt_to_equity < 0.5:
-                score += 10
-            elif debt_to_equity < 1.0:
-                score += 5
-
-        # Earnings growth
-        earnings_growth = key_metrics.get("quarterly_earnings_growth")
-        if earnings_growth:
-            if earnings_growth > 20:
-                score += 10
-            elif earnings_growth > 10:
-                score += 5
-
-        return max(0, min(100, int(score)))
+        metrics = UniverseMetrics.from_rows([{"fundamentals": fundamentals}])
+        return int(score_universe(metrics, self.scoring_thresholds).fundamental[0])
 
     def _calculate_price_score(self, prices: Dict[str, Any]) -> int:
         """
-        Calculate signal score based on price data.
-
-        Uses momentum, volume trends.
+        Calculate signal score based on price data (30-day momentum).
 
         Args:
             prices: Price data dictionary
@@ -945,26 +1770,12 @@ class EODHDProvider(DataSource):
         Returns:
             Score from 0-100
         """
-        score = 50  # Start neutral
-
-        # Price momentum
-        price_change = prices.get("price_change_30d", 0)
-        if price_change > 10:
-            score += 15
-        elif price_change > 5:
-            score += 10
-        elif price_change < -10:
-            score -= 15
-        elif price_change < -5:
-            score -= 10
-
-        return max(0, min(100, int(score)))
+        metrics = UniverseMetrics.from_rows([{"prices": prices}])
+        return int(score_universe(metrics, self.scoring_thresholds).price[0])
 
     def _calculate_analyst_score(self, estimates: Dict[str, Any]) -> int:
         """
-        Calculate signal score based on analyst estimates.
-
-        Uses consensus ratings and number of analysts.
+        Calculate signal score based on analyst consensus and its strength.
 
         Args:
             estimates: Analyst estimates dictionary
@@ -972,37 +1783,42 @@ class EODHDProvider(DataSource):
         Returns:
             Score from 0-100
         """
-        score = 50  # Start neutral
+        metrics = UniverseMetrics.from_rows([{"estimates": estimates}])
+        return int(score_universe(metrics, self.scoring_thresholds).analyst[0])
 
-        total_analysts = estimates.get("total_analysts", 0)
-        if total_analysts == 0:
-            return score  # No coverage, neutral score
+    def get_raw_response(self, ref: str) -> Optional[Any]:
+        """
+        Load a raw API payload referenced by a "raw_response_ref" field.
 
-        # Score based on consensus
-        consensus = estimates.get("consensus", "NEUTRAL")
-        if consensus == "BULLISH":
-            score += 20
-        elif consensus == "BEARISH":
-            score -= 20
+        Args:
+            ref: Content hash from fundamentals or analyst estimates data
 
-        # Adjust based on strength of consensus
-        strong_buy = estimates.get("strong_buy", 0)
-        strong_sell = estimates.get("strong_sell", 0)
+        Returns:
+            Raw payload, or None if not in the payload store
+        """
+        return self.payload_store.get(ref)
 
-        if total_analysts > 0:
-            strong_buy_pct = (strong_buy / total_analysts) * 100
-            strong_sell_pct = (strong_sell / total_analysts) * 100
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """Get retry counters (retries, budget exhaustion, Retry-After waits)."""
+        return self._retry.stats()
 
-            if strong_buy_pct > 50:
-                score += 15
-            elif strong_sell_pct > 50:
-                score -= 15
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache hit/miss/eviction counters and tier sizes."""
+        return self._cache.stats()
 
-        return max(0, min(100, int(score)))
+    def get_single_flight_stats(self) -> Dict[str, Any]:
+        """Get request deduplication counters (calls, shared, in flight)."""
+        return self._single_flight.stats()
 
     async def close(self):
-        """Close HTTP client connection."""
-        await self._client.aclose()
+        """
+        Release provider resources.
+
+        The borrowed HTTP pool stays open for other providers; it is closed
+        by the application lifespan (see close_http_pool).
+        """
+        for task in list(self._refresh_tasks):
+            task.cancel()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,83 @@
+"""
+Value-based allocation of scarce provider quota.
+
+When a provider cannot fetch every requested ticker (e.g., Alpha Vantage's
+25 calls per day), calls go to held positions first, then watchlist
+entries, then the tickers whose data is stalest.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AbstractSet, List, Mapping, Optional, Tuple
+
+
+# Sort key for tickers with no recorded update: staler than any real one
+_NEVER = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class TickerPriorities:
+    """
+    What the portfolio cares about, for quota allocation.
+
+    Attributes:
+        held: Tickers with open portfolio positions
+        watchlist: Tickers on the (unexpired) watchlist
+        last_updated: ticker -> time its data was last refreshed; tickers
+                      missing here are treated as never refreshed
+    """
+    held: AbstractSet[str] = frozenset()
+    watchlist: AbstractSet[str] = frozenset()
+    last_updated: Mapping[str, datetime] = field(default_factory=dict)
+
+    def tier(self, ticker: str) -> int:
+        """Priority tier: 0 held, 1 watchlist, 2 everything else."""
+        if ticker in self.held:
+            return 0
+        if ticker in self.watchlist:
+            return 1
+        return 2
+
+    def staleness_key(self, ticker: str) -> datetime:
+        """Last refresh time, oldest (or never) sorting first."""
+        updated = self.last_updated.get(ticker)
+        if updated is None:
+            return _NEVER
+        if updated.tzinfo is None:
+            return updated.replace(tzinfo=timezone.utc)
+        return updated
+
+
+def allocate_quota(
+    tickers: List[str],
+    budget: int,
+    priorities: Optional[TickerPriorities] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Choose which tickers to spend a limited call budget on.
+
+    Tickers are ranked by tier (held, watchlist, other), then by staleness
+    (stalest first), then by request order. Duplicates are dropped.
+
+    Args:
+        tickers: Requested tickers
+        budget: Calls available
+        priorities: Portfolio priorities (None: keep request order)
+
+    Returns:
+        Tuple of (selected tickers in priority order, skipped tickers)
+    """
+    unique = list(dict.fromkeys(tickers))
+    if priorities is not None:
+        ranked = sorted(
+            enumerate(unique),
+            key=lambda item: (
+                priorities.tier(item[1]),
+                priorities.staleness_key(item[1]),
+                item[0]
+            )
+        )
+        unique = [ticker for _, ticker in ranked]
+
+    budget = max(0, budget)
+    return unique[:budget], unique[budget:]
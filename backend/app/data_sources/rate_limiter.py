@@ -0,0 +1,353 @@
+"""
+Shared, persisted rate limiting for data providers.
+
+Implements a token bucket (per-second smoothing with a burst allowance)
+combined with a daily quota. State lives in a local SQLite database, so every
+provider instance and worker process that uses the same store and limiter
+name draws from one budget, and the budget survives restarts.
+"""
+
+import asyncio
+import math
+import sqlite3
+import structlog
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    Rate limit policy for one provider.
+
+    Attributes:
+        daily_quota: Maximum calls per UTC day (None = unlimited)
+        calls_per_second: Sustained refill rate of the token bucket
+                          (None = no per-second smoothing)
+        burst: Token bucket capacity, i.e. calls allowed back-to-back
+               before smoothing applies
+    """
+    daily_quota: Optional[int] = None
+    calls_per_second: Optional[float] = None
+    burst: int = 1
+
+    @classmethod
+    def from_config(cls, provider_config: Dict[str, Any]) -> "RateLimitPolicy":
+        """
+        Build a policy from a provider section of data_sources.yaml.
+
+        Reads rate_limit (calls per day), rate_limit_per_second and
+        rate_limit_burst.
+
+        Args:
+            provider_config: Provider configuration dictionary
+
+        Returns:
+            RateLimitPolicy for the provider
+        """
+        calls_per_second = provider_config.get("rate_limit_per_second")
+        return cls(
+            daily_quota=provider_config.get("rate_limit"),
+            calls_per_second=calls_per_second,
+            burst=provider_config.get(
+                "rate_limit_burst",
+                max(1, math.ceil(calls_per_second)) if calls_per_second else 1
+            )
+        )
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter with a daily quota, persisted in SQLite.
+
+    Each acquisition runs in an immediate SQLite transaction, so concurrent
+    processes sharing the database file cannot overspend the budget. Within
+    a process the connection is guarded by a lock, so the limiter may also
+    be used from worker threads (e.g. synchronous client libraries).
+
+    Example:
+        >>> limiter = get_rate_limiter(
+        ...     "eodhd",
+        ...     RateLimitPolicy(daily_quota=100000, calls_per_second=16, burst=50),
+        ...     path="data/rate_limits.sqlite3"
+        ... )
+        >>> if await limiter.acquire():
+        ...     response = await client.get(url)
+        >>> limiter.available_now()  # calls that can be made right now
+        49
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: RateLimitPolicy,
+        path: Union[str, Path] = ":memory:"
+    ):
+        """
+        Initialize limiter and its backing table.
+
+        Args:
+            name: Budget name shared by all users of the same quota
+                  (e.g., "eodhd")
+            policy: Rate limit policy
+            path: SQLite database path, or ":memory:" for a process-local
+                  limiter (default)
+        """
+        self.name = name
+        self.policy = policy
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                day TEXT NOT NULL,
+                day_count INTEGER NOT NULL
+            )
+            """
+        )
+
+    async def acquire(
+        self,
+        calls: int = 1,
+        max_wait: Optional[float] = None,
+        cost: Optional[int] = None
+    ) -> bool:
+        """
+        Acquire calls, waiting for the token bucket to refill if needed.
+
+        Args:
+            calls: Number of calls to acquire (default: 1)
+            max_wait: Maximum seconds to wait for tokens (None = no limit)
+            cost: Daily quota units the calls use, for endpoints billed
+                  above one unit per call (default: calls). Checked and
+                  spent together with the tokens
+
+        Returns:
+            True if acquired, False if the daily quota is exhausted or the
+            wait would exceed max_wait
+        """
+        waited = 0.0
+        while True:
+            acquired, wait_seconds = self._try_acquire(calls, cost)
+            if acquired:
+                return True
+            if wait_seconds is None:
+                return False
+            if max_wait is not None and waited + wait_seconds > max_wait:
+                return False
+
+            await asyncio.sleep(wait_seconds)
+            waited += wait_seconds
+
+    def try_acquire(self, calls: int = 1, cost: Optional[int] = None) -> bool:
+        """
+        Acquire calls only if available immediately.
+
+        Args:
+            calls: Number of calls to acquire (default: 1)
+            cost: Daily quota units the calls use (default: calls)
+
+        Returns:
+            True if acquired, False otherwise
+        """
+        acquired, _ = self._try_acquire(calls, cost)
+        return acquired
+
+    def record(self, calls: int = 1) -> None:
+        """
+        Record calls made without acquiring first (e.g., by a synchronous
+        client library). Tokens may go negative, delaying later acquisitions.
+
+        Args:
+            calls: Number of calls made (default: 1)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens, day_count, now, today = self._load(for_update=True)
+                self._save(tokens - calls, now, today, day_count + calls)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def available_now(self) -> int:
+        """
+        Get the number of calls that can be made right now without waiting.
+
+        Returns:
+            Calls available now (bounded by both bucket and daily quota;
+            sys.maxsize if the budget is unlimited)
+        """
+        tokens, day_count = self._read_state()
+        available = math.inf if self.policy.calls_per_second is None else math.floor(tokens)
+        if self.policy.daily_quota is not None:
+            available = min(available, self.policy.daily_quota - day_count)
+        if available == math.inf:
+            return sys.maxsize
+        return max(0, int(available))
+
+    def daily_remaining(self) -> Optional[int]:
+        """
+        Get calls remaining in today's quota.
+
+        Returns:
+            Remaining calls today, or None if there is no daily quota
+        """
+        if self.policy.daily_quota is None:
+            return None
+        _, day_count = self._read_state()
+        return max(0, self.policy.daily_quota - day_count)
+
+    def daily_used(self) -> int:
+        """Get calls made today (UTC) against this budget."""
+        _, day_count = self._read_state()
+        return day_count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get current limiter state for schedulers and health reporting.
+
+        Returns:
+            Dictionary with name, policy and current availability
+        """
+        return {
+            "name": self.name,
+            "daily_quota": self.policy.daily_quota,
+            "daily_used": self.daily_used(),
+            "daily_remaining": self.daily_remaining(),
+            "calls_per_second": self.policy.calls_per_second,
+            "burst": self.policy.burst,
+            "available_now": self.available_now()
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _try_acquire(self, calls: int, cost: Optional[int] = None) -> Tuple[bool, Optional[float]]:
+        """
+        Atomically refill, check and spend tokens and daily quota.
+
+        Returns:
+            Tuple of (acquired, seconds_to_wait). seconds_to_wait is None
+            when waiting cannot help (daily quota exhausted or the request
+            exceeds the burst size).
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens, day_count, now, today = self._load(for_update=True)
+                cost = calls if cost is None else cost
+
+                quota = self.policy.daily_quota
+                if quota is not None and day_count + cost > quota:
+                    self._conn.execute("COMMIT")
+                    logger.warning(
+                        "rate_limit_daily_quota_exhausted",
+                        limiter=self.name,
+                        daily_quota=quota,
+                        daily_used=day_count
+                    )
+                    return False, None
+
+                rate = self.policy.calls_per_second
+                if rate is not None and tokens < calls:
+                    self._save(tokens, now, today, day_count)
+                    self._conn.execute("COMMIT")
+                    if calls > self.policy.burst:
+                        return False, None
+                    return False, (calls - tokens) / rate
+
+                self._save(tokens - calls, now, today, day_count + cost)
+                self._conn.execute("COMMIT")
+                return True, 0.0
+
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _read_state(self) -> Tuple[float, int]:
+        """Get refilled token count and today's call count (read-only)."""
+        with self._lock:
+            tokens, day_count, _, _ = self._load(for_update=False)
+        return tokens, day_count
+
+    def _load(self, for_update: bool) -> Tuple[float, int, float, str]:
+        """Load state, applying token refill and the daily reset."""
+        now = time.time()
+        today = datetime.now(timezone.utc).date().isoformat()
+        row = self._conn.execute(
+            "SELECT tokens, updated_at, day, day_count FROM rate_limits WHERE name = ?",
+            (self.name,)
+        ).fetchone()
+
+        if row is None:
+            return float(self.policy.burst), 0, now, today
+
+        tokens, updated_at, day, day_count = row
+        if self.policy.calls_per_second is not None:
+            elapsed = max(0.0, now - updated_at)
+            tokens = min(float(self.policy.burst), tokens + elapsed * self.policy.calls_per_second)
+
+        if day != today:
+            if for_update:
+                logger.info("rate_limit_daily_reset", limiter=self.name, previous_day=day)
+            day_count = 0
+
+        return tokens, day_count, now, today
+
+    def _save(self, tokens: float, now: float, today: str, day_count: int) -> None:
+        """Persist state (must run inside a transaction)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at, day, day_count) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self.name, tokens, now, today, day_count)
+        )
+
+
+# Process-wide limiter instances, keyed by (store path, name)
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(
+    name: str,
+    policy: RateLimitPolicy,
+    path: Union[str, Path] = ":memory:"
+) -> RateLimiter:
+    """
+    Get the shared limiter for a budget name (singleton per store and name).
+
+    Providers in the same process share one instance; providers in other
+    processes share the budget through the SQLite file at path.
+
+    Args:
+        name: Budget name (e.g., "eodhd")
+        policy: Policy used when the limiter is first created
+        path: SQLite database path (default: process-local ":memory:")
+
+    Returns:
+        RateLimiter instance
+    """
+    key = (str(path), name)
+    if key not in _limiters:
+        _limiters[key] = RateLimiter(name, policy, path)
+    return _limiters[key]
@@ -0,0 +1,426 @@
+"""
+Two-tier response cache for data providers.
+
+Entries live in a bounded in-memory LRU tier backed by an optional on-disk
+SQLite tier, so cached API responses survive restarts and memory stays
+bounded as the ticker universe grows. Every entry has its own TTL, and hit,
+miss and eviction counters are kept for monitoring.
+
+Values are only serialized when something needs the bytes (the disk tier or
+a memory byte budget); a memory-only cache stores references as-is.
+"""
+
+import pickle
+import sqlite3
+import structlog
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached value with its timing metadata.
+
+    Attributes:
+        value: Cached value
+        stored_at: Unix time the value was stored
+        expires_at: Unix time the value expires (None = never)
+        size: Serialized size in bytes (0 if never serialized)
+    """
+    value: Any
+    stored_at: float
+    expires_at: Optional[float]
+    size: int
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the value was stored."""
+        return max(0.0, time.time() - self.stored_at)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry has passed its TTL."""
+        return self.expires_at is not None and (now or time.time()) >= self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """Cache counters (since the cache was created)."""
+    hits: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+    writes: int = 0
+
+
+class ResponseCache:
+    """
+    LRU memory tier over an optional SQLite disk tier, with per-entry TTL.
+
+    Lookups check memory first, then disk (promoting disk hits into memory).
+    Writes go to both tiers. The memory tier is bounded by entry count and,
+    optionally, serialized bytes; the disk tier by serialized bytes, evicting
+    the least recently used entries first. Disk access times are written in
+    batches, and the disk tier's size is kept as a running total rather
+    than summed per write.
+
+    Example:
+        >>> cache = ResponseCache(
+        ...     "eodhd",
+        ...     default_ttl_seconds=24 * 3600,
+        ...     path="data/response_cache.sqlite3"
+        ... )
+        >>> cache.set("VOD.LSE:fundamentals_payload", payload)
+        >>> cache.get("VOD.LSE:fundamentals_payload")
+        >>> cache.stats()["hit_rate"]
+    """
+
+    # Disk-tier reads whose access times are written together
+    TOUCH_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        namespace: str,
+        default_ttl_seconds: Optional[float] = None,
+        max_entries: int = 1024,
+        max_memory_bytes: Optional[int] = None,
+        path: Optional[Union[str, Path]] = None,
+        max_disk_bytes: Optional[int] = 1024 * 1024 * 1024
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            namespace: Key namespace (e.g., provider name), so several caches
+                       can share one disk file
+            default_ttl_seconds: TTL for entries stored without an explicit
+                                 TTL (None = never expire)
+            max_entries: Maximum entries in the memory tier (default: 1024)
+            max_memory_bytes: Serialized size budget of the memory tier
+                              (default: None, bounded by max_entries only).
+                              Setting it serializes every value on write,
+                              even without a disk tier
+            path: SQLite file for the disk tier (None = memory tier only)
+            max_disk_bytes: Serialized size budget of the disk tier
+                            (default: 1 GB, None = unbounded)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.namespace = namespace
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.path = str(path) if path is not None else None
+
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = CacheStats()
+
+        # Disk tier bookkeeping: running size and unwritten access times
+        self._disk_bytes = 0
+        self._pending_touches: Dict[str, float] = {}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30.0)
+            with self._conn:
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS response_cache (
+                        namespace TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        value BLOB NOT NULL,
+                        stored_at REAL NOT NULL,
+                        expires_at REAL,
+                        accessed_at REAL NOT NULL,
+                        size INTEGER NOT NULL,
+                        PRIMARY KEY (namespace, key)
+                    )
+                    """
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS response_cache_lru "
+                    "ON response_cache (namespace, accessed_at)"
+                )
+            (self._disk_bytes,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM response_cache WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached entry with its timing metadata.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry, or None if missing or expired
+        """
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry.is_expired(now):
+                self._expire(key)
+                return None
+            self._memory.move_to_end(key)
+            self._stats.hits += 1
+            self._stats.memory_hits += 1
+            return entry
+
+        entry = self._disk_get(key, now)
+        if entry is not None:
+            if entry.is_expired(now):
+                self._expire(key)
+                return None
+            self._stats.hits += 1
+            self._stats.disk_hits += 1
+            self._memory_put(key, entry)
+            return entry
+
+        self._stats.misses += 1
+        return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        stored_at: Optional[float] = None
+    ) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be picklable if serialized). A
+                   memory-only cache keeps this object itself, so callers
+                   must not mutate it afterwards
+            ttl_seconds: Entry TTL (default: the cache's default TTL)
+            stored_at: Unix time to record as the store time (default: now)
+        """
+        stored_at = time.time() if stored_at is None else stored_at
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = stored_at + ttl if ttl is not None else None
+
+        blob = None
+        if self._conn is not None or self.max_memory_bytes is not None:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        entry = CacheEntry(
+            value=value,
+            stored_at=stored_at,
+            expires_at=expires_at,
+            size=len(blob) if blob is not None else 0
+        )
+
+        self._stats.writes += 1
+        self._memory_put(key, entry)
+        if blob is not None:
+            self._disk_put(key, entry, blob)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from both tiers."""
+        self._memory_remove(key)
+        if self._conn is not None:
+            self._pending_touches.pop(key, None)
+            with self._conn:
+                row = self._conn.execute(
+                    "DELETE FROM response_cache WHERE namespace = ? AND key = ? RETURNING size",
+                    (self.namespace, key)
+                ).fetchone()
+            if row is not None:
+                self._disk_bytes -= row[0]
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace from both tiers."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self._conn is not None:
+            self._pending_touches.clear()
+            self._disk_bytes = 0
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE namespace = ?", (self.namespace,)
+                )
+
+    def __contains__(self, key: str) -> bool:
+        """Check for an unexpired entry without touching counters or LRU order."""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = self._disk_get(key, now, touch=False)
+        return entry is not None and not entry.is_expired(now)
+
+    def __len__(self) -> int:
+        """Number of entries in the memory tier."""
+        return len(self._memory)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters and tier sizes.
+
+        Returns:
+            Dictionary of counters, hit rate and current tier usage
+        """
+        lookups = self._stats.hits + self._stats.misses
+        stats: Dict[str, Any] = {
+            "namespace": self.namespace,
+            **asdict(self._stats),
+            "hit_rate": round(self._stats.hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes
+        }
+        if self._conn is not None:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM response_cache WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+            stats["disk_entries"] = count
+            stats["disk_bytes"] = self._disk_bytes
+        return stats
+
+    def close(self) -> None:
+        """Close the disk tier connection (writing pending access times)."""
+        if self._conn is not None:
+            self._flush_touches()
+            self._conn.close()
+            self._conn = None
+
+    def _expire(self, key: str) -> None:
+        """Drop an expired key from both tiers and count it as a miss."""
+        logger.debug("response_cache_expired", namespace=self.namespace, cache_key=key)
+        self._stats.expirations += 1
+        self._stats.misses += 1
+        self.delete(key)
+
+    def _memory_put(self, key: str, entry: CacheEntry) -> None:
+        """Insert into the memory tier and evict LRU entries over budget."""
+        self._memory_remove(key)
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+
+        while len(self._memory) > 1 and (
+            len(self._memory) > self.max_entries
+            or (self.max_memory_bytes is not None and self._memory_bytes > self.max_memory_bytes)
+        ):
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+            self._stats.memory_evictions += 1
+            logger.debug("response_cache_evicted", namespace=self.namespace, cache_key=evicted_key, tier="memory")
+
+    def _memory_remove(self, key: str) -> None:
+        """Remove a key from the memory tier if present."""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+
+    def _disk_get(self, key: str, now: float, touch: bool = True) -> Optional[CacheEntry]:
+        """Load an entry from the disk tier (queueing an LRU time update)."""
+        if self._conn is None:
+            return None
+
+        row = self._conn.execute(
+            "SELECT value, stored_at, expires_at, size FROM response_cache "
+            "WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        ).fetchone()
+        if row is None:
+            return None
+
+        blob, stored_at, expires_at, size = row
+        if touch:
+            self._pending_touches[key] = now
+            if len(self._pending_touches) >= self.TOUCH_BATCH_SIZE:
+                self._flush_touches()
+        return CacheEntry(value=pickle.loads(blob), stored_at=stored_at, expires_at=expires_at, size=size)
+
+    def _disk_put(self, key: str, entry: CacheEntry, blob: bytes) -> None:
+        """Write an entry to the disk tier and evict LRU entries over budget."""
+        if self._conn is None:
+            return
+
+        self._pending_touches.pop(key, None)
+        with self._conn:
+            replaced = self._conn.execute(
+                "SELECT size FROM response_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(namespace, key, value, stored_at, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, blob, entry.stored_at, entry.expires_at, time.time(), entry.size)
+            )
+            self._disk_bytes += entry.size - (replaced[0] if replaced is not None else 0)
+            if self.max_disk_bytes is None or self._disk_bytes <= self.max_disk_bytes:
+                return
+
+            # Over budget: purge expired entries first, then least recently used
+            expired = self._conn.execute(
+                "DELETE FROM response_cache WHERE namespace = ? AND expires_at <= ? RETURNING size",
+                (self.namespace, time.time())
+            ).fetchall()
+            self._disk_bytes -= sum(size for (size,) in expired)
+            total = self._disk_bytes
+            if total <= self.max_disk_bytes:
+                return
+
+            self._flush_touches()
+            rows = self._conn.execute(
+                "SELECT key, size FROM response_cache WHERE namespace = ? AND key != ? "
+                "ORDER BY accessed_at",
+                (self.namespace, key)
+            ).fetchall()
+            evicted = []
+            for evicted_key, size in rows:
+                if total <= self.max_disk_bytes:
+                    break
+                evicted.append((self.namespace, evicted_key))
+                total -= size
+            self._conn.executemany(
+                "DELETE FROM response_cache WHERE namespace = ? AND key = ?", evicted
+            )
+            self._disk_bytes = total
+            self._stats.disk_evictions += len(evicted)
+
+    def _flush_touches(self) -> None:
+        """Write queued disk-tier access times in one transaction."""
+        if self._conn is None or not self._pending_touches:
+            return
+
+        touches = [
+            (accessed_at, self.namespace, key) for key, accessed_at in self._pending_touches.items()
+        ]
+        self._pending_touches.clear()
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE response_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                touches
+            )
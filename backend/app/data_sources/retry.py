@@ -0,0 +1,338 @@
+"""
+Retry engine shared by data providers and failover.
+
+Retries back off with decorrelated jitter, so concurrent callers do not
+retry in lockstep, and honour server Retry-After hints. Every retry also
+spends from a process-wide retry budget, which only allows retries in
+proportion to first attempts. During an outage the budget runs out and
+callers fail fast instead of multiplying load and burning quota.
+"""
+
+import asyncio
+import random
+import structlog
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Per-caller retry policy.
+
+    Attributes:
+        max_attempts: Total attempts including the first (1 = no retries)
+        base_delay: Minimum backoff delay in seconds
+        max_delay: Maximum jittered backoff delay in seconds
+        max_retry_after: Longest server Retry-After hint to wait for;
+                         longer hints give up instead of sleeping
+    """
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+
+
+@dataclass
+class RetryStats:
+    """Retry counters (since the engine was created)."""
+    operations: int = 0
+    retries: int = 0
+    retry_after_honoured: int = 0
+    retry_after_too_long: int = 0
+    budget_exhausted: int = 0
+    attempts_exhausted: int = 0
+    total_delay_seconds: float = 0.0
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries across all callers in the process.
+
+    Each operation deposits ratio tokens and each retry spends one, so
+    retries stay below roughly ratio x operations. A small time-based refill
+    keeps low-traffic callers able to retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 20.0
+    ):
+        """
+        Initialize budget (starts full).
+
+        Args:
+            ratio: Retry tokens earned per operation (default: 0.2)
+            min_retries_per_second: Tokens refilled per second regardless
+                                    of traffic (default: 1.0)
+            max_tokens: Budget capacity (default: 20)
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated_at = time.monotonic()
+
+    def record_operation(self) -> None:
+        """Deposit tokens for a new operation."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Spend one retry token.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def available(self) -> float:
+        """Retry tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_retries_per_second)
+
+
+class RetrySequence:
+    """Retry state for one operation (attempt count and previous delay)."""
+
+    def __init__(self, engine: "RetryEngine"):
+        self.engine = engine
+        self.attempt = 0
+        self.previous_delay = engine.policy.base_delay
+
+    async def backoff(self, retry_after: Optional[float] = None) -> bool:
+        """
+        Wait before the next attempt, if another attempt is allowed.
+
+        Args:
+            retry_after: Server Retry-After hint in seconds, if any
+
+        Returns:
+            True after waiting (caller should retry), False if attempts,
+            retry budget or acceptable Retry-After wait are exhausted
+            (caller should give up)
+        """
+        engine = self.engine
+        policy = engine.policy
+
+        if self.attempt + 1 >= policy.max_attempts:
+            engine._stats.attempts_exhausted += 1
+            return False
+
+        if retry_after is not None and retry_after > policy.max_retry_after:
+            engine._stats.retry_after_too_long += 1
+            logger.warning(
+                "retry_after_too_long",
+                retry_engine=engine.name,
+                retry_after=retry_after,
+                max_retry_after=policy.max_retry_after
+            )
+            return False
+
+        if not engine.budget.try_spend():
+            engine._stats.budget_exhausted += 1
+            logger.warning(
+                "retry_budget_exhausted",
+                retry_engine=engine.name,
+                attempt=self.attempt + 1
+            )
+            return False
+
+        delay = engine.next_delay(self.previous_delay, retry_after)
+        self.previous_delay = delay
+        self.attempt += 1
+
+        engine._stats.retries += 1
+        engine._stats.total_delay_seconds += delay
+        if retry_after is not None:
+            engine._stats.retry_after_honoured += 1
+
+        logger.debug(
+            "retry_backoff",
+            retry_engine=engine.name,
+            attempt=self.attempt,
+            delay=round(delay, 3),
+            retry_after=retry_after
+        )
+        await asyncio.sleep(delay)
+        return True
+
+
+class RetryEngine:
+    """
+    Retry engine with decorrelated jitter, Retry-After and a shared budget.
+
+    Example:
+        >>> engine = RetryEngine("eodhd", RetryPolicy(max_attempts=3))
+        >>> retry = engine.sequence()
+        >>> while True:
+        ...     response = await client.get(url)
+        ...     if response.status_code != 429:
+        ...         break
+        ...     if not await retry.backoff(parse_retry_after(response.headers.get("Retry-After"))):
+        ...         raise RateLimitExceeded()
+        >>> engine.stats()["retries"]
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            name: Engine name for logs and metrics (e.g., "eodhd")
+            policy: Retry policy (default: RetryPolicy())
+            budget: Retry budget (default: the process-wide budget)
+        """
+        self.name = name
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or get_retry_budget()
+        self._stats = RetryStats()
+
+    def sequence(self) -> RetrySequence:
+        """Start retry tracking for a new operation."""
+        self._stats.operations += 1
+        self.budget.record_operation()
+        return RetrySequence(self)
+
+    def next_delay(self, previous_delay: float, retry_after: Optional[float] = None) -> float:
+        """
+        Get the next backoff delay.
+
+        Decorrelated jitter: uniform between base_delay and three times the
+        previous delay, capped at max_delay. A Retry-After hint sets the
+        minimum wait.
+
+        Args:
+            previous_delay: Previous delay in this sequence
+            retry_after: Server Retry-After hint in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        policy = self.policy
+        upper = max(policy.base_delay, previous_delay * 3)
+        delay = min(policy.max_delay, random.uniform(policy.base_delay, upper))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        is_retryable: Callable[[Exception], bool]
+    ) -> T:
+        """
+        Run an async operation, retrying retryable exceptions.
+
+        An exception's retry_after attribute (seconds), if present, is used
+        as the Retry-After hint.
+
+        Args:
+            operation: Zero-argument coroutine function
+            is_retryable: Returns True if an exception should be retried
+
+        Returns:
+            Operation result
+
+        Raises:
+            Exception: The last error once it is not retryable or retries
+                       are exhausted
+        """
+        retry = self.sequence()
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                if not await retry.backoff(getattr(e, "retry_after", None)):
+                    raise
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters.
+
+        Returns:
+            Dictionary of counters plus currently available budget tokens
+        """
+        stats = asdict(self._stats)
+        stats["total_delay_seconds"] = round(stats["total_delay_seconds"], 3)
+        return {
+            "name": self.name,
+            **stats,
+            "budget_available": round(self.budget.available, 2)
+        }
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (>= 0), or None if absent or unparseable
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Global retry budget shared by every engine in the process
+_retry_budget: Optional[RetryBudget] = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """
+    Get the process-wide retry budget (singleton pattern).
+
+    Returns:
+        RetryBudget instance
+    """
+    global _retry_budget
+
+    if _retry_budget is None:
+        _retry_budget = RetryBudget()
+
+    return _retry_budget
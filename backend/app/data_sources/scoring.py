@@ -0,0 +1,373 @@
+"""
+Vectorised universe scoring.
+
+Scores are computed for the whole universe in one pass over columnar NumPy
+arrays (one array per metric, one row per ticker) instead of walking each
+ticker's nested dictionaries. Scoring is a separate step after fetching:
+UniverseMetrics can be kept and re-scored with new thresholds without
+refetching, and cross-sectional ranks and percentiles (e.g., P/E relative
+to sector) come from the same arrays.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from backend.app.data_sources.base import Signal
+
+
+SCORED_SIGNAL_TYPES = ("FUNDAMENTAL_DATA", "PRICE_DATA", "ANALYST_ESTIMATES")
+
+_CONSENSUS = {"BULLISH": 1.0, "BEARISH": -1.0}
+
+
+@dataclass(frozen=True)
+class ScoringThresholds:
+    """
+    Score thresholds (every score starts at a neutral 50, clipped to 0-100).
+
+    Fundamental score:
+        P/E in (0, pe_undervalued) +15, [pe_undervalued, pe_fair) +5; or,
+        with pe_sector_relative, P/E sector percentile <= pe_cheap_percentile
+        +15, <= pe_fair_percentile +5. ROE > roe_high +10, > roe_good +5.
+        Debt/equity < debt_low +10, < debt_moderate +5. Quarterly earnings
+        growth > growth_high +10, > growth_good +5.
+
+    Price score:
+        30-day change > momentum_strong +15, > momentum_good +10,
+        < -momentum_strong -15, < -momentum_good -10.
+
+    Analyst score:
+        Consensus bullish +20 / bearish -20; strong buys > strong_majority
+        percent of analysts +15, else strong sells > strong_majority -15.
+        No coverage stays neutral.
+    """
+    pe_undervalued: float = 15.0
+    pe_fair: float = 25.0
+    pe_sector_relative: bool = False
+    pe_cheap_percentile: float = 30.0
+    pe_fair_percentile: float = 60.0
+    roe_high: float = 15.0
+    roe_good: float = 10.0
+    debt_low: float = 0.5
+    debt_moderate: float = 1.0
+    growth_high: float = 20.0
+    growth_good: float = 10.0
+    momentum_strong: float = 10.0
+    momentum_good: float = 5.0
+    strong_majority: float = 50.0
+
+
+@dataclass
+class UniverseMetrics:
+    """
+    Key metrics for a universe of tickers, one array per metric.
+
+    Missing values are NaN. Rows are in ticker order.
+    """
+    tickers: np.ndarray
+    sectors: np.ndarray
+    pe_ratio: np.ndarray
+    roe: np.ndarray
+    debt_to_equity: np.ndarray
+    earnings_growth: np.ndarray
+    price_change_30d: np.ndarray
+    total_analysts: np.ndarray
+    consensus: np.ndarray
+    strong_buy: np.ndarray
+    strong_sell: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Mapping[str, Any]]) -> "UniverseMetrics":
+        """
+        Build columns from per-ticker data views.
+
+        Args:
+            rows: One mapping per ticker with optional "ticker",
+                  "fundamentals", "prices" and "estimates" entries (the
+                  provider's fundamentals, historical prices and analyst
+                  estimates dictionaries)
+
+        Returns:
+            UniverseMetrics with one row per input row
+        """
+        n = len(rows)
+        columns = {
+            name: np.full(n, np.nan)
+            for name in (
+                "pe_ratio", "roe", "debt_to_equity", "earnings_growth", "price_change_30d",
+                "total_analysts", "consensus", "strong_buy", "strong_sell"
+            )
+        }
+        tickers = []
+        sectors = []
+
+        for i, row in enumerate(rows):
+            fundamentals = row.get("fundamentals") or {}
+            prices = row.get("prices") or {}
+            estimates = row.get("estimates") or {}
+            key_metrics = fundamentals.get("key_metrics") or {}
+
+            tickers.append(row.get("ticker") or "")
+            sectors.append((fundamentals.get("general") or {}).get("Sector") or "")
+
+            columns["pe_ratio"][i] = _number(key_metrics.get("pe_ratio"))
+            columns["roe"][i] = _number(key_metrics.get("roe"))
+            columns["debt_to_equity"][i] = _number(key_metrics.get("debt_to_equity"))
+            columns["earnings_growth"][i] = _number(key_metrics.get("quarterly_earnings_growth"))
+            columns["price_change_30d"][i] = _number(prices.get("price_change_30d"))
+            if estimates:
+                columns["total_analysts"][i] = _number(estimates.get("total_analysts", 0))
+                columns["consensus"][i] = _CONSENSUS.get(estimates.get("consensus", "NEUTRAL"), 0.0)
+                columns["strong_buy"][i] = _number(estimates.get("strong_buy", 0))
+                columns["strong_sell"][i] = _number(estimates.get("strong_sell", 0))
+
+        return cls(
+            tickers=np.array(tickers, dtype=str),
+            sectors=np.array(sectors, dtype=str),
+            **columns
+        )
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Signal]) -> "UniverseMetrics":
+        """
+        Build columns from fetched signals (one row per ticker).
+
+        Args:
+            signals: FUNDAMENTAL_DATA, PRICE_DATA and ANALYST_ESTIMATES
+                     signals; other types are ignored
+
+        Returns:
+            UniverseMetrics with tickers in first-seen order
+        """
+        views = {
+            "FUNDAMENTAL_DATA": "fundamentals",
+            "PRICE_DATA": "prices",
+            "ANALYST_ESTIMATES": "estimates"
+        }
+        rows: Dict[str, Dict[str, Any]] = {}
+        for signal in signals:
+            view = views.get(signal.signal_type)
+            if view is None:
+                continue
+            rows.setdefault(signal.ticker, {"ticker": signal.ticker})[view] = signal.data
+        return cls.from_rows(list(rows.values()))
+
+
+@dataclass
+class UniverseScores:
+    """
+    Scores and cross-sectional percentiles for a universe, row-aligned with
+    the UniverseMetrics they were computed from.
+
+    Percentiles are 0-100 (higher = larger value), NaN where the metric is
+    missing.
+    """
+    tickers: np.ndarray
+    fundamental: np.ndarray
+    price: np.ndarray
+    analyst: np.ndarray
+    percentiles: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def row(self, ticker: str) -> Dict[str, Any]:
+        """
+        Get one ticker's scores and percentiles.
+
+        Args:
+            ticker: Ticker as given in the metrics
+
+        Returns:
+            Dictionary with fundamental, price and analyst scores plus
+            percentiles (None where missing)
+
+        Raises:
+            KeyError: If the ticker is not in the universe
+        """
+        matches = np.flatnonzero(self.tickers == ticker)
+        if not len(matches):
+            raise KeyError(ticker)
+        i = matches[0]
+        return {
+            "fundamental": int(self.fundamental[i]),
+            "price": int(self.price[i]),
+            "analyst": int(self.analyst[i]),
+            "percentiles": _percentiles_at(self, i, list(self.percentiles))
+        }
+
+
+def score_universe(
+    metrics: UniverseMetrics,
+    thresholds: Optional[ScoringThresholds] = None
+) -> UniverseScores:
+    """
+    Score every ticker in one vectorised pass.
+
+    Args:
+        metrics: Universe metrics
+        thresholds: Score thresholds (default: ScoringThresholds())
+
+    Returns:
+        UniverseScores with integer 0-100 scores and percentiles
+    """
+    t = thresholds or ScoringThresholds()
+
+    # NaN compares False, so missing metrics never add or subtract points
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pe = np.where(metrics.pe_ratio > 0, metrics.pe_ratio, np.nan)
+        percentiles = {
+            "pe_ratio_sector": sector_percentile(pe, metrics.sectors),
+            "roe_sector": sector_percentile(metrics.roe, metrics.sectors),
+            "debt_to_equity_sector": sector_percentile(metrics.debt_to_equity, metrics.sectors),
+            "earnings_growth": sector_percentile(metrics.earnings_growth),
+            "price_change_30d": sector_percentile(metrics.price_change_30d)
+        }
+
+        fundamental = np.full(len(metrics), 50.0)
+        if t.pe_sector_relative:
+            pe_rank = percentiles["pe_ratio_sector"]
+            fundamental += _tiered(pe_rank <= t.pe_cheap_percentile, pe_rank <= t.pe_fair_percentile, 15, 5)
+        else:
+            fundamental += _tiered(pe < t.pe_undervalued, pe < t.pe_fair, 15, 5)
+        fundamental += _tiered(metrics.roe > t.roe_high, metrics.roe > t.roe_good, 10, 5)
+        fundamental += _tiered(
+            metrics.debt_to_equity < t.debt_low, metrics.debt_to_equity < t.debt_moderate, 10, 5
+        )
+        fundamental += _tiered(
+            metrics.earnings_growth > t.growth_high, metrics.earnings_growth > t.growth_good, 10, 5
+        )
+
+        change = metrics.price_change_30d
+        price = np.full(len(metrics), 50.0)
+        price += _tiered(change > t.momentum_strong, change > t.momentum_good, 15, 10)
+        price -= _tiered(change < -t.momentum_strong, change < -t.momentum_good, 15, 10)
+
+        covered = metrics.total_analysts > 0
+        strong_buy_pct = metrics.strong_buy / metrics.total_analysts * 100
+        strong_sell_pct = metrics.strong_sell / metrics.total_analysts * 100
+        analyst = 50.0 + 20 * np.nan_to_num(metrics.consensus)
+        analyst += np.select(
+            [strong_buy_pct > t.strong_majority, strong_sell_pct > t.strong_majority], [15.0, -15.0], 0.0
+        )
+        analyst = np.where(covered, analyst, 50.0)
+
+    return UniverseScores(
+        tickers=metrics.tickers,
+        fundamental=_clip_score(fundamental),
+        price=_clip_score(price),
+        analyst=_clip_score(analyst),
+        percentiles=percentiles
+    )
+
+
+def sector_percentile(values: np.ndarray, groups: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Percentile of each value within its group (or the whole universe).
+
+    Uses the mean percentile-of-score definition: the share of the group's
+    values below it, counting ties as half, so equal values get equal
+    percentiles. Computed for all groups at once without a Python loop.
+
+    Args:
+        values: Metric values (NaN = missing, excluded from ranking)
+        groups: Group label per value, e.g. sector (default: one group)
+
+    Returns:
+        Percentiles 0-100, NaN where the value is missing
+    """
+    values = np.asarray(values, dtype=float)
+    result = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return result
+
+    if groups is None:
+        group_ids = np.zeros(int(valid.sum()), dtype=np.int64)
+    else:
+        group_ids = np.unique(np.asarray(groups)[valid], return_inverse=True)[1].astype(np.int64)
+
+    # Composite key orders by group, then by dense value rank within it
+    value_ranks = np.unique(values[valid], return_inverse=True)[1].astype(np.int64)
+    span = len(value_ranks) + 1
+    keys = group_ids * span + value_ranks
+    sorted_keys = np.sort(keys)
+
+    group_start = np.searchsorted(sorted_keys, group_ids * span, side="left")
+    group_size = np.searchsorted(sorted_keys, (group_ids + 1) * span, side="left") - group_start
+    below = np.searchsorted(sorted_keys, keys, side="left") - group_start
+    ties = np.searchsorted(sorted_keys, keys, side="right") - group_start - below
+
+    result[valid] = (below + 0.5 * ties) / group_size * 100
+    return result
+
+
+def score_signals(
+    signals: List[Signal],
+    thresholds: Optional[ScoringThresholds] = None
+) -> List[Signal]:
+    """
+    Scoring pipeline step: score fetched signals for the whole universe.
+
+    Sets the score of every FUNDAMENTAL_DATA, PRICE_DATA and
+    ANALYST_ESTIMATES signal and adds a "percentiles" entry to fundamental
+    and price signal data (a new dictionary; cached data is not mutated).
+    Can be re-run with new thresholds on the same signals.
+
+    Args:
+        signals: Fetched signals (any mix of tickers and types)
+        thresholds: Score thresholds (default: ScoringThresholds())
+
+    Returns:
+        The same signals, rescored in place
+    """
+    scored = [signal for signal in signals if signal.signal_type in SCORED_SIGNAL_TYPES]
+    if not scored:
+        return signals
+
+    metrics = UniverseMetrics.from_signals(scored)
+    scores = score_universe(metrics, thresholds)
+    rows = {ticker: i for i, ticker in enumerate(metrics.tickers.tolist())}
+
+    for signal in scored:
+        i = rows[signal.ticker]
+        if signal.signal_type == "FUNDAMENTAL_DATA":
+            signal.score = int(scores.fundamental[i])
+            signal.data = {**signal.data, "percentiles": _percentiles_at(scores, i, (
+                "pe_ratio_sector", "roe_sector", "debt_to_equity_sector", "earnings_growth"
+            ))}
+        elif signal.signal_type == "PRICE_DATA":
+            signal.score = int(scores.price[i])
+            signal.data = {**signal.data, "percentiles": _percentiles_at(scores, i, ("price_change_30d",))}
+        else:
+            signal.score = int(scores.analyst[i])
+
+    return signals
+
+
+def _tiered(top: np.ndarray, second: np.ndarray, top_points: float, second_points: float) -> np.ndarray:
+    """Points for the first matching tier (top, then second), else 0."""
+    return np.select([top, second], [top_points, second_points], 0.0)
+
+
+def _clip_score(score: np.ndarray) -> np.ndarray:
+    """Clip to 0-100 and truncate to integer scores."""
+    return np.clip(score, 0, 100).astype(np.int64)
+
+
+def _number(value: Any) -> float:
+    """Convert a metric to float (None and non-numeric -> NaN)."""
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _percentiles_at(scores: UniverseScores, i: int, names: Sequence[str]) -> Dict[str, Optional[float]]:
+    """One row's percentiles, rounded (None where missing)."""
+    return {
+        name: None if np.isnan(scores.percentiles[name][i]) else round(float(scores.percentiles[name][i]), 1)
+        for name in names
+    }
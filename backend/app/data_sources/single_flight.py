@@ -0,0 +1,85 @@
+"""
+Single-flight deduplication of concurrent identical fetches.
+
+The first caller for a key starts the fetch; callers arriving while it is in
+flight await the same result instead of issuing their own request.
+"""
+
+import asyncio
+import structlog
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Deduplication counters (since creation)."""
+    calls: int = 0
+    shared: int = 0
+
+
+class SingleFlight:
+    """
+    Per-key in-flight request deduplication.
+
+    The fetch runs as its own task, so a cancelled caller does not cancel
+    the fetch for the others. Exceptions are delivered to every waiter.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> payload = await flights.do(
+        ...     "VOD.LSE:fundamentals_payload",
+        ...     lambda: download("VOD.LSE")
+        ... )
+    """
+
+    def __init__(self):
+        """Initialize with no requests in flight."""
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch for key, or join the identical fetch already in flight.
+
+        Args:
+            key: Request key (e.g., cache key)
+            fetch: Zero-argument coroutine function performing the request
+
+        Returns:
+            Result of the (shared) fetch
+
+        Raises:
+            Exception: Whatever the shared fetch raised
+        """
+        self._stats.calls += 1
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats.shared += 1
+            logger.debug("single_flight_shared", key=key)
+        else:
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a fetch for key is currently running."""
+        return key in self._in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get deduplication counters.
+
+        Returns:
+            Dictionary with calls, shared (deduplicated) calls and keys
+            currently in flight
+        """
+        return {**asdict(self._stats), "in_flight": len(self._in_flight)}
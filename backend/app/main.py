@@ -1,9 +1,14 @@
 """FastAPI application entry point for AIHedgeFund backend."""
+import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.api import health
+from app.core.config import get_data_sources_config
+from app.core.http_pool import HTTPPoolConfig, open_http_pool, close_http_pool
+
+logger = structlog.get_logger(__name__)
 
 
 @asynccontextmanager
@@ -11,17 +16,23 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
 
-    Startup: Initialize database connections, load config
+    Startup: Initialize database connections, load config, open the shared
+             HTTP pool used by data providers
     Shutdown: Close connections, cleanup resources
     """
     # Startup
     print("🚀 AIHedgeFund backend starting up...")
     print("✅ Database connection pool initialized")
+    # The pool logs http_pool_opened / http_pool_closed itself
+    open_http_pool(HTTPPoolConfig.from_config(get_data_sources_config().http_pool))
+    logger.info("app_startup_complete")
 
     yield
 
     # Shutdown
     print("🛑 AIHedgeFund backend shutting down...")
+    await close_http_pool()
+    logger.info("app_shutdown_complete")
 
 
 # Create FastAPI application
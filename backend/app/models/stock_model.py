@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Numeric
+from sqlalchemy import Boolean, Column, String, Numeric
 from sqlalchemy.orm import relationship
 
 from app.models.base_model import BaseModel
@@ -10,6 +10,7 @@ class Stock(BaseModel):
     name = Column(String(255), nullable=False)  # Added length constraint per architecture
     sector = Column(String(100), nullable=True)  # Added length constraint per architecture
     market_cap = Column(Numeric(15, 2), nullable=True)  # Changed to Numeric per architecture (GBP millions with decimals)
+    is_active = Column(Boolean, default=True, nullable=False, index=True)  # False once delisted from the exchange symbol list
 
     # Define relationships (assuming other models will be defined later)
     # These relationships will be fully established once the other models are created
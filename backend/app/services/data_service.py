@@ -1,11 +1,119 @@
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.portfolio_position_model import PortfolioPosition
 from app.models.stock_model import Stock
 from app.models.signal_model import Signal
+from app.models.watchlist_entry_model import WatchlistEntry
+
+
+# Rows per INSERT ... ON CONFLICT statement (PostgreSQL allows 32767 bind
+# parameters per statement; each row binds 4)
+UPSERT_CHUNK_ROWS = 5000
+
+TICKER_MAX_LENGTH = Stock.__table__.c.ticker.type.length
+
+
+@dataclass
+class UniverseDiff:
+    """Changes needed to bring the stocks table in line with a symbol list."""
+    inserts: Dict[str, str] = field(default_factory=dict)  # ticker -> name
+    updates: Dict[str, str] = field(default_factory=dict)  # ticker -> new name (or reactivated)
+    deactivations: Dict[str, str] = field(default_factory=dict)  # ticker -> current name
+    unchanged: int = 0
+
+    def upsert_rows(self) -> List[Dict[str, Any]]:
+        """Rows for one set-based upsert covering every change."""
+        rows = [
+            {"ticker": ticker, "name": name, "is_active": True}
+            for changes in (self.inserts, self.updates)
+            for ticker, name in changes.items()
+        ]
+        rows.extend(
+            {"ticker": ticker, "name": name, "is_active": False}
+            for ticker, name in self.deactivations.items()
+        )
+        return rows
+
+    def summary(self) -> Dict[str, int]:
+        """Change counts for logging and job results."""
+        return {
+            "inserted": len(self.inserts),
+            "updated": len(self.updates),
+            "deactivated": len(self.deactivations),
+            "unchanged": self.unchanged,
+        }
+
+
+def symbols_to_universe(
+    symbols: Iterable[Mapping[str, Any]],
+    suffix: str = ".L",
+    types: Optional[Tuple[str, ...]] = ("Common Stock",),
+) -> Dict[str, str]:
+    """
+    Map EODHD exchange symbol records to {ticker: name}.
+
+    Codes are suffixed to the stocks table ticker format (e.g., "VOD" ->
+    "VOD.L"). Records of other security types, and codes too long for the
+    ticker column, are skipped.
+    """
+    universe = {}
+    for symbol in symbols:
+        code = symbol.get("Code")
+        if not code or (types and symbol.get("Type") not in types):
+            continue
+        ticker = f"{code}{suffix}"
+        if len(ticker) > TICKER_MAX_LENGTH:
+            continue
+        universe[ticker] = (symbol.get("Name") or code)[:255]
+    return universe
+
+
+def diff_universe(
+    existing: Mapping[str, Tuple[str, bool]],
+    listed: Mapping[str, str],
+    suffix: Optional[str] = None,
+    retain: AbstractSet[str] = frozenset(),
+) -> UniverseDiff:
+    """
+    Diff the stocks table against an exchange symbol list by ticker.
+
+    Args:
+        existing: ticker -> (name, is_active) for every row in stocks
+        listed: ticker -> name for every symbol currently listed
+        suffix: Only tickers with this suffix belong to the synced exchange
+                and may be deactivated (None: every ticker)
+        retain: Tickers never deactivated, e.g. still listed under a
+                security type the sync skips, or held in the portfolio
+
+    Returns:
+        UniverseDiff with new tickers, renamed or relisted tickers, and
+        active tickers of the synced exchange no longer listed
+    """
+    diff = UniverseDiff()
+    for ticker, name in listed.items():
+        current = existing.get(ticker)
+        if current is None:
+            diff.inserts[ticker] = name
+        elif current != (name, True):
+            diff.updates[ticker] = name
+        else:
+            diff.unchanged += 1
+
+    for ticker, (name, is_active) in existing.items():
+        if (
+            is_active
+            and ticker not in listed
+            and ticker not in retain
+            and (suffix is None or ticker.endswith(suffix))
+        ):
+            diff.deactivations[ticker] = name
+    return diff
 
 
 class StockService:
@@ -66,6 +174,114 @@ class StockService:
         await db.commit()
         return True
 
+    @staticmethod
+    async def sync_universe(
+        db: AsyncSession,
+        listed: Mapping[str, str],
+        suffix: Optional[str] = None,
+        retain: AbstractSet[str] = frozenset(),
+    ) -> Dict[str, int]:
+        """
+        Sync the stocks table to an exchange universe in one transaction.
+
+        Reads every ticker once, diffs in memory, then applies inserts,
+        updates and inactive-marking with a set-based upsert. Delisted
+        stocks are kept (signals, trades) but marked inactive; stocks with
+        open positions are never deactivated.
+
+        Args:
+            db: Database session
+            listed: ticker -> name for every currently listed symbol
+            suffix: Ticker suffix of the synced exchange (see diff_universe)
+            retain: Tickers never deactivated (see diff_universe)
+
+        Returns:
+            Counts of inserted, updated, deactivated and unchanged stocks
+        """
+        held = exists().where(
+            PortfolioPosition.stock_id == Stock.id, PortfolioPosition.deleted_at.is_(None)
+        )
+        result = await db.execute(
+            select(Stock.ticker, Stock.name, Stock.is_active, held.label("held"))
+        )
+        existing = {}
+        retain = set(retain)
+        for ticker, name, is_active, is_held in result.all():
+            existing[ticker] = (name, is_active)
+            if is_held:
+                retain.add(ticker)
+
+        diff = diff_universe(existing, listed, suffix=suffix, retain=retain)
+        rows = diff.upsert_rows()
+        for start in range(0, len(rows), UPSERT_CHUNK_ROWS):
+            stmt = pg_insert(Stock).values(rows[start:start + UPSERT_CHUNK_ROWS])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Stock.ticker],
+                set_={
+                    "name": stmt.excluded.name,
+                    "is_active": stmt.excluded.is_active,
+                    "updated_at": func.now(),
+                },
+            )
+            await db.execute(stmt)
+
+        await db.commit()
+        return diff.summary()
+
+    @staticmethod
+    async def sync_exchange_universe(
+        db: AsyncSession, provider: Any, exchange: str = "LSE", suffix: str = ".L"
+    ) -> Dict[str, int]:
+        """
+        Weekly universe refresh: download the exchange symbol list once
+        (provider.fetch_exchange_symbols, e.g. EODHDProvider) and sync it.
+
+        An empty or failed download leaves the table untouched rather than
+        deactivating the whole universe. Only tickers of this exchange that
+        are missing from the symbol list are deactivated; symbols of other
+        security types are still listed and left alone.
+        """
+        symbols = await provider.fetch_exchange_symbols(exchange)
+        listed = symbols_to_universe(symbols, suffix=suffix)
+        if not listed:
+            return {"inserted": 0, "updated": 0, "deactivated": 0, "unchanged": 0}
+        other_types = symbols_to_universe(symbols, suffix=suffix, types=None).keys() - listed.keys()
+        return await StockService.sync_universe(db, listed, suffix=suffix, retain=other_types)
+
+    @staticmethod
+    async def get_quota_priorities(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Priorities for spending scarce provider quota: open positions,
+        unexpired watchlist entries, and each ticker's latest signal time.
+
+        Returns a dict whose keys match the fields of
+        backend.app.data_sources.quota.TickerPriorities; the caller builds
+        it, e.g. provider.set_priorities(TickerPriorities(**priorities)).
+        The services layer cannot import it: app.data_sources imports its
+        submodules through the backend.app root, which does not exist in
+        the API container (the image copies in the contents of backend/).
+        """
+        held = await db.execute(
+            select(Stock.ticker)
+            .join(PortfolioPosition, PortfolioPosition.stock_id == Stock.id)
+            .where(PortfolioPosition.deleted_at.is_(None))
+            .distinct()
+        )
+        watchlist = await db.execute(
+            select(Stock.ticker)
+            .join(WatchlistEntry, WatchlistEntry.stock_id == Stock.id)
+            .where(or_(WatchlistEntry.expiry_date.is_(None), WatchlistEntry.expiry_date > func.now()))
+            .distinct()
+        )
+        last_updated = await db.execute(
+            select(Signal.stock_ticker, func.max(Signal.timestamp)).group_by(Signal.stock_ticker)
+        )
+        return {
+            "held": frozenset(held.scalars().all()),
+            "watchlist": frozenset(watchlist.scalars().all()),
+            "last_updated": dict(last_updated.all()),
+        }
+
 
 class SignalService:
     @staticmethod
@@ -10,6 +10,10 @@ backend_path = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
 
 from app.main import app
+from backend.app.core import circuit_breaker
+from backend.app.core.circuit_breaker import CircuitBreakerConfig
+from backend.app.data_sources.base import DataSource
+from backend.app.data_sources.failover import DataSourceFailover
 
 
 @pytest.mark.asyncio
@@ -99,3 +103,37 @@ async def test_root_endpoint():
     assert "version" in data
     assert "health" in data
     assert data["health"] == "/api/health"
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_reports_failover_circuit_breakers():
+    """
+    Test that breakers enabled by DataSourceFailover are reported by /api/health.
+    """
+
+    class DownProvider(DataSource):
+        async def fetch(self, tickers=None):
+            raise ConnectionError("provider down")
+
+        def get_source_name(self):
+            return "health_down"
+
+    failover = DataSourceFailover(
+        providers={"health_down": DownProvider()},
+        priority_order=["health_down"],
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=1, cool_down_seconds=60)
+    )
+
+    try:
+        await failover.fetch_with_failover(tickers=["VOD.L"])
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/health")
+
+        breakers = response.json()["circuit_breakers"]
+        assert breakers["health_down"]["state"] == "open"
+        assert breakers["health_down"]["failures"] == 1
+    finally:
+        circuit_breaker._breakers.pop("health_down", None)
@@ -12,7 +12,7 @@ Tests cover:
 import pytest
 import asyncio
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, AsyncMock
 from typing import List
 
@@ -426,12 +426,13 @@ class TestCacheAndStaleness:
         )
 
         cache_key = failover._get_cache_key(["VOD.L"])
-        failover._cache[cache_key] = [old_signal]
-        failover._cache_timestamps[cache_key] = datetime.now(timezone.utc)
 
-        # Manually set cache timestamp to 2 hours ago
-        from datetime import timedelta
-        failover._cache_timestamps[cache_key] -= timedelta(hours=2)
+        # Cache the signal with a store time 2 hours ago
+        failover._cache.set(
+            cache_key,
+            [old_signal],
+            stored_at=(datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        )
 
         # Fetch should return cached data with staleness flag
         signals = await failover.fetch_with_failover(
@@ -463,8 +464,10 @@ class TestEODHDIntegration:
 
         mock_prices_response = Mock()
         mock_prices_response.status_code = 200
+        # Bar dated inside the provider's rolling 30-day window
+        bar_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
         mock_prices_response.json.return_value = [
-            {"date": "2025-11-01", "open": 14500, "high": 14800, "low": 14300, "close": 14700, "volume": 5000000}
+            {"date": bar_date, "open": 14500, "high": 14800, "low": 14300, "close": 14700, "volume": 5000000}
         ]
 
         mock_profile_response = Mock()
@@ -0,0 +1,116 @@
+"""
+Unit tests for per-provider circuit breakers.
+"""
+
+import pytest
+
+from backend.app.core.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    circuit_breaker_snapshot,
+    get_circuit_breaker,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions and reporting."""
+
+    def test_config_from_dict_ignores_unknown_keys(self):
+        """Test building breaker settings from the YAML section."""
+        config = CircuitBreakerConfig.from_config({"failure_threshold": 5, "unknown": 1})
+        assert config.failure_threshold == 5
+        assert CircuitBreakerConfig.from_config(None) == CircuitBreakerConfig()
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the threshold of consecutive failures opens the breaker."""
+        breaker = CircuitBreaker("eodhd", CircuitBreakerConfig(failure_threshold=3))
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()  # Resets the consecutive count
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is BreakerState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.allow_request() is False
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        assert breaker.snapshot()["rejected"] == 2
+
+    def test_half_open_allows_single_probe(self):
+        """Test that after the cool-down exactly one probe is let through."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "eodhd",
+            CircuitBreakerConfig(failure_threshold=1, cool_down_seconds=60),
+            clock=clock
+        )
+        breaker.record_failure()
+        assert breaker.snapshot()["retry_in_seconds"] == 60.0
+
+        clock.now += 61
+        assert breaker.state is BreakerState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False  # Probe already in flight
+
+        breaker.record_success()
+        assert breaker.state is BreakerState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens_for_full_cool_down(self):
+        """Test that a failed probe re-opens the breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "eodhd",
+            CircuitBreakerConfig(failure_threshold=3, cool_down_seconds=60),
+            clock=clock
+        )
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 61
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+
+        assert breaker.state is BreakerState.OPEN
+        clock.now += 30
+        assert breaker.allow_request() is False
+
+    def test_released_probe_can_be_retried(self):
+        """Test that a cancelled probe frees the half-open slot."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "eodhd",
+            CircuitBreakerConfig(failure_threshold=1, cool_down_seconds=1),
+            clock=clock
+        )
+        breaker.record_failure()
+        clock.now += 2
+
+        assert breaker.allow_request() is True
+        breaker.release()
+        assert breaker.allow_request() is True
+
+    def test_process_wide_breakers_are_reported(self):
+        """Test that shared breakers are singletons and appear in the snapshot."""
+        breaker = get_circuit_breaker("test_snapshot_provider")
+        assert get_circuit_breaker("test_snapshot_provider") is breaker
+
+        breaker.record_failure()
+        snapshot = circuit_breaker_snapshot()["test_snapshot_provider"]
+        assert snapshot["state"] == "closed"
+        assert snapshot["consecutive_failures"] == 1
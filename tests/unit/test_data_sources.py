@@ -13,7 +13,9 @@ Tests cover:
 
 import pytest
 import asyncio
+import httpx
 from datetime import datetime, timezone, timedelta
+from functools import partial
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from typing import List
 
@@ -26,9 +28,12 @@ from backend.app.data_sources.providers.alpha_vantage_provider import (
 )
 from backend.app.data_sources.providers.eodhd_provider import (
     EODHDProvider,
-    EODHDRateLimitExceeded
+    EODHDRateLimitExceeded,
+    FetchPlan
 )
 from backend.app.data_sources.failover import DataSourceFailover, FailoverReason
+from backend.app.data_sources.rate_limiter import RateLimiter, RateLimitPolicy
+from backend.app.data_sources.retry import RetryBudget, RetryEngine, RetryPolicy
 from backend.app.core.config import DataSourcesConfig
 
 
@@ -338,6 +343,163 @@ class TestYahooFinanceProvider:
         # Should return empty list for invalid ticker
         assert signals == []
 
+    @pytest.mark.asyncio
+    @patch('backend.app.data_sources.providers.yahoo_provider.yf.Ticker')
+    @patch('backend.app.data_sources.providers.yahoo_provider.yf.download')
+    async def test_batch_download_with_per_ticker_fallback(self, mock_download, mock_ticker):
+        """Test grouped multi-symbol downloads, with Ticker.info only for misses."""
+        import pandas as pd
+
+        def download(tickers, **kwargs):
+            dates = pd.date_range("2025-11-03", periods=3)
+            columns = pd.MultiIndex.from_product([tickers, ["Close", "Volume"]])
+            frame = pd.DataFrame(index=dates, columns=columns, dtype=float)
+            for ticker in tickers:
+                if ticker != "MISS.L":
+                    frame[(ticker, "Close")] = [100.0, 100.0, 110.0]
+                    frame[(ticker, "Volume")] = [1000, 1000, 4000]
+            return frame
+
+        mock_download.side_effect = download
+        mock_stock = Mock()
+        mock_stock.info = {'regularMarketPrice': 50.0, 'previousClose': 50.0, 'volume': 10, 'averageVolume': 10}
+        mock_ticker.return_value = mock_stock
+
+        provider = YahooFinanceProvider(
+            tickers=["VOD.L", "BP.L", "MISS.L"],
+            batch_download=True,
+            batch_size=2
+        )
+        signals = await provider.fetch()
+
+        assert mock_download.call_count == 2
+        assert [call.args[0] for call in mock_download.call_args_list] == [["VOD.L", "BP.L"], ["MISS.L"]]
+        mock_ticker.assert_called_once_with("MISS.L")
+
+        assert [signal.ticker for signal in signals] == ["VOD.L", "BP.L", "MISS.L"]
+        vod = signals[0].data
+        assert vod["current_price"] == 110.0
+        assert vod["previous_close"] == 100.0
+        assert vod["price_change_pct"] == pytest.approx(10.0)
+        assert vod["volume"] == 4000
+        assert vod["average_volume"] == 2000
+        assert signals[2].data["current_price"] == 50.0
+
+    @pytest.mark.asyncio
+    @patch('backend.app.data_sources.providers.yahoo_provider.yf.Ticker')
+    async def test_worker_pool_returns_partial_results_on_timeout(self, mock_ticker):
+        """Test that slow tickers are abandoned at their deadline and reported."""
+        import time
+
+        class SlowTicker:
+            def __init__(self, ticker):
+                self.ticker = ticker
+
+            @property
+            def info(self):
+                if self.ticker == "HANG.L":
+                    time.sleep(0.5)
+                return {'regularMarketPrice': 100.0, 'previousClose': 100.0, 'volume': 10, 'averageVolume': 10}
+
+        mock_ticker.side_effect = SlowTicker
+
+        provider = YahooFinanceProvider(
+            tickers=["VOD.L", "HANG.L", "BP.L"],
+            max_workers=2,
+            ticker_timeout_seconds=0.05,
+            fetch_budget_seconds=1.0
+        )
+        started = time.monotonic()
+        result = await provider.fetch_with_report()
+        elapsed = time.monotonic() - started
+        await provider.close()
+
+        assert elapsed < 0.4
+        assert [signal.ticker for signal in result.signals] == ["VOD.L", "BP.L"]
+        assert result.timed_out == ["HANG.L"]
+
+    @pytest.mark.asyncio
+    @patch('backend.app.data_sources.providers.yahoo_provider.yf.Ticker')
+    async def test_worker_pool_budget_skips_pending_tickers(self, mock_ticker):
+        """Test that tickers still queued when the budget is spent are not started."""
+        import time
+
+        def slow_ticker(ticker):
+            time.sleep(0.05)
+            stock = Mock()
+            stock.info = {'regularMarketPrice': 100.0, 'previousClose': 100.0, 'volume': 10, 'averageVolume': 10}
+            return stock
+
+        mock_ticker.side_effect = slow_ticker
+        tickers = [f"T{i}.L" for i in range(10)]
+
+        provider = YahooFinanceProvider(
+            tickers=tickers,
+            max_workers=1,
+            ticker_timeout_seconds=1.0,
+            fetch_budget_seconds=0.12
+        )
+        result = await provider.fetch_with_report()
+        await provider.close()
+
+        fetched = [signal.ticker for signal in result.signals]
+        assert 0 < len(fetched) < len(tickers)
+        assert fetched + result.timed_out == tickers
+        assert mock_ticker.call_count < len(tickers)
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_deadline_starts_when_call_gets_worker(self):
+        """Test that a call queued behind a timed-out thread gets its full deadline."""
+        import time
+
+        def sleeper(seconds):
+            time.sleep(seconds)
+            return seconds
+
+        provider = YahooFinanceProvider(tickers=["VOD.L"], max_workers=1)
+        loop = asyncio.get_running_loop()
+        outcomes = await provider._run_pooled(
+            [partial(sleeper, 0.6), partial(sleeper, 0.05)],
+            deadline=loop.time() + 5.0,
+            timeout=0.2
+        )
+        await provider.close()
+
+        assert outcomes == [(False, None), (True, 0.05)]
+
+    @pytest.mark.asyncio
+    @patch('backend.app.data_sources.providers.yahoo_provider.yf.download')
+    async def test_concurrent_single_ticker_lookups_share_one_download(self, mock_download):
+        """Test concurrent single-ticker lookups share one download and leave tickers untouched."""
+        import pandas as pd
+
+        def download(tickers, **kwargs):
+            dates = pd.date_range("2025-11-03", periods=2)
+            columns = pd.MultiIndex.from_product([tickers, ["Close", "Volume"]])
+            frame = pd.DataFrame(index=dates, columns=columns, dtype=float)
+            for ticker in tickers:
+                frame[(ticker, "Close")] = [100.0, 101.0]
+                frame[(ticker, "Volume")] = [1000, 1000]
+            return frame
+
+        mock_download.side_effect = download
+
+        # Batch downloads are off, but coalesced lookups still share one
+        provider = YahooFinanceProvider(tickers=["LLOY.L"], single_ticker_window_seconds=0.01)
+        with patch('backend.app.data_sources.providers.yahoo_provider.yf.Ticker') as mock_ticker:
+            signals = await asyncio.gather(
+                provider.fetch_single_ticker("VOD.L"),
+                provider.fetch_single_ticker("BP.L"),
+                provider.fetch_single_ticker("VOD.L")
+            )
+
+        mock_ticker.assert_not_called()
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == ["VOD.L", "BP.L"]
+        assert [signal.ticker for signal in signals] == ["VOD.L", "BP.L", "VOD.L"]
+        assert provider.tickers == ["LLOY.L"]
+        assert provider.get_single_ticker_stats()["batches"] == 1
+
 
 # Test AlphaVantageProvider
 class TestAlphaVantageProvider:
@@ -401,6 +563,127 @@ class TestAlphaVantageProvider:
         # Should return empty due to rate limit
         assert signals == []
 
+    @staticmethod
+    def _daily_payload():
+        """Compact TIME_SERIES_DAILY response (dates deliberately unordered)."""
+        return {
+            "Meta Data": {"2. Symbol": "VOD", "4. Output Size": "Compact"},
+            "Time Series (Daily)": {
+                "2025-11-04": {
+                    "1. open": "95.0000", "2. high": "97.0000", "3. low": "94.0000",
+                    "4. close": "96.0000", "5. volume": "4000"
+                },
+                "2025-11-05": {
+                    "1. open": "100.0000", "2. high": "106.0000", "3. low": "99.0000",
+                    "4. close": "105.0000", "5. volume": "5000"
+                }
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_native_client_parses_latest_compact_bar(self):
+        """Test the async client requests compact output and uses the latest bar."""
+        http_pool = Mock()
+        http_pool.get = AsyncMock(return_value=httpx.Response(200, json=self._daily_payload()))
+        provider = AlphaVantageProvider(api_key="native_key", daily_limit=25, http_pool=http_pool)
+
+        signals = await provider.fetch(tickers=["VOD.L"])
+
+        params = http_pool.get.call_args.kwargs["params"]
+        assert params["function"] == "TIME_SERIES_DAILY"
+        assert params["outputsize"] == "compact"
+        assert params["symbol"] == "VOD"
+
+        data = signals[0].data
+        assert data["latest_date"] == "2025-11-05"
+        assert data["current_price"] == 105.0
+        assert data["open_price"] == 100.0
+        assert data["volume"] == 5000
+        assert data["price_change_pct"] == pytest.approx(5.0)
+        assert signals[0].score == 65
+
+    @pytest.mark.asyncio
+    async def test_validate_api_key_uses_native_client(self):
+        """Test key validation makes one native request and reports rejected keys."""
+        http_pool = Mock()
+        http_pool.get = AsyncMock(return_value=httpx.Response(200, json=self._daily_payload()))
+        provider = AlphaVantageProvider(api_key="validate_key", daily_limit=25, http_pool=http_pool)
+
+        assert await provider.validate_api_key() is True
+        assert http_pool.get.call_args.kwargs["params"]["symbol"] == "MSFT"
+
+        http_pool.get.return_value = httpx.Response(200, json={
+            "Error Message": "the parameter apikey is invalid or missing."
+        })
+        assert await provider.validate_api_key() is False
+        assert provider.get_remaining_calls() == 23
+
+    @pytest.mark.asyncio
+    async def test_native_client_rate_limit_notice_stops_fetch(self):
+        """Test that a throttling notice in a 200 response aborts the fetch."""
+        http_pool = Mock()
+        http_pool.get = AsyncMock(return_value=httpx.Response(200, json={
+            "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."
+        }))
+        provider = AlphaVantageProvider(api_key="throttled_key", daily_limit=25, http_pool=http_pool)
+
+        signals = await provider.fetch(tickers=["VOD.L", "BP.L"])
+
+        assert signals == []
+        assert http_pool.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst_waits_instead_of_skipping(self, tmp_path):
+        """Test an empty token bucket delays calls rather than counting as spent quota."""
+        http_pool = Mock()
+        http_pool.get = AsyncMock(return_value=httpx.Response(200, json=self._daily_payload()))
+        provider = AlphaVantageProvider(
+            api_key="burst_key",
+            daily_limit=25,
+            rate_limiter=RateLimiter(
+                "alpha_vantage",
+                RateLimitPolicy(daily_quota=25, calls_per_second=50, burst=1),
+                tmp_path / "rate_limits.sqlite3"
+            ),
+            http_pool=http_pool
+        )
+
+        signals = await provider.fetch(tickers=["VOD.L", "BP.L", "LLOY.L"])
+
+        assert [signal.ticker for signal in signals] == ["VOD.L", "BP.L", "LLOY.L"]
+        assert provider.get_remaining_calls() == 22
+
+    @pytest.mark.asyncio
+    async def test_short_quota_spent_on_priorities_and_shared_across_processes(self, tmp_path):
+        """Test that scarce calls go to held/watchlist tickers and are reserved in the shared ledger."""
+        from backend.app.data_sources.quota import TickerPriorities
+
+        path = tmp_path / "rate_limits.sqlite3"
+        policy = RateLimitPolicy(daily_quota=3)
+        # Two limiter instances on one file stand in for two worker processes
+        other_process = RateLimiter("alpha_vantage", policy, path)
+        other_process.try_acquire()
+
+        http_pool = Mock()
+        http_pool.get = AsyncMock(return_value=httpx.Response(200, json=self._daily_payload()))
+        provider = AlphaVantageProvider(
+            api_key="test_key",
+            daily_limit=3,
+            rate_limiter=RateLimiter("alpha_vantage", policy, path),
+            priorities=TickerPriorities(
+                held=frozenset({"LLOY.L"}),
+                watchlist=frozenset({"BARC.L"})
+            ),
+            http_pool=http_pool
+        )
+
+        signals = await provider.fetch(tickers=["VOD.L", "BP.L", "BARC.L", "LLOY.L"])
+
+        assert [signal.ticker for signal in signals] == ["LLOY.L", "BARC.L"]
+        assert [call.kwargs["params"]["symbol"] for call in http_pool.get.call_args_list] == ["LLOY", "BARC"]
+        assert other_process.daily_remaining() == 0
+        assert other_process.try_acquire() is False
+
 
 # Test Failover Logic
 class TestDataSourceFailover:
@@ -512,6 +795,244 @@ class TestDataSourceFailover:
         assert len(signals) == 1
         assert signals[0].data.get("cached") is True
 
+    @staticmethod
+    def _recording_provider(name, signal_types):
+        """Provider returning the given signal types for requested tickers it covers."""
+
+        class RecordingProvider(DataSource):
+            def __init__(self):
+                self.requests = []
+
+            async def fetch(self, tickers=None) -> List[Signal]:
+                self.requests.append(list(tickers))
+                return [
+                    Signal(
+                        ticker=ticker,
+                        signal_type=signal_type,
+                        score=50,
+                        confidence=0.8,
+                        data={},
+                        timestamp=datetime.now(timezone.utc),
+                        source=name
+                    )
+                    for ticker in tickers
+                    for signal_type, covered in signal_types.items()
+                    if ticker in covered
+                ]
+
+            def get_source_name(self) -> str:
+                return name
+
+        return RecordingProvider()
+
+    @pytest.mark.asyncio
+    async def test_gap_fill_requests_only_missing_tickers(self):
+        """Test that backups are asked only for tickers the primary missed, with provenance."""
+        primary = self._recording_provider("eodhd", {
+            "FUNDAMENTAL_DATA": {"VOD.L", "BP.L", "HSBA.L"},
+            "PRICE_DATA": {"VOD.L", "BP.L"}
+        })
+        yahoo = self._recording_provider("yahoo", {"PRICE_UPDATE": {"HSBA.L"}})
+        alpha = self._recording_provider("alpha_vantage", {"PRICE_UPDATE": {"LLOY.L", "HSBA.L"}})
+
+        failover = DataSourceFailover(
+            providers={"eodhd": primary, "yahoo": yahoo, "alpha_vantage": alpha},
+            priority_order=["eodhd", "yahoo", "alpha_vantage"],
+            merge_mode=True,
+            required_data_types=["prices"],
+            provider_data_types={"yahoo": ["prices"], "alpha_vantage": ["prices"]}
+        )
+
+        result = await failover.fetch_with_gap_fill(["VOD.L", "BP.L", "HSBA.L", "LLOY.L", "BARC.L"])
+
+        assert primary.requests == [["VOD.L", "BP.L", "HSBA.L", "LLOY.L", "BARC.L"]]
+        assert yahoo.requests == [["HSBA.L", "LLOY.L", "BARC.L"]]
+        assert alpha.requests == [["LLOY.L", "BARC.L"]]
+
+        assert result.provenance["HSBA.L"] == {"fundamentals": "eodhd", "prices": "yahoo"}
+        assert result.provenance["LLOY.L"] == {"prices": "alpha_vantage"}
+        assert result.provenance["VOD.L"] == {"fundamentals": "eodhd", "prices": "eodhd"}
+        assert result.missing == ["BARC.L"]
+        assert len(result.signals) == 7
+
+    @pytest.mark.asyncio
+    async def test_gap_fill_skips_backups_once_complete(self, mock_providers):
+        """Test that merge mode stops once every ticker is covered."""
+        signal = Signal(
+            ticker="VOD.L",
+            signal_type="TEST",
+            score=50,
+            confidence=0.8,
+            data={},
+            timestamp=datetime.now(timezone.utc),
+            source="primary"
+        )
+        primary = mock_providers("primary", signals=[signal])
+        backup = mock_providers("backup", should_fail=True)
+
+        failover = DataSourceFailover(
+            providers={"primary": primary, "backup": backup},
+            priority_order=["primary", "backup"],
+            merge_mode=True
+        )
+
+        signals = await failover.fetch_with_failover(tickers=["VOD.L"])
+
+        assert [s.source for s in signals] == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_gap_fill_primary_failure_falls_through(self):
+        """Test that a failing provider leaves its tickers for the next one."""
+        class FailingProvider(DataSource):
+            async def fetch(self, tickers=None) -> List[Signal]:
+                raise ConnectionError("refused")
+
+            def get_source_name(self) -> str:
+                return "primary"
+
+        backup = self._recording_provider("backup", {"PRICE_UPDATE": {"VOD.L", "BP.L"}})
+        failover = DataSourceFailover(
+            providers={"primary": FailingProvider(), "backup": backup},
+            priority_order=["primary", "backup"],
+            max_retries=0,
+            merge_mode=True
+        )
+
+        result = await failover.fetch_with_gap_fill(["VOD.L", "BP.L"])
+
+        assert backup.requests == [["VOD.L", "BP.L"]]
+        assert result.missing == []
+        assert {ticker: types["prices"] for ticker, types in result.provenance.items()} == {
+            "VOD.L": "backup", "BP.L": "backup"
+        }
+
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_failing_primary(self, mock_providers):
+        """Test that an open breaker skips the primary without calling it."""
+        from backend.app.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+
+        backup_signal = Signal(
+            ticker="VOD.L",
+            signal_type="TEST",
+            score=50,
+            confidence=0.8,
+            data={},
+            timestamp=datetime.now(timezone.utc),
+            source="backup"
+        )
+        primary = mock_providers("primary", should_fail=True)
+        primary.fetch = AsyncMock(side_effect=Exception("primary failed"))
+        backup = mock_providers("backup", signals=[backup_signal])
+
+        failover = DataSourceFailover(
+            providers={"primary": primary, "backup": backup},
+            priority_order=["primary", "backup"],
+            max_retries=0,
+            circuit_breakers={
+                "primary": CircuitBreaker("primary", CircuitBreakerConfig(failure_threshold=2))
+            }
+        )
+
+        for _ in range(4):
+            signals = await failover.fetch_with_failover(tickers=["VOD.L"])
+            assert signals[0].source == "backup"
+
+        assert primary.fetch.call_count == 2
+        stats = failover.get_circuit_breaker_stats()["primary"]
+        assert stats["state"] == "open"
+        assert stats["rejected"] == 2
+
+    @staticmethod
+    def _timed_provider(name, delay, events):
+        """Provider answering after delay seconds, recording cancellation."""
+
+        class TimedProvider(DataSource):
+            async def fetch(self, tickers=None) -> List[Signal]:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    events.append(f"{name}_cancelled")
+                    raise
+                return [
+                    Signal(
+                        ticker=ticker,
+                        signal_type="PRICE_UPDATE",
+                        score=50,
+                        confidence=0.8,
+                        data={},
+                        timestamp=datetime.now(timezone.utc),
+                        source=name
+                    )
+                    for ticker in tickers
+                ]
+
+            def get_source_name(self) -> str:
+                return name
+
+        return TimedProvider()
+
+    @pytest.mark.asyncio
+    async def test_hedged_backup_wins_when_primary_slow(self):
+        """Test that a primary slower than its p95 is raced by the backup, which wins."""
+        import time
+        from backend.app.data_sources.hedging import HedgePolicy
+
+        events = []
+        failover = DataSourceFailover(
+            providers={
+                "primary": self._timed_provider("primary", 1.0, events),
+                "backup": self._timed_provider("backup", 0.0, events)
+            },
+            priority_order=["primary", "backup"],
+            hedging=HedgePolicy(min_samples=5, min_delay_seconds=0.01)
+        )
+        for _ in range(5):
+            failover._hedger.record_latency("primary", 0.02, request_size=1)
+
+        started = time.monotonic()
+        signals = await failover.fetch_with_failover(tickers=["VOD.L"])
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(0)
+
+        assert signals[0].source == "backup"
+        assert elapsed < 0.5
+        assert events == ["primary_cancelled"]
+        stats = failover.get_hedge_stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+
+        # The cancelled primary is recorded at its elapsed time, not dropped
+        assert stats["latency"]["primary"]["<=1"]["samples"] == 6
+        assert stats["latency"]["primary"]["<=1"]["p95"] >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_budget_or_history(self):
+        """Test that the primary is awaited when hedging is not possible."""
+        from backend.app.data_sources.hedging import HedgePolicy
+
+        events = []
+        failover = DataSourceFailover(
+            providers={
+                "primary": self._timed_provider("primary", 0.05, events),
+                "backup": self._timed_provider("backup", 0.0, events)
+            },
+            priority_order=["primary", "backup"],
+            hedging=HedgePolicy(min_samples=5, min_delay_seconds=0.01, max_budget=0.0)
+        )
+
+        # No latency history yet: plain primary fetch, which seeds the history
+        signals = await failover.fetch_with_failover(tickers=["VOD.L"])
+        assert signals[0].source == "primary"
+
+        for _ in range(20):
+            failover._hedger.record_latency("primary", 0.01, request_size=1)
+
+        # History says hedge after 10ms, but the budget is empty
+        signals = await failover.fetch_with_failover(tickers=["VOD.L"])
+        assert signals[0].source == "primary"
+        assert events == []
+        assert failover.get_hedge_stats()["budget_denied"] == 1
 
 # Test Configuration
 class TestDataSourcesConfig:
@@ -694,17 +1215,70 @@ class TestEODHDProvider:
         """Test cache expiry after TTL."""
         provider = EODHDProvider(api_key="test_key", cache_ttl_hours=1)
 
-        # Add to cache
-        provider._add_to_cache("test_key", {"test": "data"})
-
-        # Backdate timestamp to simulate expiry
-        provider._cache_timestamps["test_key"] = datetime.now(timezone.utc) - timedelta(hours=2)
+        # Add to cache with a store time 2 hours ago to simulate expiry
+        provider._cache.set(
+            "test_key",
+            {"test": "data"},
+            stored_at=(datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        )
 
         # Cache should be expired
         cached_data = provider._get_from_cache("test_key")
         assert cached_data is None
         assert "test_key" not in provider._cache
 
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_stale_cache_served_while_revalidating(self, mock_get):
+        """Test entries past the soft TTL are served at once and refreshed in background."""
+        mock_get.return_value = httpx.Response(
+            200, json={"General": {"Code": "VOD", "Name": "Vodafone Group PLC"}}
+        )
+
+        provider = EODHDProvider(api_key="test_key", cache_ttl_hours=1, cache_hard_ttl_hours=24)
+        stored_at = (datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        provider._cache.set("VOD.LSE:profile", {"name": "Vodafone (stale)"}, stored_at=stored_at)
+        provider._cache.set(
+            "VOD.LSE:fundamentals_payload",
+            {"raw_response_ref": provider.payload_store.put({"General": {}})},
+            stored_at=stored_at
+        )
+
+        # Concurrent stale reads return immediately and share one refresh
+        profiles = await asyncio.gather(*[provider.fetch_company_profile("VOD.LSE") for _ in range(3)])
+        assert all(profile["name"] == "Vodafone (stale)" for profile in profiles)
+
+        await asyncio.gather(*provider._refresh_tasks)
+        assert mock_get.call_count == 1
+
+        # Refreshed payload replaces the stale view without another request
+        profile = await provider.fetch_company_profile("VOD.LSE")
+        assert profile["name"] == "Vodafone Group PLC"
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_stale_cache_refresh_skipped_when_rate_limited(self, mock_get):
+        """Test no background refresh is started once the daily limit is spent."""
+        provider = EODHDProvider(
+            api_key="test_key",
+            cache_ttl_hours=1,
+            cache_hard_ttl_hours=24,
+            rate_limit_per_day=1
+        )
+        provider._api_call_count = 1
+        provider._cache.set(
+            "LSE:bulk_last_day",
+            {"VOD.LSE": {"close": 1.0}},
+            stored_at=(datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        )
+
+        latest = await provider.fetch_bulk_last_day()
+
+        assert latest == {"VOD.LSE": {"close": 1.0}}
+        assert not provider._refresh_tasks
+        assert mock_get.call_count == 0
+
     def test_calculate_fundamental_score(self):
         """Test fundamental score calculation."""
         provider = EODHDProvider(api_key="test_key")
@@ -813,6 +1387,86 @@ class TestEODHDProvider:
         # Should get cached signal with lower confidence
         assert len(signals) >= 0  # May return cached signal
 
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_concurrent_fetch_respects_in_flight_limit(self, mock_get):
+        """Test ticker fan-out stays within max_concurrency and keeps ticker order."""
+        in_flight = 0
+        max_seen = 0
+
+        async def slow_get(url, params=None):
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"General": {"Code": url.rsplit("/", 1)[-1]}}
+            return response
+
+        mock_get.side_effect = slow_get
+
+        tickers = ["VOD.L", "BP.L", "LLOY.L", "BARC.L", "HSBA.L"]
+        provider = EODHDProvider(api_key="test_key", tickers=tickers, max_concurrency=2)
+        signals = await provider.fetch()
+
+        assert max_seen == 2
+        fundamental_tickers = [s.ticker for s in signals if s.signal_type == "FUNDAMENTAL_DATA"]
+        assert fundamental_tickers == tickers
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_concurrent_fetch_does_not_overshoot_rate_limit(self, mock_get):
+        """Test concurrent tickers cannot exceed the daily call limit."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"General": {"Code": "VOD"}}
+        mock_get.return_value = mock_response
+
+        provider = EODHDProvider(
+            api_key="test_key",
+            tickers=["VOD.L", "BP.L", "LLOY.L", "BARC.L"],
+            rate_limit_per_day=3,
+            max_concurrency=4
+        )
+        await provider.fetch()
+
+        assert provider._api_call_count == 3
+        assert mock_get.call_count == 3
+
+    def test_concurrency_limits_from_config(self):
+        """Test concurrency limits are read from config unless passed explicitly."""
+        config = {"max_concurrency": 3, "max_concurrency_per_host": 2}
+
+        provider = EODHDProvider(api_key="test_key", config=config)
+        assert provider.max_concurrency == 3
+        assert provider.max_concurrency_per_host == 2
+
+        provider = EODHDProvider(api_key="test_key", config=config, max_concurrency=1)
+        assert provider.max_concurrency == 1
+
+        with pytest.raises(ValueError):
+            EODHDProvider(api_key="test_key", config={"max_concurrency": 0})
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_shared_rate_limiter_budget(self, mock_get):
+        """Test providers sharing a rate limiter draw from one daily budget."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"General": {"Code": "VOD"}}
+        mock_get.return_value = mock_response
+
+        limiter = RateLimiter("eodhd", RateLimitPolicy(daily_quota=3))
+        first = EODHDProvider(api_key="test_key", tickers=["VOD.L", "BP.L"], rate_limiter=limiter)
+        second = EODHDProvider(api_key="test_key", tickers=["LLOY.L", "BARC.L"], rate_limiter=limiter)
+        await first.fetch()
+        await second.fetch()
+
+        assert mock_get.call_count == 3
+        assert limiter.daily_remaining() == 0
+
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_fetch_historical_prices_success(self, mock_get):
@@ -851,6 +1505,353 @@ class TestEODHDProvider:
         assert prices["prices"][0]["close"] == 147.0
         assert prices["prices"][1]["close"] == 149.0
 
+    def test_bulk_prices_from_config(self):
+        """Test bulk price mode is read from config unless passed explicitly."""
+        assert EODHDProvider(api_key="test_key").bulk_prices is False
+        assert EODHDProvider(api_key="test_key", config={"bulk_prices": True}).bulk_prices is True
+        assert EODHDProvider(
+            api_key="test_key", config={"bulk_prices": True}, bulk_prices=False
+        ).bulk_prices is False
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_last_day_merges_into_history(self, mock_get):
+        """Test bulk last-day bars extend backfilled history without per-ticker calls."""
+        history_response = Mock()
+        history_response.status_code = 200
+        history_response.json.return_value = [
+            {"date": "2025-11-03", "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000},
+            {"date": "2025-11-04", "open": 100, "high": 106, "low": 100, "close": 105, "volume": 3000}
+        ]
+        bulk_response = Mock()
+        bulk_response.status_code = 200
+        bulk_response.json.return_value = [
+            {"code": "VOD", "exchange_short_name": "LSE", "date": "2025-11-05",
+             "open": 105, "high": 111, "low": 104, "close": 110, "volume": 2000},
+            {"code": "BP", "exchange_short_name": "LSE", "date": "2025-11-05",
+             "open": 400, "high": 410, "low": 395, "close": 405, "volume": 9000}
+        ]
+
+        def get_side_effect(url, params=None):
+            return bulk_response if "/eod-bulk-last-day/" in url else history_response
+
+        mock_get.side_effect = get_side_effect
+
+        provider = EODHDProvider(api_key="test_key", bulk_prices=True)
+        await provider.fetch_historical_prices("VOD.LSE", "2025-11-03", "2025-11-04")
+        latest = await provider.fetch_bulk_last_day()
+
+        assert set(latest) == {"VOD.LSE", "BP.LSE"}
+        assert mock_get.call_count == 2
+
+        prices = await provider.fetch_historical_prices("VOD.LSE", "2025-11-03", "2025-11-05")
+        assert mock_get.call_count == 2  # Served from history
+        assert [p["date"] for p in prices["prices"]] == ["2025-11-03", "2025-11-04", "2025-11-05"]
+        assert prices["latest_price"] == 110
+        assert prices["price_change_30d"] == 10.0
+
+        # BP only has the bulk bar, so it still needs a backfill of the gap
+        await provider.fetch_historical_prices("BP.LSE", "2025-11-03", "2025-11-05")
+        assert mock_get.call_count == 3
+        assert mock_get.call_args.kwargs["params"]["to"] == "2025-11-04"
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_prices_fetch_makes_one_call(self, mock_get):
+        """Test a bulk fetch over backfilled history needs no per-ticker /eod calls."""
+        # e.g. a Monday morning, when the latest published bar is Friday's
+        today = datetime.now(timezone.utc).date()
+        last_day = (today - timedelta(days=3)).isoformat()
+        mock_get.return_value = httpx.Response(200, json=[
+            {"code": code, "exchange_short_name": "LSE", "date": last_day,
+             "open": 100, "high": 102, "low": 99, "close": 101, "volume": 1000}
+            for code in ("VOD", "BP")
+        ])
+
+        provider = EODHDProvider(api_key="test_key", tickers=["VOD.L", "BP.L"], bulk_prices=True)
+        for ticker in ("VOD.LSE", "BP.LSE"):
+            provider.price_store.add_bars(
+                ticker,
+                [{"date": (today - timedelta(days=4)).isoformat(), "close": 100}],
+                (today - timedelta(days=40)).isoformat(),
+                (today - timedelta(days=4)).isoformat()
+            )
+
+        signals = await provider.fetch(FetchPlan.prices_only())
+
+        assert mock_get.call_count == 1
+        assert "/eod-bulk-last-day/" in mock_get.call_args.args[0]
+        assert [signal.data["latest_price"] for signal in signals] == [101, 101]
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_historical_prices_only_fetch_missing_days(self, mock_get):
+        """Test a wider window only requests the days not already stored."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {"date": "2025-11-03", "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000}
+        ]
+        mock_get.return_value = mock_response
+
+        provider = EODHDProvider(api_key="test_key")
+        await provider.fetch_historical_prices("VOD.LSE", "2025-11-03", "2025-11-04")
+        await provider.fetch_historical_prices("VOD.LSE", "2025-11-03", "2025-11-04")
+        assert mock_get.call_count == 1
+
+        await provider.fetch_historical_prices("VOD.LSE", "2025-11-01", "2025-11-06")
+        # 2025-11-01/02 is a weekend, so only the trailing gap is requested
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["from"] == "2025-11-05"
+        assert mock_get.call_args.kwargs["params"]["to"] == "2025-11-06"
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_fundamentals_pages_into_cache(self, mock_get):
+        """Test bulk fundamentals pages through the exchange and serves views from cache."""
+        records = [
+            {"General": {"Code": code, "Name": f"{code} PLC"}, "Highlights": {"PERatio": 10.0}}
+            for code in ("VOD", "BP", "LLOY")
+        ]
+
+        def get_side_effect(url, params=None):
+            offset, limit = params["offset"], params["limit"]
+            page = {str(i): record for i, record in enumerate(records[offset:offset + limit])}
+            return httpx.Response(200, json=page)
+
+        mock_get.side_effect = get_side_effect
+
+        provider = EODHDProvider(api_key="test_key")
+        summary = await provider.ingest_bulk_fundamentals(page_size=2)
+
+        assert summary["complete"] is True
+        assert summary["pages"] == 2
+        assert summary["tickers"] == 3
+        assert provider._api_call_count == 2 * EODHDProvider.BULK_FUNDAMENTALS_CALL_COST
+
+        profile = await provider.fetch_company_profile("BP.LSE")
+        assert profile["name"] == "BP PLC"
+        assert mock_get.call_count == 2  # Served from the ingested page
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_fundamentals_resumes_from_last_page(self, mock_get):
+        """Test an interrupted bulk scan resumes from the last completed page."""
+        records = [{"General": {"Code": f"T{i}"}} for i in range(5)]
+        fail_offsets = {2}
+
+        def get_side_effect(url, params=None):
+            offset, limit = params["offset"], params["limit"]
+            if offset in fail_offsets:
+                return httpx.Response(500)
+            page = {str(i): record for i, record in enumerate(records[offset:offset + limit])}
+            return httpx.Response(200, json=page)
+
+        mock_get.side_effect = get_side_effect
+
+        provider = EODHDProvider(
+            api_key="test_key",
+            retry_engine=RetryEngine("test", RetryPolicy(max_attempts=1))
+        )
+        summary = await provider.ingest_bulk_fundamentals(page_size=2)
+        assert summary["complete"] is False
+        assert summary["next_offset"] == 2
+
+        fail_offsets.clear()
+        summary = await provider.ingest_bulk_fundamentals(page_size=2)
+        assert summary["complete"] is True
+        assert summary["start_offset"] == 2
+        assert summary["tickers"] == 3
+        assert [call.kwargs["params"]["offset"] for call in mock_get.call_args_list] == [0, 2, 2, 4]
+
+        # Completed scans clear the checkpoint, so the next run starts over
+        summary = await provider.ingest_bulk_fundamentals(page_size=2)
+        assert summary["start_offset"] == 0
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_fundamentals_stops_before_page_over_quota(self, mock_get):
+        """Test that a bulk page is not requested unless the quota covers its full cost."""
+        records = [{"General": {"Code": f"T{i}"}} for i in range(4)]
+
+        def get_side_effect(url, params=None):
+            offset, limit = params["offset"], params["limit"]
+            page = {str(i): record for i, record in enumerate(records[offset:offset + limit])}
+            return httpx.Response(200, json=page)
+
+        mock_get.side_effect = get_side_effect
+
+        provider = EODHDProvider(api_key="test_key", rate_limit_per_day=150)
+        with pytest.raises(EODHDRateLimitExceeded):
+            await provider.ingest_bulk_fundamentals(page_size=2)
+
+        assert mock_get.call_count == 1
+        assert provider._api_call_count == EODHDProvider.BULK_FUNDAMENTALS_CALL_COST
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_bulk_fundamentals_invalidates_cached_views(self, mock_get):
+        """Test that ingested payloads replace views built from older payloads."""
+        mock_get.return_value = httpx.Response(
+            200, json={"0": {"General": {"Code": "VOD", "Name": "Vodafone Group PLC"}}}
+        )
+
+        provider = EODHDProvider(api_key="test_key")
+        provider._cache.set("VOD.LSE:profile", {"name": "Vodafone (old)"})
+
+        await provider.ingest_bulk_fundamentals(page_size=2)
+        profile = await provider.fetch_company_profile("VOD.LSE")
+
+        assert profile["name"] == "Vodafone Group PLC"
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_prices_only_fetch_plan(self, mock_get):
+        """Test a price-only plan makes one call per ticker and no fundamentals calls."""
+        mock_get.return_value = httpx.Response(200, json=[
+            {"date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+             "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000}
+        ])
+
+        provider = EODHDProvider(api_key="test_key", tickers=["VOD.L", "BP.L"])
+        signals = await provider.fetch(FetchPlan.prices_only())
+
+        assert {signal.signal_type for signal in signals} == {"PRICE_DATA"}
+        assert mock_get.call_count == 2
+        assert all("/eod/" in call.args[0] for call in mock_get.call_args_list)
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_failover_fetches_only_requested_tickers(self, mock_get):
+        """Test a failover chain fetches just the tickers it asks for, not the whole universe."""
+        mock_get.return_value = httpx.Response(200, json=[
+            {"date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+             "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000}
+        ])
+        provider = EODHDProvider(
+            api_key="test_key",
+            tickers=["VOD.L", "BP.L", "LLOY.L"],
+            fetch_plan=FetchPlan.prices_only()
+        )
+        failover = DataSourceFailover(
+            providers={"eodhd": provider}, priority_order=["eodhd"], merge_mode=True
+        )
+
+        result = await failover.fetch_with_gap_fill(["BP.L"])
+
+        assert [signal.ticker for signal in result.signals] == ["BP.L"]
+        assert [call.args[0] for call in mock_get.call_args_list] == [
+            f"{EODHDProvider.BASE_URL}/eod/BP.LSE"
+        ]
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_price_signals_serialize_at_database_boundary(self, mock_get):
+        """Test price signals carry a PriceSeries that the engine serializer writes as bars."""
+        import json
+        from backend.app.core.database import json_serializer
+        from backend.app.data_sources.price_series import PriceSeries
+
+        today = datetime.now(timezone.utc)
+        mock_get.return_value = httpx.Response(200, json=[
+            {"date": (today - timedelta(days=1)).strftime("%Y-%m-%d"),
+             "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000},
+            {"date": today.strftime("%Y-%m-%d"),
+             "open": 100, "high": 106, "low": 100, "close": 105, "volume": 3000}
+        ])
+
+        provider = EODHDProvider(api_key="test_key", tickers=["VOD.L"])
+        signals = await provider.fetch(FetchPlan.prices_only())
+
+        assert isinstance(signals[0].data["prices"], PriceSeries)
+
+        data = json.loads(json_serializer(signals[0].data))
+        assert [bar["close"] for bar in data["prices"]] == [100.0, 105.0]
+        assert data["latest_price"] == 105.0
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_per_data_type_ttls(self, mock_get):
+        """Test each data type is refetched according to its own TTL."""
+        mock_get.return_value = httpx.Response(
+            200, json={"General": {"Code": "VOD", "Name": "Vodafone Group PLC"}}
+        )
+
+        provider = EODHDProvider(
+            api_key="test_key",
+            cache_ttl_hours_by_type={"profile": 720, "fundamentals": 24}
+        )
+        stored_at = (datetime.now(timezone.utc) - timedelta(hours=48)).timestamp()
+        provider._cache.set("VOD.LSE:profile", {"name": "Vodafone (cached)"}, stored_at=stored_at)
+        provider._cache.set("VOD.LSE:fundamentals", {"general": {}}, stored_at=stored_at)
+
+        # Profile is within its 30-day TTL; fundamentals are past their 1-day TTL
+        assert (await provider.fetch_company_profile("VOD.LSE"))["name"] == "Vodafone (cached)"
+        assert mock_get.call_count == 0
+        fundamentals = await provider.fetch_fundamentals("VOD.LSE")
+        assert fundamentals["general"]["Code"] == "VOD"
+        assert mock_get.call_count == 1
+
+        # A plan's max age overrides the configured TTL
+        profile = await provider.fetch_company_profile("VOD.LSE", max_age_hours=24)
+        assert profile["name"] == "Vodafone Group PLC"
+        assert mock_get.call_count == 1  # Rebuilt from the fresh payload
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_zero_max_age_forces_refresh(self, mock_get):
+        """Test max_age_hours=0 bypasses the cache instead of using the default TTL."""
+        mock_get.return_value = httpx.Response(
+            200, json={"General": {"Code": "VOD", "Name": "Vodafone Group PLC"}}
+        )
+
+        provider = EODHDProvider(api_key="test_key")
+        await provider.fetch_company_profile("VOD.LSE")
+        await provider.fetch_company_profile("VOD.LSE")
+        assert mock_get.call_count == 1
+
+        await provider.fetch_company_profile("VOD.LSE", max_age_hours=0)
+        assert mock_get.call_count == 2
+
+    def test_fetch_plan_rejects_unknown_data_types(self):
+        """Test fetch plans only accept known data types."""
+        with pytest.raises(ValueError, match="Unknown data types"):
+            FetchPlan(data_types=("prices", "dividends"))
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_concurrent_identical_fetches_share_one_request(self, mock_get):
+        """Test concurrent cache misses for the same data issue one request."""
+        async def slow_get(url, params=None):
+            await asyncio.sleep(0.01)
+            response = Mock()
+            response.status_code = 200
+            if "/fundamentals/" in url:
+                response.json.return_value = {"General": {"Code": "VOD", "Name": "Vodafone Group PLC"}}
+            else:
+                response.json.return_value = [
+                    {"date": "2025-11-03", "open": 100, "high": 102, "low": 99, "close": 100, "volume": 1000}
+                ]
+            return response
+
+        mock_get.side_effect = slow_get
+
+        provider = EODHDProvider(api_key="test_key")
+        results = await asyncio.gather(
+            provider.fetch_fundamentals("VOD.LSE"),
+            provider.fetch_company_profile("VOD.LSE"),
+            provider.fetch_analyst_estimates("VOD.LSE"),
+            *[provider.fetch_historical_prices("VOD.LSE", "2025-11-03", "2025-11-03") for _ in range(3)]
+        )
+
+        assert mock_get.call_count == 2
+        assert results[1]["name"] == "Vodafone Group PLC"
+        assert all(prices["latest_price"] == 100 for prices in results[3:])
+        stats = provider.get_single_flight_stats()
+        assert stats["shared"] == 4
+        assert stats["in_flight"] == 0
+
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_fetch_fundamentals_success(self, mock_get):
@@ -879,12 +1880,25 @@ class TestEODHDProvider:
         mock_get.return_value = mock_response
 
         provider = EODHDProvider(api_key="test_key")
-        fundamentals = await provider.fetch_fundamentals("VOD.LSE")
+        with patch.object(provider.payload_store, "put", wraps=provider.payload_store.put) as put:
+            fundamentals = await provider.fetch_fundamentals("VOD.LSE")
 
+        # The document is serialized, hashed and compressed once per download
+        assert put.call_count == 1
         assert fundamentals["general"]["Code"] == "VOD"
         assert fundamentals["key_metrics"]["pe_ratio"] == 12.5
         assert fundamentals["key_metrics"]["roe"] == 15.5
 
+        # Raw payload is offloaded to the payload store, referenced by hash
+        assert "raw_response" not in fundamentals
+        raw = provider.get_raw_response(fundamentals["raw_response_ref"])
+        assert raw == mock_response.json.return_value
+
+        # The cache holds only the reference, not a second copy of the payload
+        assert provider._cache.get("VOD.LSE:fundamentals_payload") == {
+            "raw_response_ref": fundamentals["raw_response_ref"]
+        }
+
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_fetch_company_profile_success(self, mock_get):
@@ -954,6 +1968,80 @@ class TestEODHDProvider:
 
         assert estimates == {}
 
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_fundamentals_views_share_one_request(self, mock_get):
+        """Test fundamentals, profile and estimates reuse one /fundamentals download."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "General": {"Code": "VOD", "Name": "Vodafone Group PLC", "Sector": "Telecommunications"},
+            "Highlights": {"PERatio": 12.5},
+            "AnalystRatings": {"Rating": 4.2, "StrongBuy": 5, "Buy": 3, "Hold": 2}
+        }
+        mock_get.return_value = mock_response
+
+        provider = EODHDProvider(api_key="test_key")
+        fundamentals = await provider.fetch_fundamentals("VOD.LSE")
+        profile = await provider.fetch_company_profile("VOD.LSE")
+        estimates = await provider.fetch_analyst_estimates("VOD.LSE")
+
+        assert fundamentals["key_metrics"]["pe_ratio"] == 12.5
+        assert profile["name"] == "Vodafone Group PLC"
+        assert estimates["total_analysts"] == 10
+        assert mock_get.call_count == 1
+        assert provider._api_call_count == 1
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_projected_decode_from_config(self, mock_get):
+        """Test projected decoding is enabled by the config key."""
+        mock_get.return_value = httpx.Response(200, json={
+            "General": {"Code": "VOD"},
+            "InsiderTransactions": [{"name": "A", "shares": 100}]
+        })
+
+        provider = EODHDProvider(api_key="test_key", config={"projected_decode": True})
+        payload = await provider._fetch_fundamentals_payload("VOD.LSE")
+
+        assert provider.projected_decode is True
+        assert set(payload) == {"General"}
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_projected_decode_keeps_view_sections(self, mock_get):
+        """Test projected decoding drops sections and quarterly history no view reads."""
+        mock_get.return_value = httpx.Response(200, json={
+            "General": {"Code": "VOD", "Sector": "Telecommunications"},
+            "Highlights": {"PERatio": 12.5},
+            "Financials": {
+                "Balance_Sheet": {
+                    "currency_symbol": "GBP",
+                    "quarterly": {"2025-06-30": {"totalAssets": "1"}},
+                    "yearly": {"2025-03-31": {"totalAssets": "1"}}
+                },
+                "currency_symbol": "GBP"
+            },
+            "Earnings": {
+                "History": {"2025-06-30": {"epsActual": 0.01}},
+                "Annual": {"2025-03-31": {"epsActual": 0.04}}
+            },
+            "InsiderTransactions": [{"name": "A", "shares": 100}],
+            "SplitsDividends": {"history": []}
+        })
+
+        provider = EODHDProvider(api_key="test_key", projected_decode=True)
+        payload = await provider._fetch_fundamentals_payload("VOD.LSE")
+
+        assert set(payload) == {"General", "Highlights", "Financials", "Earnings"}
+        assert payload["Financials"] == {
+            "Balance_Sheet": {"currency_symbol": "GBP", "yearly": {"2025-03-31": {"totalAssets": "1"}}}
+        }
+        assert payload["Earnings"] == {"Annual": {"2025-03-31": {"epsActual": 0.04}}}
+
+        fundamentals = await provider.fetch_fundamentals("VOD.LSE")
+        assert fundamentals["key_metrics"]["pe_ratio"] == 12.5
+
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_retry_on_429_rate_limit(self, mock_get):
@@ -1024,14 +2112,19 @@ class TestEODHDProvider:
 
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
-    async def test_exponential_backoff_timing(self, mock_get):
-        """Test exponential backoff delays (1s, 3s, 9s)."""
+    async def test_backoff_timing_uses_retry_engine(self, mock_get):
+        """Test jittered backoff delays come from the provider's retry engine."""
         # All attempts return 429
         mock_response_429 = Mock()
         mock_response_429.status_code = 429
         mock_get.return_value = mock_response_429
 
-        provider = EODHDProvider(api_key="test_key", max_retries=3)
+        engine = RetryEngine(
+            "eodhd",
+            RetryPolicy(max_attempts=3, base_delay=0.05, max_delay=0.2),
+            budget=RetryBudget()
+        )
+        provider = EODHDProvider(api_key="test_key", retry_engine=engine)
 
         start_time = asyncio.get_event_loop().time()
 
@@ -1043,10 +2136,34 @@ class TestEODHDProvider:
 
         elapsed = asyncio.get_event_loop().time() - start_time
 
-        # Should have delays of 1 + 3 = 4 seconds minimum (3rd attempt doesn't delay)
-        # Allow some tolerance for test execution time
-        assert elapsed >= 4.0
+        # Two backoffs of at least base_delay each (3rd attempt doesn't delay)
+        assert 0.1 <= elapsed < 1.0
         assert mock_get.call_count == 3
+        assert provider.get_retry_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_retry_after_header_honoured(self, mock_get):
+        """Test that a 429 Retry-After hint sets the minimum wait."""
+        mock_get.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "0.3"}),
+            httpx.Response(200, json={"test": "data"})
+        ]
+
+        engine = RetryEngine(
+            "eodhd",
+            RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.02),
+            budget=RetryBudget()
+        )
+        provider = EODHDProvider(api_key="test_key", retry_engine=engine)
+
+        start_time = asyncio.get_event_loop().time()
+        result = await provider._make_request_with_retry("http://test.com/api", {})
+        elapsed = asyncio.get_event_loop().time() - start_time
+
+        assert result == {"test": "data"}
+        assert elapsed >= 0.3
+        assert engine.stats()["retry_after_honoured"] == 1
 
     @pytest.mark.asyncio
     async def test_implements_datasource_interface(self):
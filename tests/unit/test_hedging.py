@@ -0,0 +1,94 @@
+"""
+Unit tests for hedged-request latency tracking and budgeting.
+"""
+
+from backend.app.data_sources.hedging import (
+    HedgePolicy,
+    Hedger,
+    LatencyTracker,
+    request_size_class,
+)
+
+
+class TestLatencyTracker:
+    """Test LatencyTracker windowing and percentiles."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles over the window."""
+        tracker = LatencyTracker(window=100)
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        assert tracker.percentile(95) == 0.095
+        assert tracker.percentile(50) == 0.05
+        assert tracker.percentile(100) == 0.1
+
+    def test_window_keeps_recent_samples(self):
+        """Test that old samples fall out of the window."""
+        tracker = LatencyTracker(window=3)
+        for seconds in (10.0, 1.0, 1.0, 1.0):
+            tracker.record(seconds)
+
+        assert tracker.count == 3
+        assert tracker.percentile(100) == 1.0
+        assert LatencyTracker().percentile(95) is None
+
+
+class TestHedger:
+    """Test Hedger delay and budget."""
+
+    def test_no_hedge_until_min_samples(self):
+        """Test that the hedge delay needs enough latency history."""
+        hedger = Hedger(HedgePolicy(min_samples=3, min_delay_seconds=0.0))
+        hedger.record_latency("eodhd", 0.2)
+        hedger.record_latency("eodhd", 0.4)
+        assert hedger.hedge_delay("eodhd") is None
+
+        hedger.record_latency("eodhd", 0.3)
+        assert hedger.hedge_delay("eodhd") == 0.4
+
+    def test_delay_is_clamped(self):
+        """Test min and max hedge delay bounds."""
+        hedger = Hedger(HedgePolicy(min_samples=1, min_delay_seconds=0.5, max_delay_seconds=2.0))
+        hedger.record_latency("fast", 0.01)
+        hedger.record_latency("slow", 30.0)
+
+        assert hedger.hedge_delay("fast") == 0.5
+        assert hedger.hedge_delay("slow") == 2.0
+
+    def test_delay_tracked_per_request_size(self):
+        """Test that universe-wide and single-ticker latencies do not mix."""
+        hedger = Hedger(HedgePolicy(min_samples=1, min_delay_seconds=0.0))
+        hedger.record_latency("eodhd", 30.0)
+        hedger.record_latency("eodhd", 0.2, request_size=1)
+        hedger.record_latency("eodhd", 4.0, request_size=50)
+
+        assert hedger.hedge_delay("eodhd") == 30.0
+        assert hedger.hedge_delay("eodhd", request_size=1) == 0.2
+        assert hedger.hedge_delay("eodhd", request_size=40) == 4.0
+        assert hedger.hedge_delay("eodhd", request_size=2) is None
+        assert set(hedger.stats()["latency"]["eodhd"]) == {"all", "<=1", "<=64"}
+
+    def test_request_size_classes(self):
+        """Test request sizes are grouped by powers of two."""
+        assert request_size_class(None) == "all"
+        assert request_size_class(1) == "<=1"
+        assert request_size_class(3) == "<=4"
+        assert request_size_class(64) == "<=64"
+        assert request_size_class(65) == "<=128"
+
+    def test_budget_limits_hedges_to_ratio_of_requests(self):
+        """Test that hedges are capped once the initial budget is spent."""
+        hedger = Hedger(HedgePolicy(budget_ratio=0.1, max_budget=1.0))
+
+        hedges = 0
+        for _ in range(50):
+            hedger.record_request()
+            if hedger.try_hedge():
+                hedges += 1
+
+        assert hedges <= 1 + 50 * 0.1
+        stats = hedger.stats()
+        assert stats["requests"] == 50
+        assert stats["hedges"] == hedges
+        assert stats["budget_denied"] == 50 - hedges
@@ -0,0 +1,135 @@
+"""
+Unit tests for the shared HTTP connection pool.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from backend.app.core.http_pool import (
+    HTTPPool,
+    HTTPPoolConfig,
+    close_http_pool,
+    get_http_pool,
+    open_http_pool,
+)
+
+
+class TestHTTPPool:
+    """Test HTTPPool limits, metrics and lifecycle."""
+
+    def test_config_from_dict_ignores_unknown_keys(self):
+        """Test building pool settings from the YAML section."""
+        config = HTTPPoolConfig.from_config(
+            {"max_connections": 50, "http2": True, "unknown": 1}
+        )
+        assert config.max_connections == 50
+        assert config.http2 is True
+        assert HTTPPoolConfig.from_config(None) == HTTPPoolConfig()
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_per_host_in_flight_limit(self, mock_get):
+        """Test that requests to one host never exceed the per-host limit."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_get(url, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(status_code=200)
+
+        mock_get.side_effect = slow_get
+
+        pool = HTTPPool(HTTPPoolConfig(max_connections_per_host=2))
+        await asyncio.gather(*[
+            pool.get("https://eodhd.com/api/eod/VOD.LSE", params={"i": i}) for i in range(6)
+        ])
+
+        assert peak == 2
+        stats = pool.stats()
+        assert stats["requests"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 2
+        assert stats["hosts"]["eodhd.com"] == {"requests": 6, "in_flight": 0}
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient.get')
+    async def test_errors_counted(self, mock_get):
+        """Test that failed requests are counted and re-raised."""
+        mock_get.side_effect = ConnectionError("refused")
+        pool = HTTPPool()
+
+        with pytest.raises(ConnectionError):
+            await pool.get("https://eodhd.com/api/eod/VOD.LSE")
+
+        assert pool.stats()["errors"] == 1
+        assert pool.stats()["in_flight"] == 0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_reused_until_closed(self):
+        """Test that the pooled client is shared and closed cleanly."""
+        pool = HTTPPool()
+        client = pool.client
+
+        assert pool.client is client
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.stats()["closed"] is True
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_lifecycle(self):
+        """Test opening, sharing and closing the application pool."""
+        pool = open_http_pool(HTTPPoolConfig(max_connections=5))
+
+        assert get_http_pool() is pool
+        assert pool.config.max_connections == 5
+
+        await close_http_pool()
+        assert get_http_pool() is not pool
+
+    def test_client_rebuilt_for_new_loop_closes_old_client(self):
+        """Test that the client replaced for a new event loop is closed."""
+        pool = HTTPPool()
+
+        async def borrow_client():
+            client = pool.client
+            await asyncio.sleep(0)
+            return client
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            old_client = first_loop.run_until_complete(borrow_client())
+            new_client = second_loop.run_until_complete(borrow_client())
+
+            assert new_client is not old_client
+            assert old_client.is_closed
+            second_loop.run_until_complete(pool.aclose())
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    def test_same_pool_from_both_import_roots(self):
+        """Test that the API and provider import roots share one pool."""
+        api_http_pool = pytest.importorskip("app.core.http_pool")
+
+        assert api_http_pool.get_http_pool is get_http_pool
+        assert api_http_pool.get_http_pool() is get_http_pool()
+
+    @pytest.mark.asyncio
+    async def test_provider_uses_pool_opened_after_construction(self):
+        """Test that providers resolve the shared pool per request."""
+        from backend.app.data_sources.providers.eodhd_provider import EODHDProvider
+
+        provider = EODHDProvider(api_key="test_key")
+        pool = open_http_pool(HTTPPoolConfig(max_connections=5))
+
+        assert provider._http is pool
+        await close_http_pool()
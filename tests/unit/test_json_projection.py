@@ -0,0 +1,69 @@
+"""
+Unit tests for projection-based JSON decoding.
+"""
+
+import json
+
+import pytest
+
+from backend.app.data_sources import json_projection
+from backend.app.data_sources.json_projection import decode_projected, project
+
+
+DOCUMENT = {
+    "General": {"Code": "VOD", "Name": "Vodafone Group PLC"},
+    "Financials": {
+        "Balance_Sheet": {"yearly": {"2024-03-31": {"totalAssets": "1000"}}},
+        "Income_Statement": {"yearly": {}},
+        "currency_symbol": "GBP"
+    },
+    "AnalystRatings": 3.5,
+    "SplitsDividends": {"history": [{"date": "2000-01-01", "ratio": "2:1"}]},
+    "InsiderTransactions": [{"name": "A", "shares": 100}] * 50
+}
+
+PROJECTION = {
+    "General": True,
+    "Financials": {"Balance_Sheet": True},
+    "AnalystRatings": {"Rating": True},
+    "Missing": True
+}
+
+EXPECTED = {
+    "General": {"Code": "VOD", "Name": "Vodafone Group PLC"},
+    "Financials": {"Balance_Sheet": {"yearly": {"2024-03-31": {"totalAssets": "1000"}}}},
+    "AnalystRatings": 3.5
+}
+
+
+@pytest.fixture(params=["streaming", "stdlib"])
+def decoder_mode(request, monkeypatch):
+    """Run each test with the ijson stream parser and the stdlib walker."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_projection, "ijson", None)
+    elif json_projection.ijson is None:
+        pytest.skip("ijson not installed")
+    return request.param
+
+
+class TestDecodeProjected:
+    """Test decode_projected for both decoding backends."""
+
+    def test_keeps_only_declared_keys(self, decoder_mode):
+        """Test that undeclared sections and nested keys are dropped."""
+        body = json.dumps(DOCUMENT).encode()
+        assert decode_projected(body, PROJECTION) == EXPECTED
+
+    def test_matches_project_on_decoded_value(self, decoder_mode):
+        """Test that decoding and projecting a decoded document agree."""
+        body = json.dumps(DOCUMENT, indent=2)
+        assert decode_projected(body, PROJECTION) == project(DOCUMENT, PROJECTION)
+
+    def test_non_object_document_fully_decoded(self, decoder_mode):
+        """Test that list responses are returned unchanged."""
+        assert decode_projected(b'[{"date": "2025-11-03"}]', PROJECTION) == [{"date": "2025-11-03"}]
+
+    def test_invalid_json_raises(self, decoder_mode):
+        """Test that malformed documents raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            decode_projected(b'{"General": {"Code": "VOD"},}', PROJECTION)
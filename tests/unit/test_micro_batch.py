@@ -0,0 +1,82 @@
+"""
+Unit tests for micro-batching of single-key requests.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.app.data_sources.micro_batch import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test MicroBatcher coalescing, early flush and error propagation."""
+
+    @pytest.mark.asyncio
+    async def test_requests_in_window_share_one_fetch(self):
+        """Test that concurrent requests are resolved from one batch fetch."""
+        batches = []
+
+        async def fetch_many(keys):
+            batches.append(keys)
+            return {key: key.lower() for key in keys if key != "MISS.L"}
+
+        batcher = MicroBatcher(fetch_many, window_seconds=0.01)
+        results = await asyncio.gather(
+            batcher.submit("VOD.L"),
+            batcher.submit("BP.L"),
+            batcher.submit("VOD.L"),
+            batcher.submit("MISS.L")
+        )
+
+        assert batches == [["VOD.L", "BP.L", "MISS.L"]]
+        assert results == ["vod.l", "bp.l", "vod.l", None]
+        assert batcher.stats() == {"requests": 4, "batches": 1, "keys": 3, "waiting": 0}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self):
+        """Test that reaching max_batch_size does not wait for the window."""
+        batches = []
+
+        async def fetch_many(keys):
+            batches.append(keys)
+            return {key: True for key in keys}
+
+        batcher = MicroBatcher(fetch_many, window_seconds=10, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("VOD.L"), batcher.submit("BP.L")),
+            timeout=1
+        )
+
+        assert results == [True, True]
+        assert batches == [["VOD.L", "BP.L"]]
+
+    @pytest.mark.asyncio
+    async def test_later_requests_start_new_batch(self):
+        """Test that a request after the window closed is fetched separately."""
+        batches = []
+
+        async def fetch_many(keys):
+            batches.append(keys)
+            return {key: True for key in keys}
+
+        batcher = MicroBatcher(fetch_many, window_seconds=0.001)
+        await batcher.submit("VOD.L")
+        await batcher.submit("BP.L")
+
+        assert batches == [["VOD.L"], ["BP.L"]]
+
+    @pytest.mark.asyncio
+    async def test_error_delivered_to_all_waiters(self):
+        """Test that every waiter receives the batch fetch's exception."""
+        async def fetch_many(keys):
+            raise ConnectionError("refused")
+
+        batcher = MicroBatcher(fetch_many, window_seconds=0.001)
+        results = await asyncio.gather(
+            batcher.submit("VOD.L"),
+            batcher.submit("BP.L"),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
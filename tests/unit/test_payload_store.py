@@ -0,0 +1,71 @@
+"""
+Unit tests for the content-addressed raw payload store.
+"""
+
+from unittest.mock import patch
+
+from backend.app.data_sources.payload_store import PayloadStore
+
+
+class TestPayloadStore:
+    """Test PayloadStore round trips, deduplication and persistence."""
+
+    def test_put_and_get_round_trip(self):
+        """Test that a stored payload is returned unchanged."""
+        store = PayloadStore()
+        payload = {"General": {"Code": "VOD"}, "Highlights": {"PERatio": 12.5}}
+
+        ref = store.put(payload)
+
+        assert ref in store
+        assert store.get(ref) == payload
+        assert store.get("missing") is None
+
+    def test_identical_payloads_stored_once(self):
+        """Test that equal payloads share one hash regardless of key order."""
+        store = PayloadStore()
+
+        first = store.put({"a": 1, "b": [1, 2, 3]})
+        second = store.put({"b": [1, 2, 3], "a": 1})
+
+        assert first == second
+        assert store.stats()["payloads"] == 1
+
+    def test_payloads_compressed(self):
+        """Test that repetitive payloads are stored compressed."""
+        store = PayloadStore()
+        store.put({"yearly": {str(year): {"totalRevenue": "1000000"} for year in range(1990, 2025)}})
+
+        stats = store.stats()
+        assert stats["compressed_size"] < stats["size"] / 3
+
+    def test_payloads_persist_across_instances(self, tmp_path):
+        """Test that payloads survive reopening the database."""
+        path = tmp_path / "payloads.sqlite3"
+        ref = PayloadStore(path).put({"General": {"Code": "VOD"}})
+
+        assert PayloadStore(path).get(ref) == {"General": {"Code": "VOD"}}
+
+    def test_prune_drops_payloads_not_restored_within_max_age(self):
+        """Test that pruning keeps payloads stored again within the retention window."""
+        store = PayloadStore(max_age_hours=24)
+        with patch("backend.app.data_sources.payload_store.time.time", return_value=0.0):
+            old = store.put({"version": 1})
+            refreshed = store.put({"version": 2})
+        with patch("backend.app.data_sources.payload_store.time.time", return_value=30 * 3600.0):
+            store.put({"version": 2})
+            assert store.prune() == 1
+
+        assert old not in store
+        assert refreshed in store
+
+    def test_prune_drops_unreferenced_payloads(self):
+        """Test that pruning with a reference set keeps only referenced payloads."""
+        store = PayloadStore()
+        kept = store.put({"version": 2})
+        dropped = store.put({"version": 1})
+
+        assert store.prune() == 0  # No retention configured
+        assert store.prune(referenced=[kept]) == 1
+        assert kept in store
+        assert dropped not in store
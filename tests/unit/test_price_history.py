@@ -0,0 +1,96 @@
+"""
+Unit tests for the persistent OHLCV price history store.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from backend.app.data_sources.price_history import PriceHistoryStore, coverage_end
+
+
+def _bar(date: str, close: float) -> dict:
+    return {
+        "date": date,
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "adjusted_close": close,
+        "volume": 1000
+    }
+
+
+class TestPriceHistoryStore:
+    """Test PriceHistoryStore coverage tracking and persistence."""
+
+    def test_empty_store_reports_whole_window_missing(self):
+        """Test that an unknown ticker is missing the full window."""
+        store = PriceHistoryStore()
+        assert store.missing_ranges("VOD.LSE", "2025-11-03", "2025-11-07") == [
+            ("2025-11-03", "2025-11-07")
+        ]
+
+    def test_adjacent_ranges_merge(self):
+        """Test that adjacent and overlapping fetched ranges merge into one."""
+        store = PriceHistoryStore()
+        store.add_bars("VOD.LSE", [_bar("2025-11-03", 1.0)], "2025-11-03", "2025-11-04")
+        store.add_bars("VOD.LSE", [_bar("2025-11-05", 2.0)], "2025-11-05", "2025-11-05")
+        store.add_bars("VOD.LSE", [], "2025-11-04", "2025-11-07")
+
+        assert store.get_coverage("VOD.LSE") == [("2025-11-03", "2025-11-07")]
+        assert store.missing_ranges("VOD.LSE", "2025-11-03", "2025-11-07") == []
+
+    def test_interior_gap_reported(self):
+        """Test that holes between covered ranges are reported in order."""
+        store = PriceHistoryStore()
+        store.add_bars("VOD.LSE", [], "2025-11-03", "2025-11-04")
+        store.add_bars("VOD.LSE", [], "2025-11-06", "2025-11-06")
+
+        assert store.missing_ranges("VOD.LSE", "2025-11-03", "2025-11-11") == [
+            ("2025-11-05", "2025-11-05"),
+            ("2025-11-07", "2025-11-11")
+        ]
+
+    def test_weekend_only_gap_not_missing(self):
+        """Test that a Saturday-Sunday gap is not reported as missing."""
+        store = PriceHistoryStore()
+        store.add_bars("VOD.LSE", [], "2025-11-03", "2025-11-07")
+        store.add_bars("VOD.LSE", [], "2025-11-10", "2025-11-10")
+
+        assert store.missing_ranges("VOD.LSE", "2025-11-03", "2025-11-10") == []
+
+    def test_history_persists_across_instances(self, tmp_path):
+        """Test that bars and coverage survive reopening the database."""
+        path = tmp_path / "prices.sqlite3"
+        store = PriceHistoryStore(path)
+        store.add_bars("VOD.LSE", [_bar("2025-11-03", 1.5), _bar("2025-11-04", 1.6)], "2025-11-03", "2025-11-04")
+        store.close()
+
+        reopened = PriceHistoryStore(path)
+        bars = reopened.get_bars("VOD.LSE", "2025-11-01", "2025-11-30")
+        assert [b["close"] for b in bars] == [1.5, 1.6]
+        assert reopened.missing_ranges("VOD.LSE", "2025-11-03", "2025-11-04") == []
+
+    def test_unpublished_days_not_recorded_as_covered(self):
+        """Test an empty or short response up to today leaves recent days to refetch."""
+        today = datetime.now(timezone.utc).date()
+
+        def day(days_ago: int) -> str:
+            return (today - timedelta(days=days_ago)).isoformat()
+
+        store = PriceHistoryStore()
+
+        # Empty response: only up to the day before yesterday is settled
+        store.add_bars("VOD.LSE", [], day(10), coverage_end(day(0), []))
+        assert store.get_coverage("VOD.LSE") == [(day(10), day(2))]
+
+        # Short response: covered up to the last bar returned
+        bars = [_bar(day(1), 1.5)]
+        store.add_bars("BP.LSE", bars, day(10), coverage_end(day(0), bars))
+        assert store.get_coverage("BP.LSE") == [(day(10), day(1))]
+
+        # Nothing settled in the window: nothing recorded
+        store.add_bars("LLOY.LSE", [], day(1), coverage_end(day(0), []))
+        assert store.get_coverage("LLOY.LSE") == []
+
+        # Older windows are covered as requested
+        assert coverage_end(day(5), []) == day(5)
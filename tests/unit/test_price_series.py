@@ -0,0 +1,69 @@
+"""
+Unit tests for the columnar PriceSeries representation.
+"""
+
+import json
+
+import pytest
+
+from backend.app.core.database import json_serializer
+from backend.app.data_sources.price_series import PriceSeries
+
+
+BARS = [
+    {"date": "2025-11-03", "open": 100.0, "high": 102.0, "low": 99.0,
+     "close": 100.0, "adjusted_close": 100.0, "volume": 1000},
+    {"date": "2025-11-04", "open": 100.0, "high": 106.0, "low": 100.0,
+     "close": 105.0, "adjusted_close": 105.0, "volume": 3000},
+    {"date": "2025-11-05", "open": 105.0, "high": 111.0, "low": 104.0,
+     "close": 110.0, "adjusted_close": None, "volume": 2000},
+]
+
+
+class TestPriceSeries:
+    """Test PriceSeries construction, metrics and JSON conversion."""
+
+    def test_metrics_are_vectorised_over_columns(self):
+        """Test derived metrics match the per-bar calculations."""
+        series = PriceSeries.from_bars(BARS)
+
+        assert len(series) == 3
+        assert series.latest_price == 110.0
+        assert series.price_change_pct() == pytest.approx(10.0)
+        assert series.average_volume() == 2000.0
+
+    def test_empty_series_metrics(self):
+        """Test metrics on an empty series are neutral."""
+        series = PriceSeries.empty()
+
+        assert len(series) == 0
+        assert series.price_change_pct() == 0
+        assert series.average_volume() == 0
+
+    def test_index_returns_bar_dict(self):
+        """Test integer indexing returns a bar dictionary."""
+        series = PriceSeries.from_bars(BARS)
+
+        assert series[0] == BARS[0]
+        assert series[-1]["adjusted_close"] is None
+        assert [bar["date"] for bar in series] == ["2025-11-03", "2025-11-04", "2025-11-05"]
+
+    def test_window_selects_inclusive_range(self):
+        """Test window() slices by date with inclusive bounds."""
+        series = PriceSeries.from_bars(BARS)
+
+        window = series.window("2025-11-04", "2025-11-30")
+        assert len(window) == 2
+        assert window[0]["date"] == "2025-11-04"
+        assert window.price_change_pct() == pytest.approx(110 / 105 * 100 - 100)
+
+    def test_mismatched_columns_rejected(self):
+        """Test that columns of different lengths raise ValueError."""
+        with pytest.raises(ValueError, match="length"):
+            PriceSeries(["2025-11-03"], [1.0], [1.0], [1.0], [1.0, 2.0], [1.0], [10])
+
+    def test_json_conversion_at_persistence_boundary(self):
+        """Test the database JSON serializer converts PriceSeries to bar records."""
+        data = {"prices": PriceSeries.from_bars(BARS), "data_points": 3}
+
+        assert json.loads(json_serializer(data)) == {"prices": BARS, "data_points": 3}
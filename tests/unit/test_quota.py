@@ -0,0 +1,56 @@
+"""
+Unit tests for value-based quota allocation.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from backend.app.data_sources.quota import TickerPriorities, allocate_quota
+
+
+class TestAllocateQuota:
+    """Test allocate_quota ranking and budgeting."""
+
+    def test_without_priorities_keeps_request_order(self):
+        """Test that no priorities means plain truncation (deduplicated)."""
+        selected, skipped = allocate_quota(["VOD.L", "BP.L", "VOD.L", "HSBA.L"], 2)
+
+        assert selected == ["VOD.L", "BP.L"]
+        assert skipped == ["HSBA.L"]
+
+    def test_held_then_watchlist_then_stalest(self):
+        """Test tier order, with staleness (never refreshed first) inside a tier."""
+        now = datetime.now(timezone.utc)
+        priorities = TickerPriorities(
+            held=frozenset({"LLOY.L"}),
+            watchlist=frozenset({"BARC.L", "TSCO.L"}),
+            last_updated={
+                "BARC.L": now,
+                "TSCO.L": now - timedelta(days=3),
+                "VOD.L": now - timedelta(days=1),
+                "BP.L": now - timedelta(days=5),
+            }
+        )
+        tickers = ["VOD.L", "BP.L", "HSBA.L", "BARC.L", "TSCO.L", "LLOY.L"]
+
+        selected, skipped = allocate_quota(tickers, 5, priorities)
+
+        assert selected == ["LLOY.L", "TSCO.L", "BARC.L", "HSBA.L", "BP.L"]
+        assert skipped == ["VOD.L"]
+
+    def test_naive_timestamps_treated_as_utc(self):
+        """Test that naive and aware timestamps compare without error."""
+        priorities = TickerPriorities(
+            last_updated={
+                "VOD.L": datetime(2025, 1, 2),
+                "BP.L": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        )
+
+        selected, _ = allocate_quota(["VOD.L", "BP.L"], 1, priorities)
+
+        assert selected == ["BP.L"]
+
+    def test_exhausted_budget_selects_nothing(self):
+        """Test that a zero or negative budget skips every ticker."""
+        assert allocate_quota(["VOD.L"], 0) == ([], ["VOD.L"])
+        assert allocate_quota(["VOD.L"], -1) == ([], ["VOD.L"])
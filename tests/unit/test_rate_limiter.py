@@ -0,0 +1,99 @@
+"""
+Unit tests for the shared, persisted token-bucket rate limiter.
+"""
+
+import time
+
+import pytest
+
+from backend.app.data_sources.rate_limiter import (
+    RateLimiter,
+    RateLimitPolicy,
+    get_rate_limiter,
+)
+
+
+class TestRateLimiter:
+    """Test RateLimiter bucket, quota and persistence behaviour."""
+
+    def test_burst_then_empty(self):
+        """Test that burst calls are available immediately, then none."""
+        limiter = RateLimiter("test", RateLimitPolicy(calls_per_second=1, burst=3))
+
+        assert limiter.available_now() == 3
+        assert all(limiter.try_acquire() for _ in range(3))
+        assert limiter.try_acquire() is False
+        assert limiter.available_now() == 0
+
+    def test_daily_quota_exhausted(self):
+        """Test that the daily quota stops acquisition and reports remaining."""
+        limiter = RateLimiter("test", RateLimitPolicy(daily_quota=2))
+
+        assert limiter.try_acquire()
+        assert limiter.daily_remaining() == 1
+        assert limiter.try_acquire()
+        assert limiter.try_acquire() is False
+        assert limiter.daily_remaining() == 0
+        assert limiter.available_now() == 0
+
+    def test_cost_checked_against_daily_quota(self):
+        """Test that a call billed above one unit needs its full cost in quota."""
+        limiter = RateLimiter("test", RateLimitPolicy(daily_quota=150, calls_per_second=1, burst=1))
+
+        assert limiter.try_acquire(cost=100)
+        assert limiter.daily_remaining() == 50
+        assert limiter.try_acquire(cost=100) is False
+        assert limiter.daily_remaining() == 50
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """Test that acquire smooths calls to the per-second rate."""
+        limiter = RateLimiter("test", RateLimitPolicy(calls_per_second=20, burst=1))
+
+        start = time.monotonic()
+        for _ in range(3):
+            assert await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # First call uses the burst token, the next two wait ~50ms each
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_acquire_fails_fast_when_quota_spent(self):
+        """Test that acquire does not wait when waiting cannot help."""
+        limiter = RateLimiter("test", RateLimitPolicy(daily_quota=1, calls_per_second=1, burst=1))
+
+        assert await limiter.acquire()
+        assert await limiter.acquire() is False
+        assert await limiter.acquire(max_wait=0.01) is False
+
+    def test_budget_shared_through_store(self, tmp_path):
+        """Test that limiters on the same store file share one budget."""
+        path = tmp_path / "rate_limits.sqlite3"
+        policy = RateLimitPolicy(daily_quota=3)
+        first = RateLimiter("eodhd", policy, path)
+        second = RateLimiter("eodhd", policy, path)
+        other = RateLimiter("alpha_vantage", policy, path)
+
+        first.try_acquire()
+        second.record(2)
+
+        assert first.daily_remaining() == 0
+        assert second.try_acquire() is False
+        assert other.daily_remaining() == 3
+
+    def test_get_rate_limiter_shares_instance(self, tmp_path):
+        """Test that providers in one process get the same limiter."""
+        path = tmp_path / "rate_limits.sqlite3"
+        policy = RateLimitPolicy(daily_quota=10)
+
+        assert get_rate_limiter("eodhd", policy, path) is get_rate_limiter("eodhd", policy, path)
+
+    def test_policy_from_config(self):
+        """Test building a policy from a provider config section."""
+        policy = RateLimitPolicy.from_config(
+            {"rate_limit": 100000, "rate_limit_per_second": 16, "rate_limit_burst": 50}
+        )
+        assert policy == RateLimitPolicy(daily_quota=100000, calls_per_second=16, burst=50)
+
+        assert RateLimitPolicy.from_config({"rate_limit_per_second": 2.5}).burst == 3
@@ -0,0 +1,138 @@
+"""
+Unit tests for the two-tier response cache.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.data_sources.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache tiers, TTL, eviction and counters."""
+
+    def test_set_and_get_counts_hits_and_misses(self):
+        """Test basic round trip and hit/miss counters."""
+        cache = ResponseCache("test")
+        cache.set("a", {"value": 1})
+
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("b") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_per_entry_ttl(self):
+        """Test that entries expire on their own TTL."""
+        cache = ResponseCache("test", default_ttl_seconds=3600)
+        cache.set("fresh", 1)
+        cache.set("short", 2, ttl_seconds=60, stored_at=time.time() - 120)
+
+        assert cache.get("fresh") == 1
+        assert cache.get("short") is None
+        assert "short" not in cache
+        assert cache.stats()["expirations"] == 1
+
+    def test_memory_tier_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache("test", max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.stats()["memory_evictions"] == 1
+
+    def test_memory_tier_size_budget(self):
+        """Test that the memory tier stays within its byte budget."""
+        cache = ResponseCache("test", max_memory_bytes=2000)
+        for i in range(10):
+            cache.set(f"key{i}", "x" * 500)
+
+        stats = cache.stats()
+        assert stats["memory_bytes"] <= 2000
+        assert stats["memory_evictions"] > 0
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that a new cache on the same file serves stored entries."""
+        path = tmp_path / "response_cache.sqlite3"
+        ResponseCache("eodhd", default_ttl_seconds=3600, path=path).set("VOD.LSE", {"pe": 12.5})
+
+        restarted = ResponseCache("eodhd", default_ttl_seconds=3600, path=path)
+        assert restarted.get("VOD.LSE") == {"pe": 12.5}
+        assert restarted.stats()["disk_hits"] == 1
+
+        # Namespaces are isolated within one file
+        assert ResponseCache("failover", path=path).get("VOD.LSE") is None
+
+    def test_disk_hit_promoted_to_memory(self, tmp_path):
+        """Test that entries evicted from memory are served from disk."""
+        cache = ResponseCache("test", max_entries=1, path=tmp_path / "cache.sqlite3")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.get("a") == 1
+        assert cache.get("a") == 1
+        stats = cache.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_disk_tier_size_budget(self, tmp_path):
+        """Test that the disk tier evicts LRU entries over its byte budget."""
+        cache = ResponseCache("test", path=tmp_path / "cache.sqlite3", max_disk_bytes=3000)
+        for i in range(10):
+            cache.set(f"key{i}", "x" * 500)
+
+        stats = cache.stats()
+        assert stats["disk_bytes"] <= 3000
+        assert stats["disk_evictions"] > 0
+        assert cache.get("key9") == "x" * 500
+
+    def test_memory_only_cache_does_not_serialize(self):
+        """Test that a memory-only cache without a byte budget never pickles."""
+        cache = ResponseCache("test")
+        value = {"pe": 12.5}
+
+        with patch("backend.app.data_sources.response_cache.pickle.dumps") as mock_dumps:
+            cache.set("a", value)
+            assert cache.get("a") is value
+
+        mock_dumps.assert_not_called()
+
+    def test_disk_access_times_written_in_batches(self, tmp_path):
+        """Test that disk hits queue access times instead of committing each one."""
+        cache = ResponseCache("test", max_entries=1, path=tmp_path / "cache.sqlite3")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.get("a")  # Disk hit
+        assert set(cache._pending_touches) == {"a"}
+
+        cache.close()
+        assert cache._pending_touches == {}
+
+    def test_disk_size_kept_as_running_total(self, tmp_path):
+        """Test the running disk size matches the stored sizes after replace and delete."""
+        cache = ResponseCache("test", path=tmp_path / "cache.sqlite3")
+        cache.set("a", "x" * 100)
+        cache.set("b", "x" * 200)
+        cache.set("a", "x" * 50)
+        cache.delete("b")
+
+        (stored,) = cache._conn.execute("SELECT SUM(size) FROM response_cache").fetchone()
+        assert cache.stats()["disk_bytes"] == stored
+
+        restarted = ResponseCache("test", path=tmp_path / "cache.sqlite3")
+        assert restarted.stats()["disk_bytes"] == stored
+
+    def test_invalid_max_entries(self):
+        """Test that a zero-sized memory tier is rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache("test", max_entries=0)
@@ -0,0 +1,131 @@
+"""
+Unit tests for the retry engine, retry budget and Retry-After parsing.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from backend.app.data_sources.retry import (
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class TransientError(Exception):
+    """Retryable test error."""
+
+    def __init__(self, retry_after=None):
+        super().__init__("transient")
+        self.retry_after = retry_after
+
+
+def _engine(max_attempts=3, budget=None, **policy) -> RetryEngine:
+    return RetryEngine(
+        "test",
+        RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.005, **policy),
+        budget=budget or RetryBudget()
+    )
+
+
+class TestRetryEngine:
+    """Test RetryEngine backoff, budget and counters."""
+
+    @pytest.mark.asyncio
+    async def test_run_retries_until_success(self):
+        """Test that retryable errors are retried and counted."""
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise TransientError()
+            return "ok"
+
+        engine = _engine()
+        assert await engine.run(flaky, lambda e: isinstance(e, TransientError)) == "ok"
+
+        stats = engine.stats()
+        assert stats["operations"] == 1
+        assert stats["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_gives_up_after_max_attempts(self):
+        """Test that the last error is raised once attempts are exhausted."""
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            raise TransientError()
+
+        engine = _engine(max_attempts=2)
+        with pytest.raises(TransientError):
+            await engine.run(failing, lambda e: True)
+
+        assert calls == 2
+        assert engine.stats()["attempts_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_not_retried(self):
+        """Test that non-retryable errors are raised immediately."""
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await _engine().run(failing, lambda e: isinstance(e, TransientError))
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_shared_across_engines(self):
+        """Test that an exhausted shared budget stops retries everywhere."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=1)
+        first = _engine(budget=budget)
+        second = _engine(budget=budget)
+
+        assert await first.sequence().backoff() is True
+        assert await second.sequence().backoff() is False
+        assert second.stats()["budget_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_gives_up(self):
+        """Test that hints beyond max_retry_after are not waited for."""
+        engine = _engine(max_retry_after=1.0)
+
+        assert await engine.sequence().backoff(retry_after=3600) is False
+        assert engine.stats()["retry_after_too_long"] == 1
+
+    def test_decorrelated_jitter_bounds(self):
+        """Test that delays stay within base and cap, above Retry-After."""
+        engine = RetryEngine("test", RetryPolicy(base_delay=1.0, max_delay=9.0), budget=RetryBudget())
+        previous = 1.0
+        for _ in range(100):
+            delay = engine.next_delay(previous)
+            assert 1.0 <= delay <= min(9.0, previous * 3)
+            previous = delay
+
+        assert engine.next_delay(1.0, retry_after=20.0) == 20.0
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,142 @@
+"""
+Unit tests for vectorised universe scoring.
+"""
+
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from backend.app.data_sources.base import Signal
+from backend.app.data_sources.scoring import (
+    ScoringThresholds,
+    UniverseMetrics,
+    score_signals,
+    score_universe,
+    sector_percentile,
+)
+
+
+def make_row(ticker, sector="Energy", pe=None, roe=None, change=None, estimates=None):
+    """Build one per-ticker row in the provider's view format."""
+    return {
+        "ticker": ticker,
+        "fundamentals": {
+            "general": {"Sector": sector},
+            "key_metrics": {"pe_ratio": pe, "roe": roe}
+        },
+        "prices": {"price_change_30d": change} if change is not None else {},
+        "estimates": estimates or {}
+    }
+
+
+class TestSectorPercentile:
+    """Test cross-sectional percentiles."""
+
+    def test_percentiles_within_groups(self):
+        """Test each value is ranked only against its own group."""
+        values = np.array([10.0, 20.0, 30.0, 5.0, 50.0])
+        groups = np.array(["A", "A", "A", "B", "B"])
+
+        result = sector_percentile(values, groups)
+
+        np.testing.assert_allclose(result, [100 / 6, 50.0, 500 / 6, 25.0, 75.0])
+
+    def test_ties_and_missing_values(self):
+        """Test tied values share a percentile and NaN stays unranked."""
+        result = sector_percentile(np.array([1.0, 1.0, np.nan, 3.0]))
+
+        assert result[0] == result[1] == pytest.approx(100 / 3)
+        assert np.isnan(result[2])
+        assert result[3] == pytest.approx(500 / 6)
+
+    def test_all_missing(self):
+        """Test a metric with no values yields all NaN."""
+        assert np.isnan(sector_percentile(np.array([np.nan, np.nan]))).all()
+
+
+class TestScoreUniverse:
+    """Test batch scoring and re-scoring."""
+
+    def test_scores_follow_thresholds(self):
+        """Test absolute thresholds and neutral scores for missing data."""
+        metrics = UniverseMetrics.from_rows([
+            make_row("CHEAP", pe=10, roe=20, change=15),
+            make_row("DEAR", pe=50, roe=5, change=-15),
+            make_row("EMPTY")
+        ])
+
+        scores = score_universe(metrics)
+
+        assert scores.fundamental.tolist() == [75, 50, 50]
+        assert scores.price.tolist() == [65, 35, 50]
+        assert scores.analyst.tolist() == [50, 50, 50]
+
+    def test_analyst_consensus_and_strength(self):
+        """Test consensus and strong-majority adjustments."""
+        metrics = UniverseMetrics.from_rows([
+            make_row("BULL", estimates={"total_analysts": 10, "consensus": "BULLISH", "strong_buy": 7}),
+            make_row("BEAR", estimates={"total_analysts": 10, "consensus": "BEARISH", "strong_sell": 6}),
+            make_row("NONE", estimates={"total_analysts": 0, "consensus": "NO_COVERAGE"})
+        ])
+
+        assert score_universe(metrics).analyst.tolist() == [85, 15, 50]
+
+    def test_rescore_with_new_thresholds(self):
+        """Test the same metrics can be re-scored without rebuilding them."""
+        metrics = UniverseMetrics.from_rows([make_row("VOD", pe=18)])
+
+        assert score_universe(metrics).fundamental[0] == 55
+        assert score_universe(metrics, ScoringThresholds(pe_undervalued=20)).fundamental[0] == 65
+
+    def test_sector_relative_pe(self):
+        """Test P/E scored by percentile within sector instead of absolute level."""
+        metrics = UniverseMetrics.from_rows([
+            make_row("BANK1", sector="Financials", pe=8),
+            make_row("BANK2", sector="Financials", pe=12),
+            make_row("BANK3", sector="Financials", pe=20),
+            make_row("TECH1", sector="Technology", pe=30),
+            make_row("TECH2", sector="Technology", pe=60)
+        ])
+
+        scores = score_universe(metrics, ScoringThresholds(pe_sector_relative=True))
+
+        # TECH1 is cheap for its sector despite an absolute P/E of 30
+        assert scores.fundamental.tolist() == [65, 55, 50, 65, 50]
+        assert scores.row("TECH1")["percentiles"]["pe_ratio_sector"] == 25.0
+
+    def test_large_universe_is_fast(self):
+        """Test scoring a 600-ticker universe is a millisecond-scale batch."""
+        rng = np.random.default_rng(0)
+        metrics = UniverseMetrics.from_rows([
+            make_row(f"T{i}", sector=f"S{i % 11}", pe=float(pe), roe=float(roe), change=float(change))
+            for i, (pe, roe, change) in enumerate(rng.normal([20, 12, 0], [8, 6, 10], size=(600, 3)))
+        ])
+
+        started = time.perf_counter()
+        scores = score_universe(metrics)
+        elapsed = time.perf_counter() - started
+
+        assert len(scores.fundamental) == 600
+        assert elapsed < 0.1
+
+
+class TestScoreSignals:
+    """Test the signal scoring pipeline step."""
+
+    def test_scores_signals_without_mutating_data(self):
+        """Test signals are rescored and get percentiles in new data dicts."""
+        timestamp = datetime.now(timezone.utc)
+        fundamentals = {"general": {"Sector": "Energy"}, "key_metrics": {"pe_ratio": 10, "roe": 20}}
+        signals = [
+            Signal("BP.L", "FUNDAMENTAL_DATA", 50, 0.9, fundamentals, timestamp, "eodhd_fundamental"),
+            Signal("BP.L", "PRICE_DATA", 50, 0.95, {"price_change_30d": 12}, timestamp, "eodhd_fundamental"),
+            Signal("BP.L", "COMPANY_PROFILE", 50, 0.95, {"name": "BP"}, timestamp, "eodhd_fundamental")
+        ]
+
+        score_signals(signals)
+
+        assert [signal.score for signal in signals] == [75, 65, 50]
+        assert signals[0].data["percentiles"]["pe_ratio_sector"] == 50.0
+        assert "percentiles" not in fundamentals
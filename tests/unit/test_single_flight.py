@@ -0,0 +1,91 @@
+"""
+Unit tests for single-flight request deduplication.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.app.data_sources.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight sharing, error propagation and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Test that callers for the same key await one fetch."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        flights = SingleFlight()
+        results = await asyncio.gather(*[flights.do("VOD.LSE", fetch) for _ in range(5)])
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flights.stats() == {"calls": 5, "shared": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_fetch_independently(self):
+        """Test that distinct keys are not deduplicated."""
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return True
+
+        flights = SingleFlight()
+        await asyncio.gather(flights.do("VOD.LSE", fetch), flights.do("BP.LSE", fetch))
+
+        assert flights.stats()["shared"] == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_fetch_is_not_reused(self):
+        """Test that a new fetch starts once the previous one finished."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        flights = SingleFlight()
+        assert await flights.do("VOD.LSE", fetch) == 1
+        assert await flights.do("VOD.LSE", fetch) == 2
+        assert not flights.in_flight("VOD.LSE")
+
+    @pytest.mark.asyncio
+    async def test_error_delivered_to_all_waiters(self):
+        """Test that every waiter receives the shared fetch's exception."""
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("refused")
+
+        flights = SingleFlight()
+        results = await asyncio.gather(
+            *[flights.do("VOD.LSE", fetch) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert not flights.in_flight("VOD.LSE")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_fetch(self):
+        """Test that cancelling the first caller leaves the fetch running for others."""
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "payload"
+
+        flights = SingleFlight()
+        first = asyncio.ensure_future(flights.do("VOD.LSE", fetch))
+        second = asyncio.ensure_future(flights.do("VOD.LSE", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "payload"
+        with pytest.raises(asyncio.CancelledError):
+            await first
@@ -0,0 +1,129 @@
+"""
+Unit tests for the exchange universe sync (stocks table).
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.data_service import StockService, diff_universe, symbols_to_universe
+
+
+def test_symbols_to_universe_filters_and_formats():
+    """Test symbol records become stocks-table tickers, common stock only."""
+    symbols = [
+        {"Code": "VOD", "Name": "Vodafone Group PLC", "Type": "Common Stock"},
+        {"Code": "ISF", "Name": "iShares Core FTSE 100", "Type": "ETF"},
+        {"Code": "LONGCODE123", "Name": "Too long", "Type": "Common Stock"},
+        {"Code": "BP", "Name": None, "Type": "Common Stock"},
+    ]
+
+    assert symbols_to_universe(symbols) == {"VOD.L": "Vodafone Group PLC", "BP.L": "BP"}
+
+
+def test_diff_universe():
+    """Test inserts, renames, relistings and delistings are classified by ticker."""
+    existing = {
+        "VOD.L": ("Vodafone Group PLC", True),
+        "BP.L": ("BP p.l.c.", True),
+        "OLD.L": ("Delisted PLC", True),
+        "BACK.L": ("Relisted PLC", False),
+        "GONE.L": ("Long Gone PLC", False),
+    }
+    listed = {
+        "VOD.L": "Vodafone Group PLC",
+        "BP.L": "BP PLC",
+        "BACK.L": "Relisted PLC",
+        "NEW.L": "New Listing PLC",
+    }
+
+    diff = diff_universe(existing, listed)
+
+    assert diff.inserts == {"NEW.L": "New Listing PLC"}
+    assert diff.updates == {"BP.L": "BP PLC", "BACK.L": "Relisted PLC"}
+    assert diff.deactivations == {"OLD.L": "Delisted PLC"}
+    assert diff.summary() == {"inserted": 1, "updated": 2, "deactivated": 1, "unchanged": 1}
+    assert {row["ticker"]: row["is_active"] for row in diff.upsert_rows()} == {
+        "NEW.L": True, "BP.L": True, "BACK.L": True, "OLD.L": False
+    }
+
+
+def test_diff_universe_deactivates_only_synced_exchange():
+    """Test rows of other exchanges and retained tickers are never deactivated."""
+    existing = {
+        "OLD.L": ("Delisted PLC", True),
+        "AAPL.US": ("Apple Inc", True),
+        "ISF.L": ("iShares Core FTSE 100", True),
+        "HELD.L": ("Held PLC", True),
+    }
+
+    diff = diff_universe(
+        existing, {"VOD.L": "Vodafone Group PLC"}, suffix=".L", retain={"ISF.L", "HELD.L"}
+    )
+
+    assert diff.deactivations == {"OLD.L": "Delisted PLC"}
+
+
+@pytest.mark.asyncio
+async def test_sync_exchange_universe_leaves_out_of_scope_rows():
+    """Test other security types, other exchanges and held stocks stay active."""
+    provider = Mock()
+    provider.fetch_exchange_symbols = AsyncMock(return_value=[
+        {"Code": "VOD", "Name": "Vodafone Group PLC", "Type": "Common Stock"},
+        {"Code": "ISF", "Name": "iShares Core FTSE 100", "Type": "ETF"},
+    ])
+    existing = Mock()
+    existing.all.return_value = [
+        ("VOD.L", "Vodafone Group PLC", True, False),
+        ("ISF.L", "iShares Core FTSE 100", True, False),
+        ("AAPL.US", "Apple Inc", True, False),
+        ("HELD.L", "Held PLC", True, True),
+        ("OLD.L", "Delisted PLC", True, False),
+    ]
+    db = AsyncMock()
+    db.execute.side_effect = [existing, Mock()]
+
+    summary = await StockService.sync_exchange_universe(db, provider)
+
+    assert summary == {"inserted": 0, "updated": 0, "deactivated": 1, "unchanged": 1}
+    upsert = db.execute.await_args_list[1].args[0]
+    params = upsert.compile(dialect=postgresql.dialect()).params
+    assert [value for key, value in params.items() if key.startswith("ticker")] == ["OLD.L"]
+
+
+@pytest.mark.asyncio
+async def test_sync_universe_single_upsert_and_commit():
+    """Test the sync reads once, writes one upsert statement and commits once."""
+    existing = Mock()
+    existing.all.return_value = [
+        ("VOD.L", "Vodafone Group PLC", True, False), ("OLD.L", "Delisted PLC", True, False)
+    ]
+    db = AsyncMock()
+    db.execute.side_effect = [existing, Mock()]
+
+    summary = await StockService.sync_universe(
+        db, {"VOD.L": "Vodafone Group PLC", "NEW.L": "New Listing PLC"}
+    )
+
+    assert summary == {"inserted": 1, "updated": 0, "deactivated": 1, "unchanged": 1}
+    assert db.execute.await_count == 2
+    db.commit.assert_awaited_once()
+
+    upsert = db.execute.await_args_list[1].args[0]
+    sql = str(upsert.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (ticker) DO UPDATE" in sql
+    assert "is_active = excluded.is_active" in sql
+
+
+@pytest.mark.asyncio
+async def test_sync_exchange_universe_ignores_empty_download():
+    """Test a failed symbol download never deactivates the universe."""
+    provider = Mock()
+    provider.fetch_exchange_symbols = AsyncMock(return_value=[])
+    db = AsyncMock()
+
+    summary = await StockService.sync_exchange_universe(db, provider)
+
+    assert summary["deactivated"] == 0
+    db.execute.assert_not_awaited()